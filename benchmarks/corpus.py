@@ -0,0 +1,68 @@
+"""Synthetic ticket corpus for the benchmarks: N tickets, each with M documents and K change-log lines."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+from tkts.models import Ticket
+from tkts.storage import TicketStore
+
+
+STATUSES = ["todo", "in-progress", "in-review", "blocked", "done"]
+TAGS = ["area:cli", "area:mcp", "area:tui", "area:trello", "feature:search", "bug", "perf", "docs"]
+WORDS = (
+    "ticket store index parser backend board card list label member query filter sort page cursor "
+    "cache watch journal lock header body document change log status assignee subject update"
+).split()
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    tickets: int = 500
+    documents: int = 2
+    changelog: int = 20
+    seed: int = 0
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def make_ticket(rng: random.Random, idx: int, spec: CorpusSpec) -> Ticket:
+    ticket_id = f"{rng.getrandbits(128):032x}"
+    day = 1 + idx % 28
+    created = f"2026-01-{day:02d}T{idx % 24:02d}:00:00+00:00"
+    body = "\n".join(_sentence(rng, 12) for _ in range(8)) + "\n"
+    documents = [body]
+    documents.extend("\n".join(_sentence(rng, 10) for _ in range(6)) + "\n" for _ in range(max(0, spec.documents - 1)))
+    if spec.changelog:
+        lines = [f"{created} status: todo -> {rng.choice(STATUSES)}" for _ in range(spec.changelog)]
+        documents.append("\n".join(["Change Log:", *lines]) + "\n")
+    return Ticket(
+        ticket_id=ticket_id,
+        subject=_sentence(rng, 6),
+        body=body,
+        assignee=rng.choice(["alice", "bob", "carol", None]),
+        tags=rng.sample(TAGS, k=rng.randint(0, 3)),
+        status=rng.choice(STATUSES),
+        created_at=created,
+        updated_at=created,
+        documents=documents,
+    )
+
+
+def make_tickets(spec: CorpusSpec) -> List[Ticket]:
+    rng = random.Random(spec.seed)
+    return [make_ticket(rng, idx, spec) for idx in range(spec.tickets)]
+
+
+def generate_corpus(root: Path, spec: CorpusSpec) -> List[Ticket]:
+    """Write ``spec.tickets`` tickets into a fresh store at ``root`` and return them."""
+    store = TicketStore(root=root)
+    tickets = make_tickets(spec)
+    for ticket in tickets:
+        store.save_ticket(ticket)
+    return tickets
@@ -0,0 +1,212 @@
+"""In-process fake of the slice of the Trello REST API that tkts uses.
+
+``connect_delay`` is slept once per accepted TCP connection to stand in for the TCP + TLS
+handshake that the real API costs; ``request_delay`` is slept on every request.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+BOARD_ID = "board123"
+LISTS = [
+    {"id": "l-todo", "name": "todo"},
+    {"id": "l-progress", "name": "in-progress"},
+    {"id": "l-review", "name": "in-review"},
+    {"id": "l-blocked", "name": "blocked"},
+    {"id": "l-done", "name": "done"},
+]
+
+
+class FakeTrello:
+    def __init__(self, cards: int = 100, *, connect_delay: float = 0.0, request_delay: float = 0.0) -> None:
+        self.connect_delay = connect_delay
+        self.request_delay = request_delay
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.cards: Dict[str, Dict[str, Any]] = {}
+        self.actions: List[Dict[str, Any]] = []
+        for idx in range(cards):
+            self.add_card(name=f"Card {idx}", desc=f"Description {idx}\n" * 5, list_id=LISTS[idx % 4]["id"])
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def add_card(self, *, name: str, desc: str, list_id: str) -> Dict[str, Any]:
+        idx = len(self.cards)
+        card = {
+            "id": f"card{idx:06d}",
+            "shortLink": f"s{idx:07d}",
+            "name": name,
+            "desc": desc,
+            "idList": list_id,
+            "labels": [],
+            "idMembers": [],
+            "members": [],
+            "dateLastActivity": "2024-01-01T00:00:00.000Z",
+            "url": f"https://trello.test/c/s{idx:07d}",
+        }
+        self.cards[card["id"]] = card
+        self._record("createCard", card)
+        return card
+
+    def _record(self, kind: str, card: Dict[str, Any], **extra: Any) -> None:
+        self.actions.insert(
+            0,
+            {
+                "id": f"action{len(self.actions):08d}",
+                "type": kind,
+                "date": "2024-01-01T00:00:00.000Z",
+                "data": {"card": {"id": card["id"], "shortLink": card["shortLink"]}, **extra},
+            },
+        )
+
+    def find_card(self, ref: str) -> Optional[Dict[str, Any]]:
+        card = self.cards.get(ref)
+        if card is not None:
+            return card
+        return next((card for card in self.cards.values() if card["shortLink"] == ref), None)
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/1"
+
+    def start(self) -> "FakeTrello":
+        fake = self
+
+        class Handler(_Handler):
+            trello = fake
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeTrello":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    trello: FakeTrello
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body go out as separate writes; without this, Nagle + delayed ACK adds ~40 ms.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.trello.lock:
+            self.trello.connections += 1
+        if self.trello.connect_delay:
+            time.sleep(self.trello.connect_delay)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return None
+
+    def _params(self) -> Tuple[str, Dict[str, str]]:
+        parts = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            params.update({key: str(value) for key, value in body.items()})
+        return parts.path, params
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str) -> None:
+        trello = self.trello
+        with trello.lock:
+            trello.requests += 1
+        if trello.request_delay:
+            time.sleep(trello.request_delay)
+        path, params = self._params()
+        segments = [segment for segment in path.split("/") if segment][1:]  # drop the API version
+        with trello.lock:
+            status, payload = self._route(method, segments, params)
+        self._send(status, payload)
+
+    def _route(self, method: str, segments: List[str], params: Dict[str, str]) -> Tuple[int, Any]:
+        trello = self.trello
+        if segments == ["batch"] and method == "GET":
+            results: List[Any] = []
+            for route in params.get("urls", "").split(","):
+                # Each route is still encoded once (the transport encoding is already gone): decode it exactly once.
+                route_path, _, query = route.partition("?")
+                sub_params = {key: values[-1] for key, values in parse_qs(query).items()}
+                segments = [unquote(segment) for segment in route_path.split("/") if segment]
+                status, payload = self._route("GET", segments, sub_params)
+                results.append({str(status): payload} if status < 400 else {"statusCode": status, **payload})
+            return 200, results
+        if segments[:1] == ["boards"] and len(segments) == 3:
+            kind = segments[2]
+            if kind == "lists":
+                return 200, LISTS
+            if kind in {"labels", "members"}:
+                return 200, []
+            if kind == "cards":
+                return 200, [card for card in trello.cards.values() if card["idList"] != "l-done"]
+            if kind == "actions":
+                since = params.get("since")
+                limit = int(params.get("limit") or 50)
+                actions: List[Dict[str, Any]] = []
+                for action in trello.actions:
+                    if since and action["id"] <= since:
+                        break
+                    actions.append(action)
+                return 200, actions[:limit]
+        if segments[:1] == ["lists"] and len(segments) == 3:
+            return 200, [card for card in trello.cards.values() if card["idList"] == segments[1]]
+        if segments == ["cards"] and method == "POST":
+            return 200, trello.add_card(name=params.get("name", ""), desc=params.get("desc", ""), list_id=params["idList"])
+        if segments[:1] == ["cards"] and len(segments) >= 2:
+            card = trello.find_card(segments[1])
+            if card is None:
+                return 404, {"message": "not found"}
+            if len(segments) == 2 and method == "GET":
+                return 200, card
+            if len(segments) == 2 and method == "PUT":
+                for field, key in (("name", "name"), ("desc", "desc"), ("idList", "idList")):
+                    if field in params:
+                        card[key] = params[field]
+                trello._record("updateCard", card)
+                return 200, card
+            if segments[2:] == ["actions", "comments"] and method == "POST":
+                trello._record("commentCard", card, text=params.get("text", ""))
+                return 200, {"id": trello.actions[0]["id"]}
+            if segments[2:] == ["actions"]:
+                return 200, [action for action in trello.actions if action["data"]["card"]["id"] == card["id"]]
+        return 404, {"message": "unknown route"}
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
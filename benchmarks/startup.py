@@ -0,0 +1,126 @@
+"""CLI startup cost: ``python -X importtime`` on the tkts verbs agents call most, against a budget.
+
+Each scenario runs in a fresh interpreter against a throwaway store. Its import time is the sum of the
+top-level cumulative times Python reports on stderr, minus the same sum for a bare ``python -c pass``
+(site, encodings, ...), so the budget covers only what tkts itself pulls in.
+
+    python -m benchmarks.startup --budget-ms 120 --output startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from benchmarks.corpus import CorpusSpec, generate_corpus
+
+
+DEFAULT_BUDGET_MS = 120.0
+# Reported per scenario: only the verbs that need them (``show`` parses a ticket) should load these.
+HEAVY_MODULES = ("email.parser", "email.policy", "http.client", "ssl", "sqlite3", "curses", "mcp")
+SCENARIOS: Dict[str, List[str]] = {
+    "import": ["-c", "import tkts.__main__"],
+    "new": ["-m", "tkts", "new", "Startup benchmark", "--tags", "perf"],
+    "list": ["-m", "tkts", "list"],
+    "show": ["-m", "tkts", "show", "{ticket}"],
+}
+
+
+def parse_importtime(stderr: str) -> Tuple[float, Dict[str, float]]:
+    """Total import time in ms and the cumulative ms per module, from ``-X importtime`` output."""
+    total_us = 0
+    modules: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # the header line
+        cumulative = int(fields[1])
+        name = fields[2].rstrip()
+        if not name.startswith("  "):
+            total_us += cumulative
+        modules[name.strip()] = cumulative / 1000
+    return total_us / 1000, modules
+
+
+def _run(args: Sequence[str], env: Mapping[str, str]) -> Tuple[float, Dict[str, float]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=dict(env),
+        stdin=subprocess.DEVNULL,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited {proc.returncode}: {proc.stderr[-500:]}")
+    return parse_importtime(proc.stderr)
+
+
+def run(*, repeat: int = 5, budget_ms: float = DEFAULT_BUDGET_MS, tickets: int = 50) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        "suite": "tkts-startup",
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "budget_ms": budget_ms,
+        "results": {},
+    }
+    repo = Path(__file__).resolve().parent.parent
+    with tempfile.TemporaryDirectory(prefix="tkts-startup-") as tmp:
+        root = Path(tmp) / "store"
+        corpus = generate_corpus(root, CorpusSpec(tickets=tickets, documents=1, changelog=5))
+        env = {
+            **os.environ,
+            "TKTS_ROOT": str(root),
+            "TKTS_BACKEND": "local",
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(repo), os.environ.get("PYTHONPATH")])),
+        }
+        baseline = statistics.median(_run(["-c", "pass"], env)[0] for _ in range(repeat))
+        report["interpreter_ms"] = round(baseline, 3)
+        for name, template in SCENARIOS.items():
+            args = [arg.format(ticket=corpus[0].ticket_id[:8]) for arg in template]
+            totals: List[float] = []
+            modules: Dict[str, float] = {}
+            for _ in range(repeat):
+                total, modules = _run(args, env)
+                totals.append(max(0.0, total - baseline))
+            median = statistics.median(totals)
+            report["results"][name] = {
+                "runs": repeat,
+                "min_ms": round(min(totals), 3),
+                "median_ms": round(median, 3),
+                "max_ms": round(max(totals), 3),
+                "within_budget": median <= budget_ms,
+                "heavy_modules": sorted(module for module in HEAVY_MODULES if module in modules),
+            }
+    report["within_budget"] = all(result["within_budget"] for result in report["results"].values())
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Median import time allowed per scenario.")
+    parser.add_argument("--tickets", type=int, default=50, help="Tickets in the store the verbs run against.")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when any scenario is over budget.")
+    args = parser.parse_args(argv)
+
+    report = run(repeat=max(1, args.repeat), budget_ms=args.budget_ms, tickets=args.tickets)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 1 if args.check and not report["within_budget"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
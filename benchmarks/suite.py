@@ -0,0 +1,276 @@
+"""tkts benchmark suite: ticket parsing, the file store, TUI filtering, MCP serialization and Trello.
+
+Trello runs against the local fake server in ``benchmarks.fake_trello``; nothing leaves the machine.
+
+    python -m benchmarks.suite --tickets 1000 --documents 2 --changelog 20 --output before.json
+    python -m benchmarks.suite --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from benchmarks.corpus import CorpusSpec, generate_corpus
+from benchmarks.fake_trello import FakeTrello
+from tkts.mcp_server import _dumps, _list_page, _ticket_to_dict
+from tkts.models import Ticket
+from tkts.ncurses_tui import TuiApp
+from tkts.storage import TicketStore
+from tkts.trello.backend import TrelloBackend
+
+
+GROUPS = ("models", "store", "tui", "mcp", "trello")
+
+
+def measure(func: Callable[[], Any], *, repeat: int, ops: int = 1) -> Dict[str, Any]:
+    """Run ``func`` once to warm up, then ``repeat`` times; ``ops`` is how many operations one call performs."""
+    func()
+    times: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    median = statistics.median(times)
+    return {
+        "runs": repeat,
+        "ops": ops,
+        "min_ms": round(min(times) * 1000, 4),
+        "median_ms": round(median * 1000, 4),
+        "max_ms": round(max(times) * 1000, 4),
+        "per_op_us": round(median * 1e6 / ops, 3),
+    }
+
+
+def bench_models(tickets: Sequence[Ticket], repeat: int) -> Dict[str, Any]:
+    raws = [ticket.to_string() for ticket in tickets]
+    return {
+        "models.to_string": measure(lambda: [ticket.to_string() for ticket in tickets], repeat=repeat, ops=len(tickets)),
+        "models.from_string": measure(lambda: [Ticket.from_string(raw) for raw in raws], repeat=repeat, ops=len(raws)),
+        "models.from_string_headers": measure(
+            lambda: [Ticket.from_string(raw, headers_only=True) for raw in raws], repeat=repeat, ops=len(raws)
+        ),
+    }
+
+
+def bench_store(root: Path, tickets: Sequence[Ticket], repeat: int) -> Dict[str, Any]:
+    store = TicketStore(root=root)
+    prefixes = [ticket.ticket_id[:8] for ticket in tickets[:100]]
+    targets = [ticket.ticket_id for ticket in tickets[:20]]
+    statuses = ["todo", "in-progress"]
+
+    def update() -> None:
+        for idx, ticket_id in enumerate(targets):
+            store.update_ticket(ticket_id, status=statuses[idx % 2], log_message="benchmark")
+
+    def create() -> None:
+        # Single writes must stay flat as the store grows; each one lands on the full corpus.
+        for idx in range(20):
+            store.create_ticket(subject=f"Benchmark {idx}", body="body", tags=["bench"], status="todo")
+
+    return {
+        "store.list_tickets_cold": measure(lambda: TicketStore(root=root).list_tickets(), repeat=repeat, ops=len(tickets)),
+        "store.list_tickets_warm": measure(store.list_tickets, repeat=repeat, ops=len(tickets)),
+        "store.get_ticket_prefix": measure(lambda: [store.get_ticket(prefix) for prefix in prefixes], repeat=repeat, ops=len(prefixes)),
+        "store.update_ticket": measure(update, repeat=repeat, ops=len(targets)),
+        "store.create_ticket": measure(create, repeat=repeat, ops=20),
+    }
+
+
+def bench_tui(root: Path, repeat: int) -> Dict[str, Any]:
+    app = TuiApp(TicketStore(root=root))
+    app.refresh_tickets()
+    searches = itertools.cycle(["store", "label"])
+
+    def search() -> None:
+        # Alternating queries are not prefixes of each other, so every call filters and sorts from scratch.
+        app.search_query = next(searches)
+        app.apply_filters()
+
+    def narrow() -> None:
+        app.search_query = ""
+        app.apply_filters()
+        for end in range(1, 6):
+            app.search_query = "store"[:end]
+            app.apply_filters()
+
+    app.filter_statuses = {"todo": True, "in-progress": True, "blocked": True}
+    search()  # the first pass per query loads ticket bodies; measure the steady state
+    results = {"tui.apply_filters_search": measure(search, repeat=repeat, ops=len(app.tickets))}
+    app.filter_statuses = {}
+    results["tui.apply_filters_typing"] = measure(narrow, repeat=repeat, ops=6)
+    return results
+
+
+def bench_mcp(root: Path, repeat: int) -> Dict[str, Any]:
+    store = TicketStore(root=root)
+    tickets = store.list_tickets()
+    full = [store.get_ticket(ticket.ticket_id) for ticket in tickets[:50]]
+    return {
+        "mcp.list_tickets_page": measure(lambda: _dumps(_list_page(store, {"limit": 50})), repeat=repeat, ops=50),
+        "mcp.list_tickets_all": measure(
+            lambda: _dumps(_list_page(store, {"limit": len(tickets) or 1})), repeat=repeat, ops=max(1, len(tickets))
+        ),
+        "mcp.get_ticket_json": measure(lambda: [_dumps(_ticket_to_dict(ticket)) for ticket in full], repeat=repeat, ops=len(full)),
+    }
+
+
+@contextmanager
+def _environ(values: Mapping[str, str]) -> Iterator[None]:
+    saved = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def bench_trello(root: Path, cards: int, request_delay: float, repeat: int) -> Tuple[Dict[str, Any], int]:
+    """Timings plus the number of requests the fake server saw for the non-mirrored runs."""
+    results: Dict[str, Any] = {}
+    with FakeTrello(cards=cards, request_delay=request_delay) as fake:
+        env = {
+            "TRELLO_API_KEY": "key",
+            "TRELLO_API_TOKEN": "token",
+            "TRELLO_BOARD_ID": "board123",
+            "TRELLO_BASE_URL": fake.base_url,
+            "TRELLO_RATE_LIMIT": "0",
+            "TRELLO_BOARD_CACHE_TTL": "0",
+            "TRELLO_MIRROR": "false",
+        }
+        with _environ(env):
+            backend = TrelloBackend(root=str(root))
+            refs = [card["shortLink"] for card in list(fake.cards.values())[:10]]
+            requests_before = fake.requests
+            results["trello.list_tickets"] = measure(backend.list_tickets, repeat=repeat, ops=cards)
+            results["trello.get_ticket"] = measure(lambda: [backend.get_ticket(ref) for ref in refs], repeat=repeat, ops=len(refs))
+            results["trello.get_tickets_batch"] = measure(lambda: backend.get_tickets(refs), repeat=repeat, ops=len(refs))
+            results["trello.update_ticket"] = measure(
+                lambda: backend.update_ticket(refs[0], status="in-progress", comment="benchmark", log_message="run"),
+                repeat=repeat,
+            )
+            results["trello.tail_ticket_changelog"] = measure(lambda: backend.tail_ticket_changelog(refs[0]), repeat=repeat)
+            requests = fake.requests - requests_before
+        with _environ({**env, "TRELLO_MIRROR": "true", "TRELLO_MIRROR_REFRESH": "60"}):
+            mirrored = TrelloBackend(root=str(root))
+            results["trello.list_tickets_mirror"] = measure(mirrored.list_tickets, repeat=repeat, ops=cards)
+    return results, requests
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def compare(current: Mapping[str, Any], baseline: Mapping[str, Any]) -> Dict[str, float]:
+    """Median time of each benchmark relative to ``baseline`` (below 1.0 is faster)."""
+    ratios: Dict[str, float] = {}
+    previous = baseline.get("results") or {}
+    for name, result in (current.get("results") or {}).items():
+        before = previous.get(name)
+        if before and before.get("median_ms"):
+            ratios[name] = round(result["median_ms"] / before["median_ms"], 3)
+    return ratios
+
+
+def run(
+    spec: CorpusSpec,
+    *,
+    repeat: int = 5,
+    groups: Sequence[str] = GROUPS,
+    trello_cards: int = 200,
+    trello_delay: float = 0.0,
+) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        "suite": "tkts",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "corpus": {"tickets": spec.tickets, "documents": spec.documents, "changelog": spec.changelog, "seed": spec.seed},
+        "repeat": repeat,
+        "results": {},
+    }
+    results: Dict[str, Any] = report["results"]
+    with tempfile.TemporaryDirectory(prefix="tkts-bench-") as tmp:
+        root = Path(tmp) / "store"
+        tickets = generate_corpus(root, spec)
+        if "models" in groups:
+            results.update(bench_models(tickets[:200], repeat))
+        if "tui" in groups:
+            results.update(bench_tui(root, repeat))
+        if "mcp" in groups:
+            results.update(bench_mcp(root, repeat))
+        if "store" in groups:
+            results.update(bench_store(root, tickets, repeat))
+        if "trello" in groups:
+            trello, requests = bench_trello(Path(tmp) / "trello", trello_cards, trello_delay, repeat)
+            results.update(trello)
+            report["trello"] = {"cards": trello_cards, "request_delay_s": trello_delay, "requests": requests}
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=1000)
+    parser.add_argument("--documents", type=int, default=2, help="Documents per ticket, not counting the change log.")
+    parser.add_argument("--changelog", type=int, default=20, help="Change-log lines per ticket.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help=f"Comma-separated groups to run: {', '.join(GROUPS)}.")
+    parser.add_argument("--trello-cards", type=int, default=200)
+    parser.add_argument("--trello-delay", type=float, default=0.0, help="Seconds the fake Trello server sleeps per request.")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--compare", help="A previous JSON report; adds median-time ratios against it.")
+    args = parser.parse_args(argv)
+
+    groups = [name.strip() for name in (args.only or ",".join(GROUPS)).split(",") if name.strip()]
+    unknown = sorted(set(groups) - set(GROUPS))
+    if unknown:
+        parser.error(f"Unknown group(s): {', '.join(unknown)}.")
+    spec = CorpusSpec(tickets=args.tickets, documents=args.documents, changelog=args.changelog, seed=args.seed)
+    report = run(
+        spec,
+        repeat=max(1, args.repeat),
+        groups=groups,
+        trello_cards=args.trello_cards,
+        trello_delay=args.trello_delay,
+    )
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        report["compare"] = {"baseline": args.compare, "ratios": compare(report, baseline)}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
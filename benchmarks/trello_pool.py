@@ -0,0 +1,66 @@
+"""Round trips against a local fake Trello: one connection per request vs the pooled client.
+
+    python -m benchmarks.trello_pool --requests 200 --connect-delay 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict
+from urllib.request import urlopen
+
+from benchmarks.fake_trello import FakeTrello
+from tkts.trello.client import TrelloClient, TrelloCredentials
+
+
+def _per_request_connections(fake: FakeTrello, requests: int) -> float:
+    url = f"{fake.base_url}/cards/card000000?key=k&token=t&fields=name"
+    started = time.perf_counter()
+    for _ in range(requests):
+        with urlopen(url, timeout=10) as resp:
+            json.loads(resp.read())
+    return time.perf_counter() - started
+
+
+def _pooled(fake: FakeTrello, requests: int) -> float:
+    client = TrelloClient(credentials=TrelloCredentials(api_key="k", api_token="t"), base_url=fake.base_url)
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get_card("card000000", fields="name")
+    elapsed = time.perf_counter() - started
+    client.close()
+    return elapsed
+
+
+def run(requests: int, connect_delay: float) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"benchmark": "trello_pool", "requests": requests, "connect_delay_s": connect_delay}
+    for name, func in (("urlopen", _per_request_connections), ("pooled", _pooled)):
+        with FakeTrello(cards=1, connect_delay=connect_delay) as fake:
+            elapsed = func(fake, requests)
+            results[name] = {
+                "seconds": round(elapsed, 6),
+                "ms_per_request": round(elapsed * 1000 / requests, 3),
+                "connections": fake.connections,
+            }
+    results["speedup"] = round(results["urlopen"]["seconds"] / results["pooled"]["seconds"], 2)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--connect-delay",
+        type=float,
+        default=0.02,
+        help="Seconds the fake server stalls on each new connection, standing in for TCP + TLS setup.",
+    )
+    args = parser.parse_args()
+    print(json.dumps(run(args.requests, args.connect_delay), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
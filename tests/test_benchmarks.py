@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from benchmarks.corpus import CorpusSpec
+from benchmarks.startup import parse_importtime
+from benchmarks.startup import run as run_startup
+from benchmarks.suite import GROUPS, compare, run
+
+
+def test_suite_runs_every_group_on_a_tiny_corpus() -> None:
+    report = run(CorpusSpec(tickets=6, documents=2, changelog=3), repeat=1, trello_cards=4)
+
+    groups = {name.split(".", 1)[0] for name in report["results"]}
+    assert groups == set(GROUPS)
+    assert all(result["runs"] == 1 and result["median_ms"] >= 0 for result in report["results"].values())
+    assert report["corpus"]["tickets"] == 6
+    assert report["trello"]["requests"] > 0
+
+    ratios = compare(report, report)
+    assert set(ratios) <= set(report["results"]) and all(ratio == 1.0 for ratio in ratios.values())
+
+
+def test_parse_importtime_sums_top_level_cumulative_times() -> None:
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |   _io",
+            "import time:       200 |        300 | site",
+            "import time:       500 |       1500 | tkts",
+        ]
+    )
+    total, modules = parse_importtime(stderr)
+
+    assert total == 1.8
+    assert modules == {"_io": 0.1, "site": 0.3, "tkts": 1.5}
+
+
+def test_startup_keeps_heavy_modules_off_the_local_verbs() -> None:
+    report = run_startup(repeat=1, budget_ms=10_000, tickets=2)
+
+    assert set(report["results"]) == {"import", "new", "list", "show"}
+    for name in ("import", "new", "list"):
+        assert report["results"][name]["heavy_modules"] == []
+    assert "email.parser" in report["results"]["show"]["heavy_modules"]
+    assert report["within_budget"]
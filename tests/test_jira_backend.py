@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from datetime import datetime
+from email.message import Message
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from tkts.backends import available_backends, get_backend_from_env
+from tkts.jira import adf
+from tkts.jira.backend import JiraBackend
+from tkts.jira.client import JiraClient
+from tkts.jira.errors import JiraNotFoundError
+from tkts.query import TicketQuery
+from tkts.trello.pool import HttpResponse
+
+
+_API = "/rest/api/3"
+_STATUSES = {
+    "To Do": "new",
+    "In Progress": "indeterminate",
+    "Code Review": "indeterminate",
+    "Done": "done",
+}
+
+
+def _json_response(payload: Any, *, status: int = 200) -> HttpResponse:
+    message = Message()
+    message["Content-Type"] = "application/json;charset=UTF-8"
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    return HttpResponse(status=status, headers=message, body=body)
+
+
+class _FakeJira:
+    """Just enough of the Jira REST API for the backend: searches (token-paged /search/jql and approximate-count
+    on v3, startAt-paged /search on v2), issues, transitions and comments."""
+
+    def __init__(self, page_cap: int = 100) -> None:
+        self.page_cap = page_cap
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.comments: Dict[str, List[Dict[str, Any]]] = {}
+        self.calls: List[Tuple[str, str, Any]] = []
+        self.users = [
+            {"accountId": "acc-alice", "displayName": "Alice", "emailAddress": "alice@example.com"},
+            {"accountId": "acc-alan", "displayName": "Alan", "emailAddress": "alan@example.com"},
+        ]
+        self.page_barrier: Optional[threading.Barrier] = None
+        self._minute = 0
+        self._lock = threading.Lock()
+        self._commenting = threading.Lock()
+
+    def _now(self) -> str:
+        self._minute += 1
+        return f"2026-04-08T{10 + self._minute // 60:02d}:{self._minute % 60:02d}:00.000+0200"
+
+    def add(self, number: int, summary: str, *, status: str = "To Do", description: Any = None) -> str:
+        key = f"ENG-{number}"
+        self.issues[key] = {
+            "id": str(10000 + number),
+            "key": key,
+            "fields": {
+                "summary": summary,
+                "status": {"name": status, "statusCategory": {"key": _STATUSES[status]}},
+                "assignee": None,
+                "labels": [],
+                "created": self._now(),
+                "updated": self._now(),
+                "description": description,
+            },
+        }
+        return key
+
+    def touch(self, key: str, **fields: Any) -> None:
+        self.issues[key]["fields"].update(fields)
+        self.issues[key]["fields"]["updated"] = self._now()
+
+    def _matches(self, jql: str, issue: Dict[str, Any]) -> bool:
+        fields = issue["fields"]
+        category = fields["status"]["statusCategory"]["key"]
+        if "statusCategory != Done" in jql and category == "done":
+            return False
+        if "statusCategory = Done" in jql and category != "done":
+            return False
+        keys = re.search(r"key in \(([^)]*)\)", jql)
+        if keys and issue["key"] not in re.findall(r'"([^"]+)"', keys.group(1)):
+            return False
+        since = re.search(r'updated >= "([^"]+)"', jql)
+        if since:
+            updated = datetime.strptime(fields["updated"], "%Y-%m-%dT%H:%M:%S.%f%z").replace(tzinfo=None)
+            if updated < datetime.strptime(since.group(1), "%Y/%m/%d %H:%M"):
+                return False
+        return True
+
+    def _page(self, body: Dict[str, Any], start: int) -> Tuple[List[Dict[str, Any]], int]:
+        matching = [issue for issue in self.issues.values() if self._matches(body["jql"], issue)]
+        wanted = set(body["fields"])
+        return [
+            {**issue, "fields": {name: value for name, value in issue["fields"].items() if name in wanted}}
+            for issue in matching[start : start + min(body["maxResults"], self.page_cap)]
+        ], len(matching)
+
+    def _search_jql(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        start = int(body.get("nextPageToken") or 0)
+        page, total = self._page(body, start)
+        end = start + len(page)
+        if end < total:
+            return {"issues": page, "nextPageToken": str(end), "isLast": False}
+        return {"issues": page, "isLast": True}
+
+    def _search(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        start = body["startAt"]
+        if start and self.page_barrier is not None:
+            self.page_barrier.wait(timeout=5)  # only returns if the later pages are in flight together
+        page, total = self._page(body, start)
+        return {"startAt": start, "maxResults": min(body["maxResults"], self.page_cap), "total": total, "issues": page}
+
+    def handle(self, method: str, path: str, params: Optional[Dict[str, Any]], body: Any) -> HttpResponse:
+        with self._lock:
+            self.calls.append((method, path, body if body is not None else dict(params or {})))
+        version, route = re.fullmatch(r"/rest/api/(\d)(/.*)", path).groups()
+        if (method, route) == ("POST", "/search/jql") and version == "3":
+            return _json_response(self._search_jql(body))
+        if (method, route) == ("POST", "/search/approximate-count") and version == "3":
+            return _json_response({"count": sum(self._matches(body["jql"], issue) for issue in self.issues.values())})
+        if (method, route) == ("POST", "/search") and version == "2":
+            return _json_response(self._search(body))
+        if (method, route) == ("GET", "/user/assignable/search"):
+            needle = params["query"].lower()
+            return _json_response([user for user in self.users if user["displayName"].lower().startswith(needle)])
+        if (method, route) == ("POST", "/issue"):
+            key = self.add(len(self.issues) + 1, body["fields"]["summary"], description=body["fields"].get("description"))
+            self.touch(key, labels=body["fields"].get("labels", []), assignee=body["fields"].get("assignee"))
+            return _json_response({"id": self.issues[key]["id"], "key": key}, status=201)
+        match = re.fullmatch(r"/issue/([A-Z]+-\d+)(/transitions|/comment)?", route)
+        if not match or match.group(1) not in self.issues:
+            return _json_response({"errorMessages": ["Issue does not exist"]}, status=404)
+        key, sub = match.group(1), match.group(2)
+        issue = self.issues[key]
+        if sub is None and method == "GET":
+            wanted = set(params["fields"].split(","))
+            return _json_response({**issue, "fields": {k: v for k, v in issue["fields"].items() if k in wanted}})
+        if sub is None and method == "PUT":
+            fields = dict(body["fields"])
+            if "assignee" in fields and fields["assignee"]:
+                account = fields["assignee"]["accountId"]
+                fields["assignee"] = next(user for user in self.users if user["accountId"] == account)
+            self.touch(key, **fields)
+            return _json_response(None, status=204)
+        if sub == "/transitions" and method == "GET":
+            transitions = [
+                {"id": str(idx), "name": name, "to": {"name": name, "statusCategory": {"key": category}}}
+                for idx, (name, category) in enumerate(_STATUSES.items())
+            ]
+            return _json_response({"transitions": transitions})
+        if sub == "/transitions" and method == "POST":
+            name = list(_STATUSES)[int(body["transition"]["id"])]
+            self.touch(key, status={"name": name, "statusCategory": {"key": _STATUSES[name]}})
+            return _json_response(None, status=204)
+        if sub == "/comment" and method == "POST":
+            # Comments on one issue must be posted one at a time to keep their order.
+            assert self._commenting.acquire(blocking=False), "overlapping comment posts"
+            try:
+                time.sleep(0.01)
+            finally:
+                self._commenting.release()
+            comment = {"author": {"displayName": "Bot"}, "body": body["body"], "created": self._now()}
+            self.comments.setdefault(key, []).append(comment)
+            return _json_response(comment, status=201)
+        if sub == "/comment" and method == "GET":
+            newest_first = list(reversed(self.comments.get(key, [])))
+            return _json_response({"comments": newest_first[: int(params["maxResults"])]})
+        raise AssertionError(f"Unexpected Jira request: {method} {path}")
+
+    def searches(self) -> List[Dict[str, Any]]:
+        return [body for method, path, body in self.calls if re.fullmatch(r"/rest/api/\d/search(/jql)?", path)]
+
+    def counts(self) -> List[Dict[str, Any]]:
+        return [body for method, path, body in self.calls if path == f"{_API}/search/approximate-count"]
+
+
+@pytest.fixture
+def fake(monkeypatch, tmp_path) -> _FakeJira:
+    monkeypatch.setenv("TKTS_ROOT", str(tmp_path))
+    monkeypatch.setenv("JIRA_BASE_URL", "https://example.atlassian.net")
+    monkeypatch.setenv("JIRA_EMAIL", "bot@example.com")
+    monkeypatch.setenv("JIRA_API_TOKEN", "token")
+    monkeypatch.setenv("JIRA_PROJECT", "ENG")
+    monkeypatch.setenv("JIRA_STATUS_MAP", "in-review:Code Review")
+    monkeypatch.setenv("JIRA_CACHE_REFRESH", "0")
+    jira = _FakeJira()
+
+    def fake_send(self: JiraClient, method: str, path: str, *, params=None, json_body=None) -> HttpResponse:
+        response = jira.handle(method.upper(), path, params, json_body)
+        if response.status == 404:
+            raise JiraNotFoundError("Jira resource not found.")
+        return response
+
+    monkeypatch.setattr(JiraClient, "_send", fake_send, raising=True)
+    return jira
+
+
+def test_backend_registration_via_env(fake: _FakeJira, monkeypatch) -> None:
+    monkeypatch.setenv("TKTS_BACKEND", "jira")
+
+    assert "jira" in available_backends(entry_points=False)
+    assert isinstance(get_backend_from_env(), JiraBackend)
+
+
+def test_list_tickets_fetches_list_fields_and_pages_by_token(fake: _FakeJira, monkeypatch) -> None:
+    monkeypatch.setenv("JIRA_CACHE", "false")
+    for number in range(1, 251):
+        fake.add(number, f"Issue {number}", description="body text")
+    fake.add(251, "Finished", status="Done")
+
+    tickets = JiraBackend().list_tickets()
+
+    assert len(tickets) == 250 and tickets[0].ticket_id == "ENG-1"
+    searches = fake.searches()
+    assert [body.get("nextPageToken") for body in searches] == [None, "100", "200"]
+    assert all("description" not in body["fields"] for body in searches)
+    assert all("statusCategory != Done" in body["jql"] for body in searches)
+    assert tickets[0].status == "todo"
+
+    # Bodies load on demand with a single issue read.
+    assert tickets[0].body == "body text"
+    assert fake.calls[-1][:2] == ("GET", f"{_API}/issue/ENG-1")
+
+    fake.calls.clear()
+    assert [ticket.subject for ticket in JiraBackend().list_tickets(query=TicketQuery(statuses=["done"]))] == ["Finished"]
+    matched = JiraBackend().list_tickets(query=TicketQuery(text="body", limit=5))
+    assert len(matched) == 5 and all("description" in body["fields"] for body in fake.searches()[-3:])
+
+
+def test_server_search_pages_in_parallel(fake: _FakeJira, monkeypatch) -> None:
+    monkeypatch.setenv("JIRA_CACHE", "false")
+    monkeypatch.setenv("JIRA_API_VERSION", "2")
+    for number in range(1, 251):
+        fake.add(number, f"Issue {number}")
+    fake.page_barrier = threading.Barrier(2)  # pages 2 and 3 must be requested concurrently
+
+    tickets = JiraBackend().list_tickets()
+
+    assert [ticket.ticket_id for ticket in tickets] == [f"ENG-{number}" for number in range(1, 251)]
+    assert sorted(body["startAt"] for body in fake.searches()) == [0, 100, 200]
+    assert all(path == "/rest/api/2/search" for method, path, _ in fake.calls)
+
+
+def test_issue_cache_syncs_incrementally_by_updated(fake: _FakeJira) -> None:
+    first = fake.add(1, "First")
+    fake.add(2, "Second")
+    backend = JiraBackend()
+    assert [ticket.subject for ticket in backend.list_tickets()] == ["First", "Second"]
+
+    fake.calls.clear()
+    fake.touch(first, summary="First, renamed", status={"name": "Code Review", "statusCategory": {"key": "indeterminate"}})
+    fake.add(3, "Third")
+    tickets = backend.list_tickets()
+
+    assert [(ticket.subject, ticket.status) for ticket in tickets] == [
+        ("First, renamed", "in-review"),
+        ("Second", "todo"),
+        ("Third", "todo"),
+    ]
+    assert ["updated >=" in body["jql"] for body in fake.searches()] == [True]
+    assert fake.counts() == [{"jql": '(project = "ENG") AND statusCategory != Done'}]
+
+    # Finished issues leave the cache through the incremental sync ...
+    fake.calls.clear()
+    fake.touch("ENG-2", status={"name": "Done", "statusCategory": {"key": "done"}})
+    assert [ticket.ticket_id for ticket in backend.list_tickets()] == ["ENG-1", "ENG-3"]
+    assert len(fake.searches()) == 1 and len(fake.counts()) == 1
+
+    # ... deleted ones through the count check, which forces a full resync.
+    fake.calls.clear()
+    del fake.issues["ENG-3"]
+    assert [ticket.ticket_id for ticket in backend.list_tickets()] == ["ENG-1"]
+    assert [body["jql"] for body in fake.searches()][-1].startswith('(project = "ENG") AND statusCategory != Done')
+
+    # A second process reuses the cache file.
+    fake.calls.clear()
+    assert [ticket.ticket_id for ticket in JiraBackend().list_tickets()] == ["ENG-1"]
+    assert all("updated >=" in body["jql"] for body in fake.searches()) and len(fake.counts()) == 1
+
+
+def test_issue_cache_lists_issues_in_created_order(fake: _FakeJira) -> None:
+    for number in (9, 10, 2):
+        fake.add(number, f"Issue {number}")
+
+    # The order uncached searches use (created), not the key order ENG-10, ENG-2, ENG-9.
+    assert [ticket.ticket_id for ticket in JiraBackend().list_tickets()] == ["ENG-9", "ENG-10", "ENG-2"]
+
+
+def test_writes_go_through_the_issue_cache(fake: _FakeJira, monkeypatch) -> None:
+    monkeypatch.delenv("JIRA_CACHE_REFRESH")  # the default 5s, so only write-through can show our edits
+    for number, summary in enumerate(["First", "Second", "Third"], start=1):
+        fake.add(number, summary)
+    backend = JiraBackend()
+    backend.list_tickets()
+
+    fake.touch("ENG-2", summary="Second, edited elsewhere")
+    fake._minute += 10  # well outside the one-minute overlap of an incremental sync
+    backend.update_ticket("ENG-1", subject="First, renamed")
+    backend.update_ticket("ENG-3", status="done")
+    backend.create_ticket("Fourth")
+
+    fake.calls.clear()
+    assert [ticket.subject for ticket in backend.list_tickets()] == ["First, renamed", "Second", "Fourth"]
+    assert [ticket.subject for ticket in JiraBackend().list_tickets()] == ["First, renamed", "Second", "Fourth"]
+    assert fake.calls == []
+
+    # Our writes do not move the sync cursor, so the next sync still picks up the edit made elsewhere.
+    monkeypatch.setenv("JIRA_CACHE_REFRESH", "0")
+    tickets = JiraBackend().list_tickets()
+    assert [ticket.subject for ticket in tickets] == ["First, renamed", "Second, edited elsewhere", "Fourth"]
+
+
+def test_update_ticket_writes_fields_transition_and_comments(fake: _FakeJira) -> None:
+    key = fake.add(1, "Issue")
+
+    ticket = JiraBackend().update_ticket(
+        "1",
+        subject="Renamed",
+        body="line one\nline two\n\nsecond paragraph",
+        assignee="alice",
+        tags=["perf"],
+        status="in-review",
+        append_body="more",
+        comment="looks good",
+        log_message="moved",
+    )
+
+    assert ticket.ticket_id == key
+    assert (ticket.subject, ticket.status, ticket.assignee, ticket.tags) == ("Renamed", "in-review", "Alice", ["perf"])
+    assert ticket.body == "line one\nline two\n\nsecond paragraph"
+    put = next(body for method, path, body in fake.calls if method == "PUT")
+    assert put["fields"]["assignee"] == {"accountId": "acc-alice"}
+    assert put["fields"]["description"]["type"] == "doc"
+    assert [line.split("] ", 1)[1] for line in JiraBackend().tail_ticket_changelog(key)] == [
+        "Bot: Append: more",
+        "Bot: looks good",
+        "Bot: Log: moved",
+    ]
+
+
+def test_create_ticket_and_bulk_reads(fake: _FakeJira) -> None:
+    fake.add(1, "Existing")
+    backend = JiraBackend()
+
+    created = backend.create_ticket("New issue", body="details", tags=["cli"], status="in-progress")
+    assert (created.ticket_id, created.status, created.body, created.tags) == ("ENG-2", "in-progress", "details", ["cli"])
+    create = next(body for method, path, body in fake.calls if (method, path) == ("POST", f"{_API}/issue"))
+    assert create["fields"]["project"] == {"key": "ENG"} and create["fields"]["issuetype"] == {"name": "Task"}
+
+    fake.calls.clear()
+    tickets = backend.get_tickets(["ENG-1", "eng-2", "ENG-99"])
+    assert [ticket.subject if ticket else None for ticket in tickets] == ["Existing", "New issue", None]
+    assert len(fake.calls) == 1 and "key in (" in fake.calls[0][2]["jql"]
+    assert backend.get_ticket("ENG-99") is None
+
+
+def test_adf_round_trip() -> None:
+    text = "First line\nsecond line\n\nNext paragraph"
+    assert adf.to_text(adf.from_text(text)) == text
+    assert adf.from_text("  \n") is None
+    document = {
+        "type": "doc",
+        "content": [
+            {"type": "heading", "attrs": {"level": 2}, "content": [{"type": "text", "text": "Plan"}]},
+            {
+                "type": "bulletList",
+                "content": [
+                    {"type": "listItem", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "one", "marks": [{"type": "strong"}]}]}]},
+                    {"type": "listItem", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "two"}]}]},
+                ],
+            },
+            {"type": "codeBlock", "attrs": {"language": "sh"}, "content": [{"type": "text", "text": "make test"}]},
+        ],
+    }
+    assert adf.to_text(document) == "## Plan\n\n- **one**\n- two\n\n```sh\nmake test\n```"
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from tkts.mcp_executor import BackendExecutor
+
+
+def test_identical_inflight_reads_share_one_call() -> None:
+    executor = BackendExecutor(max_workers=4, timeout=5)
+    release = threading.Event()
+    calls: list[int] = []
+
+    def slow_read() -> str:
+        calls.append(1)
+        release.wait(2)
+        return "payload"
+
+    async def main() -> Any:
+        readers = [asyncio.create_task(executor.run(slow_read, key="page")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*readers)
+
+    assert asyncio.run(main()) == ["payload"] * 3
+    assert len(calls) == 1
+    executor.shutdown()
+
+
+def test_slow_call_does_not_block_other_calls_and_times_out() -> None:
+    executor = BackendExecutor(max_workers=2, timeout=0.2)
+    release = threading.Event()
+
+    async def main() -> Any:
+        slow = asyncio.create_task(executor.run(lambda: release.wait(5), key="slow"))
+        started = time.monotonic()
+        assert await executor.run(lambda: "fast") == "fast"
+        assert time.monotonic() - started < 0.2
+        with pytest.raises(TimeoutError, match="timed out"):
+            await slow
+
+    try:
+        asyncio.run(main())
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_cancelled_queued_call_never_runs() -> None:
+    executor = BackendExecutor(max_workers=1, timeout=5)
+    release = threading.Event()
+    ran: list[str] = []
+
+    async def main() -> None:
+        busy = asyncio.create_task(executor.run(lambda: release.wait(2)))
+        queued = asyncio.create_task(executor.run(lambda: ran.append("queued"), key="queued"))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        await asyncio.sleep(0.05)
+        release.set()
+        await busy
+
+    asyncio.run(main())
+    executor.shutdown()
+    assert ran == []
@@ -4,7 +4,10 @@ import asyncio
 import json
 from typing import Any, Callable
 
-from tkts.mcp_server import _build_server, _ticket_to_dict
+import pytest
+
+from tkts.mcp_cache import ResponseCache, _DeltaChanges, _ExpiryChanges
+from tkts.mcp_server import SUMMARY_FIELDS, _build_server, _parse_listen, _ticket_to_dict
 from tkts.storage import TicketStore
 
 
@@ -45,6 +48,36 @@ class _FakeServer:
         return decorator
 
 
+class _FakeSubscribingServer(_FakeServer):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.request_context: Any = None
+        self._subscribe_handler: Callable[[Any], Any] | None = None
+        self._unsubscribe_handler: Callable[[Any], Any] | None = None
+
+    def subscribe_resource(self) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
+        def decorator(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+            self._subscribe_handler = fn
+            return fn
+
+        return decorator
+
+    def unsubscribe_resource(self) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
+        def decorator(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+            self._unsubscribe_handler = fn
+            return fn
+
+        return decorator
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.updated: list[str] = []
+
+    async def send_resource_updated(self, uri: Any) -> None:
+        self.updated.append(str(uri))
+
+
 class _StubResource:
     def __init__(self, **kwargs: Any) -> None:
         self.__dict__.update(kwargs)
@@ -67,6 +100,16 @@ class _StubTextContent:
         self.text = text
 
 
+class _CountingStore(TicketStore):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    def get_ticket(self, ticket_id: str) -> Any:
+        self.reads += 1
+        return super().get_ticket(ticket_id)
+
+
 def _build_test_server(store: TicketStore, read_only: bool = False) -> _FakeServer:
     return _build_server(
         backend=store,
@@ -83,16 +126,14 @@ def _run(coro: Any) -> Any:
     return asyncio.run(coro)
 
 
-def test_list_resources_includes_ticket_and_collection(tmp_path: Any) -> None:
+def test_list_resources_does_not_enumerate_tickets(tmp_path: Any) -> None:
     store = TicketStore(root=tmp_path)
-    ticket = store.create_ticket(subject="Test", body="Body")
+    store.create_ticket(subject="Test", body="Body")
 
     server = _build_test_server(store)
     resources = _run(server._list_resources_handler())
 
-    assert resources
-    assert any(resource.uri == "tkts://tickets" for resource in resources)
-    assert any(resource.uri == f"tkts://tickets/{ticket.ticket_id}" for resource in resources)
+    assert [resource.uri for resource in resources] == ["tkts://tickets"]
 
 
 def test_read_resource_list_returns_ticket_payloads(tmp_path: Any) -> None:
@@ -106,7 +147,10 @@ def test_read_resource_list_returns_ticket_payloads(tmp_path: Any) -> None:
     payload = json.loads(contents[0].content)
     expected_ticket = store.get_ticket(ticket.ticket_id)
     assert expected_ticket is not None
-    assert payload == [_ticket_to_dict(expected_ticket)]
+    assert payload == {"tickets": [_ticket_to_dict(expected_ticket, SUMMARY_FIELDS)], "next_cursor": None}
+
+    contents = _run(server._read_resource_handler("tkts://tickets?fields=subject,body"))
+    assert json.loads(contents[0].content)["tickets"] == [{"id": ticket.ticket_id, "subject": "Test", "body": "Body\n"}]
 
 
 def test_read_resource_ticket_returns_single_ticket(tmp_path: Any) -> None:
@@ -132,3 +176,187 @@ def test_list_tools_respects_read_only(tmp_path: Any) -> None:
 
     assert "create_ticket" not in names
     assert "update_ticket" not in names
+
+
+def test_list_tickets_tool_applies_query(tmp_path: Any) -> None:
+    store = TicketStore(root=tmp_path)
+    store.create_ticket(subject="Todo", body="Body", status="todo")
+    store.create_ticket(subject="Done", body="Body", status="done")
+
+    server = _build_test_server(store)
+    contents = _run(server._call_tool_handler("list_tickets", {"status": ["done"]}))
+
+    payload = json.loads(contents[0].text)
+    assert [ticket["subject"] for ticket in payload["tickets"]] == ["Done"]
+
+
+def test_list_tickets_tool_paginates_with_cursor(tmp_path: Any) -> None:
+    store = TicketStore(root=tmp_path)
+    for idx in range(5):
+        store.create_ticket(subject=f"Ticket {idx}", body="Long body", status="todo")
+
+    server = _build_test_server(store)
+    seen: list[str] = []
+    arguments: dict[str, Any] = {"limit": 2, "fields": ["subject"], "sort": "subject"}
+    while True:
+        payload = json.loads(_run(server._call_tool_handler("list_tickets", arguments))[0].text)
+        assert all(set(ticket) == {"id", "subject"} for ticket in payload["tickets"])
+        seen.extend(ticket["subject"] for ticket in payload["tickets"])
+        if not payload["next_cursor"]:
+            break
+        arguments = {**arguments, "cursor": payload["next_cursor"]}
+
+    assert seen == [f"Ticket {idx}" for idx in range(5)]
+    with pytest.raises(ValueError, match="Cursor does not match"):
+        _run(server._call_tool_handler("list_tickets", {**arguments, "sort": "id"}))
+
+
+def test_bulk_tools_create_and_update(tmp_path: Any) -> None:
+    store = TicketStore(root=tmp_path)
+    server = _build_test_server(store)
+
+    created = json.loads(
+        _run(server._call_tool_handler("create_tickets", {"tickets": [{"subject": "A"}, {"subject": "B"}]}))[0].text
+    )
+    updates = [{"ticket_id": ticket["id"], "status": "done"} for ticket in created]
+    updated = json.loads(_run(server._call_tool_handler("update_tickets", {"updates": updates}))[0].text)
+
+    assert [ticket["subject"] for ticket in created] == ["A", "B"]
+    assert [ticket["status"] for ticket in updated] == ["done", "done"]
+    read_only_names = {tool.name for tool in _run(_build_test_server(store, read_only=True)._list_tools_handler())}
+    assert "create_tickets" not in read_only_names
+
+
+def test_repeated_reads_are_served_from_cache_until_the_ticket_changes(tmp_path: Any) -> None:
+    store = _CountingStore(root=tmp_path)
+    ticket = store.create_ticket(subject="Cached", body="Body")
+    other = store.create_ticket(subject="Other", body="Body")
+    server = _build_test_server(store)
+
+    def read(ticket_id: str) -> dict[str, Any]:
+        return json.loads(_run(server._call_tool_handler("get_ticket", {"ticket_id": ticket_id}))[0].text)
+
+    assert read(ticket.ticket_id)["subject"] == "Cached"
+    assert read(ticket.ticket_id)["subject"] == "Cached"
+    assert read(other.ticket_id)["subject"] == "Other"
+    assert store.reads == 2
+
+    _run(server._call_tool_handler("update_ticket", {"ticket_id": ticket.ticket_id, "status": "done"}))
+    assert read(ticket.ticket_id)["status"] == "done"
+    assert store.reads == 3
+
+    TicketStore(root=tmp_path).update_ticket(ticket.ticket_id, subject="Edited elsewhere")
+    assert read(ticket.ticket_id)["subject"] == "Edited elsewhere"
+    reads = store.reads
+    assert read(other.ticket_id)["subject"] == "Other"
+    assert store.reads == reads
+
+
+def test_list_pages_are_dropped_on_any_write(tmp_path: Any) -> None:
+    store = TicketStore(root=tmp_path)
+    store.create_ticket(subject="First", body="")
+    server = _build_test_server(store)
+
+    def subjects() -> list[str]:
+        payload = json.loads(_run(server._read_resource_handler("tkts://tickets?sort=subject"))[0].content)
+        return [ticket["subject"] for ticket in payload["tickets"]]
+
+    assert subjects() == ["First"]
+    _run(server._call_tool_handler("create_ticket", {"subject": "Second"}))
+    assert subjects() == ["First", "Second"]
+
+
+def test_cache_without_change_detection_expires() -> None:
+    cache = ResponseCache(_ExpiryChanges(0.0))
+    loads: list[int] = []
+
+    def load() -> str:
+        loads.append(1)
+        return "[]"
+
+    cache.query("page", load)
+    cache.query("page", load)
+    assert len(loads) == 2
+
+    cache = ResponseCache(_ExpiryChanges(60.0))
+    cache.query("page", load)
+    cache.query("page", load)
+    assert len(loads) == 3
+
+
+def test_cached_lookups_never_poll_a_network_change_feed() -> None:
+    class _FeedBackend:
+        def __init__(self) -> None:
+            self.polls = 0
+
+        def changed_tickets(self, cursor: Any) -> tuple[set[str], str]:
+            self.polls += 1
+            return set(), "cursor"
+
+    backend = _FeedBackend()
+    cache = ResponseCache(_DeltaChanges(backend, 60.0))
+    # The first poll is due straight away: the fast path defers it to the worker-side call.
+    assert cache.cached_query("page") is None
+    assert backend.polls == 0
+    assert cache.query("page", lambda: "[]") == "[]"
+    assert backend.polls == 1
+    assert cache.cached_query("page") == "[]"
+    assert backend.polls == 1
+
+    cache = ResponseCache(_DeltaChanges(backend, 60.0))
+    cache.sync()
+    cache.query("page", lambda: "[]")
+    # A poll in progress on another thread must not make the event loop wait for it.
+    with cache._poll_lock:
+        assert cache.cached_query("page") is None
+
+
+def test_parse_listen_defaults_to_loopback() -> None:
+    assert _parse_listen("8765") == ("127.0.0.1", 8765)
+    assert _parse_listen(":8765") == ("127.0.0.1", 8765)
+    assert _parse_listen("0.0.0.0:9000") == ("0.0.0.0", 9000)
+    assert _parse_listen("[::1]:9000") == ("::1", 9000)
+    with pytest.raises(ValueError, match="HOST"):
+        _parse_listen("localhost")
+    with pytest.raises(ValueError, match="between"):
+        _parse_listen("70000")
+
+
+def test_subscribers_are_notified_of_changed_tickets_only(tmp_path: Any, monkeypatch: Any) -> None:
+    monkeypatch.setenv("TKTS_MCP_NOTIFY_INTERVAL", "0.01")
+    store = TicketStore(root=tmp_path)
+    watched = store.create_ticket(subject="Watched", body="")
+    quiet = store.create_ticket(subject="Quiet", body="")
+    server = _build_server(
+        backend=store,
+        read_only=False,
+        Server=_FakeSubscribingServer,
+        TextContent=_StubTextContent,
+        Tool=_StubTool,
+        Resource=_StubResource,
+        ReadResourceContents=_StubReadResourceContents,
+    )
+    ticket_session, quiet_session, list_session = _RecordingSession(), _RecordingSession(), _RecordingSession()
+
+    async def main() -> None:
+        for session, uri in [
+            (ticket_session, f"tkts://tickets/{watched.ticket_id[:8]}"),
+            (quiet_session, f"tkts://tickets/{quiet.ticket_id}"),
+            (list_session, "tkts://tickets?status=todo"),
+        ]:
+            server.request_context = type("Context", (), {"session": session})()
+            await server._subscribe_handler(uri)
+        TicketStore(root=tmp_path).update_ticket(watched.ticket_id, status="todo")
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if ticket_session.updated and list_session.updated:
+                break
+        server.request_context = type("Context", (), {"session": list_session})()
+        await server._unsubscribe_handler("tkts://tickets?status=todo")
+
+    _run(main())
+
+    assert ticket_session.updated == [f"tkts://tickets/{watched.ticket_id[:8]}"]
+    assert quiet_session.updated == []
+    # List subscribers are sent the URI they subscribed to, never ticket URIs they did not ask for.
+    assert list_session.updated == ["tkts://tickets?status=todo"]
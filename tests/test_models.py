@@ -1,3 +1,9 @@
+import re
+from dataclasses import asdict
+
+import pytest
+
+from tkts import models
 from tkts.models import Ticket
 
 
@@ -43,3 +49,98 @@ def test_ticket_round_trip_multi_document() -> None:
 
     assert _strip(parsed.body) == "Doc one"
     assert [_strip(doc) for doc in parsed.documents] == ["Doc one", "Doc two"]
+
+
+def test_ticket_headers_only_defers_documents() -> None:
+    ticket = Ticket(
+        ticket_id="lazy123",
+        subject="Lazy",
+        body="Primary body",
+        tags=["a", "b"],
+        status="todo",
+        documents=["Doc one", "Change Log:\n- entry\n"],
+        extra_headers={"X-Source": "helpdesk"},
+    )
+    raw = ticket.to_string()
+    loads: list[str] = []
+
+    parsed = Ticket.from_headers(
+        raw.split("\n\n", 1)[0] + "\n\n",
+        loader=lambda: loads.append("full") or Ticket.from_string(raw),
+    )
+
+    assert parsed.subject == "Lazy"
+    assert parsed.tags == ["a", "b"]
+    assert parsed.status == "todo"
+    assert parsed.extra_headers.get("X-Source") == "helpdesk"
+    assert loads == []
+
+    assert [_strip(doc) for doc in parsed.documents] == ["Doc one", "Change Log:\n- entry"]
+    assert loads == ["full"]
+
+
+def test_ticket_from_string_headers_only_matches_full_parse() -> None:
+    raw = Ticket(ticket_id="same1", subject="Same", body="Body", assignee="ops").to_string()
+
+    lazy = Ticket.from_string(raw, headers_only=True)
+    full = Ticket.from_string(raw)
+
+    assert asdict(lazy) == asdict(full)
+
+
+def _same_boundary(raw: str) -> str:
+    return re.sub(r"={15}\d+==(\.\d+)?", "BOUNDARY", raw)
+
+
+@pytest.mark.parametrize(
+    "ticket",
+    [
+        Ticket(
+            ticket_id="abc123",
+            subject="Replace printer toner",
+            body="Order black toner",
+            assignee="ops",
+            tags=["supplies", "printer"],
+            status="todo",
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-02T00:00:00Z",
+            extra_headers={"X-Source": "helpdesk", "subject": "ignored"},
+        ),
+        Ticket(ticket_id="empty", subject="No body", body=""),
+        Ticket(ticket_id="multi123", subject="Incident", body="x", documents=["Doc one", "Doc two\r\n", "Change Log:\n- entry\n"]),
+        Ticket(ticket_id="long", subject="Long lines", body="word " * 40, documents=["word " * 40, "x\n" * 12 + "y" * 90]),
+        Ticket(ticket_id="b64", subject="Mostly escapes", body="=" * 120),
+    ],
+)
+def test_fast_serializer_matches_email_message(ticket: Ticket) -> None:
+    fast = ticket._fast_string()
+
+    assert fast is not None
+    assert _same_boundary(fast) == _same_boundary(ticket.to_message().as_string())
+    assert Ticket.from_string(fast) == Ticket.from_string(ticket.to_message().as_string())
+    # Parsing and re-serializing gives the same bytes back (up to the random multipart boundary).
+    assert _same_boundary(Ticket.from_string(fast).to_string()) == _same_boundary(fast)
+
+
+@pytest.mark.parametrize(
+    "ticket",
+    [
+        Ticket(ticket_id="u1", subject="Caf\u00e9", body="Body"),
+        Ticket(ticket_id="u2", subject="Body", body="na\u00efve"),
+        Ticket(ticket_id="f1", subject="s" * 80, body="Body"),
+        Ticket(ticket_id="e1", subject="=?utf-8?q?x?=", body="Body"),
+        Ticket(ticket_id="h1", subject="Headers", body="Body", extra_headers={"From": "ops@example.com"}),
+    ],
+)
+def test_fast_serializer_defers_to_email_message_when_it_would_encode(ticket: Ticket) -> None:
+    assert ticket._fast_string() is None
+    assert Ticket.from_string(ticket.to_string()).subject == Ticket.from_string(ticket.to_message().as_string()).subject
+
+
+def test_fast_serializer_constants_match_the_email_package() -> None:
+    from email.headerregistry import HeaderRegistry, UnstructuredHeader
+    from email.policy import default
+
+    registry = HeaderRegistry().registry
+    assert models._STRUCTURED_HEADERS == {name for name, cls in registry.items() if not issubclass(cls, UnstructuredHeader)}
+    assert models._MAX_LINE_LENGTH == default.max_line_length
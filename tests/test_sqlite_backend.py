@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tkts.backends import get_backend
+from tkts.models import Ticket
+from tkts.query import TicketQuery
+from tkts.sqlite import SqliteBackend
+from tkts.storage import TicketStore
+
+
+def test_backend_registration(tmp_path: os.PathLike[str]) -> None:
+    backend = get_backend("sqlite", str(tmp_path))
+    assert isinstance(backend, SqliteBackend)
+
+
+def test_create_get_and_prefix_resolution(tmp_path: os.PathLike[str]) -> None:
+    backend = SqliteBackend(root=str(tmp_path))
+    ticket = backend.create_ticket(subject="Replace toner", body="Order black", tags=["ops", "printer"], status="todo")
+
+    fetched = backend.get_ticket(ticket.ticket_id[:6])
+
+    assert fetched is not None
+    assert fetched.ticket_id == ticket.ticket_id
+    assert fetched.subject == "Replace toner"
+    assert fetched.body == "Order black"
+    assert fetched.tags == ["ops", "printer"]
+    assert fetched.status == "todo"
+
+
+def test_get_ticket_rejects_ambiguous_prefix(tmp_path: os.PathLike[str]) -> None:
+    backend = SqliteBackend(root=str(tmp_path))
+    backend._write(Ticket(ticket_id="abc12345", subject="First", body=""))
+    backend._write(Ticket(ticket_id="abc67890", subject="Second", body=""))
+
+    assert backend.get_ticket("abc6").subject == "Second"  # type: ignore[union-attr]
+    with pytest.raises(ValueError, match="Multiple tickets match"):
+        backend.get_ticket("abc")
+
+
+def test_update_and_tail_changelog(tmp_path: os.PathLike[str]) -> None:
+    backend = SqliteBackend(root=str(tmp_path))
+    ticket = backend.create_ticket(subject="Work", body="Body", status="todo")
+
+    backend.update_ticket(ticket.ticket_id, comment="First update")
+    updated = backend.update_ticket(ticket.ticket_id, status="in-progress", log_message="picked up")
+
+    assert updated.status == "in-progress"
+    assert "First update" in updated.body
+    entries = backend.tail_ticket_changelog(ticket.ticket_id, limit=2)
+    assert entries[0].endswith("status todo -> in-progress")
+    assert entries[1].endswith("note: picked up")
+    assert updated.documents[-1].startswith("Change Log:")
+
+
+def test_list_tickets_query_filters_by_status_tag_and_text(tmp_path: os.PathLike[str]) -> None:
+    backend = SqliteBackend(root=str(tmp_path))
+    backend.create_ticket(subject="Fix login", body="OAuth callback fails", tags=["auth"], status="todo")
+    backend.create_ticket(subject="Write docs", body="Explain OAuth setup", tags=["docs"], status="done")
+    backend.create_ticket(subject="Tune cache", body="Latency", tags=["perf"], status="todo")
+
+    def subjects(**kwargs):  # type: ignore[no-untyped-def]
+        return [ticket.subject for ticket in backend.list_tickets(query=TicketQuery(**kwargs))]
+
+    assert subjects(statuses=["todo"], sort="subject") == ["Fix login", "Tune cache"]
+    assert subjects(tags=["docs"]) == ["Write docs"]
+    assert subjects(text="oauth", sort="subject") == ["Fix login", "Write docs"]
+    assert subjects(text="oauth", statuses=["todo"]) == ["Fix login"]
+    assert subjects(sort="status", limit=1, offset=1) == ["Tune cache"]
+
+
+@pytest.mark.parametrize("backend_name", ["local", "sqlite"])
+def test_text_query_is_a_case_insensitive_substring_match(tmp_path: os.PathLike[str], backend_name: str) -> None:
+    backend = get_backend(backend_name, str(tmp_path))
+    backend.create_ticket(subject="Refactor tokenizer", body="fix the parser")
+    backend.create_ticket(subject="Unrelated", body="Nothing here")
+
+    for text in ("token", "parse", "Refactor tok", "KENIZER", "he pa", "r t"):
+        assert [ticket.subject for ticket in backend.list_tickets(query=TicketQuery(text=text))] == [
+            "Refactor tokenizer"
+        ], text
+    assert backend.list_tickets(query=TicketQuery(text="tokens")) == []
+
+
+def test_import_export_round_trip(tmp_path: os.PathLike[str]) -> None:
+    source = TicketStore(root=Path(tmp_path) / "source")
+    original = source.create_ticket(subject="Imported", body="Body", tags=["a"], status="todo")
+    source.update_ticket(original.ticket_id, comment="Noted")
+
+    backend = SqliteBackend(root=str(Path(tmp_path) / "db"))
+    assert backend.import_tickets(source) == 1
+    assert any("comment added" in entry for entry in backend.tail_ticket_changelog(original.ticket_id))
+
+    target = TicketStore(root=Path(tmp_path) / "target")
+    assert backend.export_tickets(target) == 1
+    exported = target.get_ticket(original.ticket_id)
+    expected = source.get_ticket(original.ticket_id)
+    assert exported is not None and expected is not None
+    assert exported.subject == expected.subject
+    assert exported.tags == expected.tags
+    assert [doc.strip() for doc in exported.documents] == [doc.strip() for doc in expected.documents]
+
+
+def test_bulk_update_is_one_transaction(tmp_path: os.PathLike[str]) -> None:
+    backend = SqliteBackend(root=str(tmp_path))
+    created = backend.create_tickets([{"subject": "One"}, {"subject": "Two", "status": "todo"}])
+
+    with pytest.raises(FileNotFoundError):
+        backend.update_tickets([{"ticket_id": created[0].ticket_id, "status": "done"}, {"ticket_id": "missing"}])
+    assert backend.get_ticket(created[0].ticket_id).status is None  # type: ignore[union-attr]
+
+    updated = backend.update_tickets([{"ticket_id": ticket.ticket_id, "status": "done"} for ticket in created])
+    assert [ticket.status for ticket in updated] == ["done", "done"]
@@ -4,6 +4,7 @@ import os
 
 import pytest
 
+from tkts.bulk import update_kwargs
 from tkts.models import Ticket
 from tkts.storage import TicketStore
 
@@ -47,3 +48,76 @@ def test_edit_ticket_accepts_prefix(tmp_path: os.PathLike[str], monkeypatch: pyt
     ticket = store.edit_ticket("dead")
 
     assert ticket.ticket_id == "deadbeef"
+
+
+def test_get_ticket_prefix_uses_index_without_globbing(tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    store = TicketStore(root=tmp_path)
+    store.save_ticket(_make_ticket("abc12345", "First"))
+    store.save_ticket(_make_ticket("def67890", "Second"))
+
+    def _no_glob(self, pattern):  # type: ignore[no-untyped-def]
+        raise AssertionError("prefix lookup should not glob the ticket directory")
+
+    monkeypatch.setattr(type(store.ticket_dir()), "glob", _no_glob)
+
+    ticket = TicketStore(root=tmp_path).get_ticket("def")
+
+    assert ticket is not None
+    assert ticket.ticket_id == "def67890"
+
+
+def test_get_ticket_prefix_tracks_external_changes(tmp_path: os.PathLike[str]) -> None:
+    store = TicketStore(root=tmp_path)
+    store.save_ticket(_make_ticket("abc12345", "First"))
+    store.save_ticket(_make_ticket("abc67890", "Second"))
+
+    (store.ticket_dir() / "abc67890.tkt").unlink()
+
+    ticket = store.get_ticket("abc")
+    assert ticket is not None
+    assert ticket.ticket_id == "abc12345"
+
+    external = _make_ticket("abc99999", "External")
+    (store.ticket_dir() / "abc99999.tkt").write_text(external.to_string(), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Multiple tickets match"):
+        store.get_ticket("abc")
+
+
+def test_bulk_create_and_update_flush_index_once(tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    store = TicketStore(root=tmp_path)
+    store.create_ticket(subject="Existing")
+    flushes: list[int] = []
+    index = store.index()
+    original_flush = index.flush
+
+    def _counting_flush() -> None:
+        flushes.append(1)
+        original_flush()
+
+    monkeypatch.setattr(index, "flush", _counting_flush)
+
+    created = store.create_tickets([{"subject": f"Task {idx}", "tags": ["plan"]} for idx in range(5)])
+    assert len(flushes) == 1
+
+    updated = store.update_tickets(
+        [{"ticket_id": ticket.ticket_id[:8], "status": "in-progress", "comment": "go"} for ticket in created]
+    )
+    assert len(flushes) == 2
+    assert [ticket.status for ticket in updated] == ["in-progress"] * 5
+    assert len(store.list_tickets()) == 6
+
+
+def test_bulk_create_rejects_unknown_fields(tmp_path: os.PathLike[str]) -> None:
+    store = TicketStore(root=tmp_path)
+
+    with pytest.raises(ValueError, match="Unknown ticket field"):
+        store.create_tickets([{"subject": "Ok"}, {"subject": "Bad", "priority": "high"}])
+    assert store.list_ids() == []
+
+
+def test_bulk_update_accepts_id_alongside_ticket_id() -> None:
+    assert update_kwargs({"ticket_id": "abc", "id": "abc", "status": "done"}) == ("abc", {"status": "done"})
+    assert update_kwargs({"id": "abc"}) == ("abc", {})
+    with pytest.raises(ValueError, match="different tickets"):
+        update_kwargs({"ticket_id": "abc", "id": "def"})
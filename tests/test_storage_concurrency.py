@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from tkts.storage import TicketConflictError, TicketStore
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_parallel_updates_to_one_ticket_are_not_lost(tmp_path: os.PathLike[str], journal: bool) -> None:
+    store = TicketStore(root=Path(tmp_path), journal=journal)
+    ticket = store.create_ticket(subject="Busy", body="Body")
+
+    def _worker(worker: int) -> None:
+        local = TicketStore(root=Path(tmp_path), journal=journal)
+        for seq in range(5):
+            local.update_ticket(ticket.ticket_id, comment=f"w{worker}-c{seq}")
+
+    threads = [threading.Thread(target=_worker, args=(worker,)) for worker in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    loaded = store.get_ticket(ticket.ticket_id)
+    assert loaded is not None
+    for worker in range(6):
+        for seq in range(5):
+            assert f"w{worker}-c{seq}" in loaded.body
+    assert len(store.tail_ticket_changelog(ticket.ticket_id, limit=100)) == 30
+
+
+def test_update_rejects_stale_expected_updated_at(tmp_path: os.PathLike[str]) -> None:
+    store = TicketStore(root=Path(tmp_path))
+    ticket = store.create_ticket(subject="Versioned", body="Body")
+    seen = ticket.updated_at
+
+    updated = store.update_ticket(ticket.ticket_id, status="in-progress", expected_updated_at=seen)
+    with pytest.raises(TicketConflictError):
+        store.update_ticket(ticket.ticket_id, status="done", expected_updated_at=seen)
+
+    store.update_ticket(ticket.ticket_id, status="done", expected_updated_at=updated.updated_at)
+    assert store.get_ticket(ticket.ticket_id).status == "done"  # type: ignore[union-attr]
+
+
+def test_save_ticket_leaves_no_temp_files(tmp_path: os.PathLike[str]) -> None:
+    store = TicketStore(root=Path(tmp_path))
+    ticket = store.create_ticket(subject="Atomic", body="Body")
+    store.update_ticket(ticket.ticket_id, comment="Again")
+
+    assert sorted(path.name for path in store.ticket_dir().iterdir()) == [f"{ticket.ticket_id}.tkt"]
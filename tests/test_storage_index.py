@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from tkts.index import TicketIndex
+from tkts.models import Ticket
+from tkts.storage import TicketStore
+
+
+def test_save_ticket_records_index_entry(tmp_path: os.PathLike[str]) -> None:
+    store = TicketStore(root=Path(tmp_path))
+    ticket = store.create_ticket(subject="Indexed", body="Body", tags=["a"], status="todo")
+
+    index = TicketIndex.for_root(Path(tmp_path))
+    index.load()
+    entry = index.entries[ticket.ticket_id]
+
+    assert entry.subject == "Indexed"
+    assert entry.status == "todo"
+    assert entry.tags == ["a"]
+
+
+def test_writes_append_to_the_index_log_instead_of_rewriting_it(tmp_path: os.PathLike[str]) -> None:
+    root = Path(tmp_path)
+    store = TicketStore(root=root)
+    first = store.create_ticket(subject="First")
+    snapshot = (root / "index.json").read_text(encoding="utf-8")
+
+    second = store.create_ticket(subject="Second")
+    store.update_ticket(first.ticket_id, status="done")
+
+    # Each write costs a log line or two, not a rewrite of every entry.
+    assert (root / "index.json").read_text(encoding="utf-8") == snapshot
+    assert 2 <= len((root / "index.log").read_text(encoding="utf-8").splitlines()) <= 4
+    index = TicketIndex.for_root(root)
+    index.load()
+    assert index.ids == sorted([first.ticket_id, second.ticket_id])
+    assert (index.entries[first.ticket_id].status, index.entries[second.ticket_id].subject) == ("done", "Second")
+
+    # Once the log outgrows its share of the snapshot it is folded back in.
+    for idx in range(300):
+        store.create_ticket(subject=f"Task {idx}")
+    payload = json.loads((root / "index.json").read_text(encoding="utf-8"))
+    assert len(payload["entries"]) > 250
+    assert len((root / "index.log").read_text(encoding="utf-8").splitlines()) < 50
+    assert len(TicketStore(root=root).list_tickets()) == 302
+
+
+def test_list_tickets_only_reparses_changed_files(tmp_path: os.PathLike[str], monkeypatch) -> None:
+    store = TicketStore(root=Path(tmp_path))
+    first = store.create_ticket(subject="First", body="Body", status="todo")
+    second = store.create_ticket(subject="Second", body="Body", status="todo")
+
+    path = store.ticket_dir() / f"{second.ticket_id}.tkt"
+    edited = Ticket.from_string(path.read_text(encoding="utf-8"))
+    edited.subject = "Second (edited externally)"
+    path.write_text(edited.to_string(), encoding="utf-8")
+
+    parsed: list[str] = []
+    original = TicketStore._read_ticket_headers
+
+    def _tracking(self: TicketStore, ticket_path: Path) -> Ticket:
+        parsed.append(ticket_path.stem)
+        return original(self, ticket_path)
+
+    monkeypatch.setattr(TicketStore, "_read_ticket_headers", _tracking)
+
+    tickets = TicketStore(root=Path(tmp_path)).list_tickets()
+
+    assert parsed == [second.ticket_id]
+    subjects = {ticket.ticket_id: ticket.subject for ticket in tickets}
+    assert subjects == {first.ticket_id: "First", second.ticket_id: "Second (edited externally)"}
+
+
+def test_list_tickets_drops_deleted_files_and_loads_body(tmp_path: os.PathLike[str]) -> None:
+    store = TicketStore(root=Path(tmp_path))
+    keep = store.create_ticket(subject="Keep", body="Kept body")
+    gone = store.create_ticket(subject="Gone", body="Body")
+
+    (store.ticket_dir() / f"{gone.ticket_id}.tkt").unlink()
+
+    tickets = TicketStore(root=Path(tmp_path)).list_tickets()
+
+    assert [ticket.ticket_id for ticket in tickets] == [keep.ticket_id]
+    assert tickets[0].body.strip() == "Kept body"
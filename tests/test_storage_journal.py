@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from tkts.storage import TicketStore, _read_config
+
+
+def _journaled_store(tmp_path: os.PathLike[str]) -> TicketStore:
+    return TicketStore(root=Path(tmp_path), journal=True)
+
+
+def test_comment_appends_to_journal_without_rewriting_ticket(tmp_path: os.PathLike[str]) -> None:
+    store = _journaled_store(tmp_path)
+    ticket = store.create_ticket(subject="Journaled", body="Body", status="todo")
+    path = store.ticket_dir() / f"{ticket.ticket_id}.tkt"
+    before = path.read_bytes()
+
+    store.update_ticket(ticket.ticket_id, comment="First")
+    store.update_ticket(ticket.ticket_id, append_body="Second", log_message="noted")
+
+    assert path.read_bytes() == before
+    assert (store.journal_dir() / f"{ticket.ticket_id}.log").exists()
+
+    loaded = store.get_ticket(ticket.ticket_id)
+    assert loaded is not None
+    assert "Comment (" in loaded.body and "First" in loaded.body
+    assert "Update (" in loaded.body and "Second" in loaded.body
+    entries = store.tail_ticket_changelog(ticket.ticket_id, limit=3)
+    assert [entry.split(" ", 2)[2] for entry in entries] == ["comment added", "body appended", "note: noted"]
+
+
+def test_journaled_update_matches_full_rewrite(tmp_path: os.PathLike[str]) -> None:
+    plain = TicketStore(root=Path(tmp_path) / "plain")
+    journaled = _journaled_store(Path(tmp_path) / "journaled")
+    results = []
+    for store in (plain, journaled):
+        ticket = store.create_ticket(subject="Same", body="Body", status="todo")
+        store.update_ticket(ticket.ticket_id, status="in-progress", comment="Started", log_message="go")
+        loaded = store.get_ticket(ticket.ticket_id)
+        assert loaded is not None
+        results.append((loaded, store.tail_ticket_changelog(ticket.ticket_id)))
+
+    (plain_ticket, plain_log), (journal_ticket, journal_log) = results
+    assert journal_ticket.status == plain_ticket.status == "in-progress"
+    assert len(journal_ticket.documents) == len(plain_ticket.documents)
+    assert [entry.split(" ", 2)[2] for entry in journal_log] == [entry.split(" ", 2)[2] for entry in plain_log]
+
+
+def test_compact_folds_journal_into_ticket(tmp_path: os.PathLike[str]) -> None:
+    store = _journaled_store(tmp_path)
+    ticket = store.create_ticket(subject="Compact", body="Body")
+    store.update_ticket(ticket.ticket_id, comment="Folded")
+
+    compacted = store.compact_ticket(ticket.ticket_id)
+
+    assert not (store.journal_dir() / f"{ticket.ticket_id}.log").exists()
+    raw = (store.ticket_dir() / f"{ticket.ticket_id}.tkt").read_text(encoding="utf-8")
+    assert "Folded" in raw and "comment added" in raw
+    assert store.get_ticket(ticket.ticket_id).body == compacted.body  # type: ignore[union-attr]
+
+
+def test_listing_reflects_journal_updated_at(tmp_path: os.PathLike[str]) -> None:
+    store = _journaled_store(tmp_path)
+    ticket = store.create_ticket(subject="Listed", body="Body")
+    updated = store.update_ticket(ticket.ticket_id, comment="Later")
+
+    listed = TicketStore(root=Path(tmp_path)).list_tickets()
+
+    assert [item.updated_at for item in listed] == [updated.updated_at]
+    assert "Later" in listed[0].body
+
+
+def test_config_enables_journal(tmp_path: os.PathLike[str]) -> None:
+    config_path = Path(tmp_path) / "config"
+    config_path.write_text("journal=yes\n", encoding="utf-8")
+
+    assert _read_config(config_path).journal is True
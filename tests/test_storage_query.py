@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from tkts.query import TicketQuery
+from tkts.storage import TicketStore
+
+
+def _subjects(store: TicketStore, **kwargs) -> list[str]:  # type: ignore[no-untyped-def]
+    return [ticket.subject for ticket in store.list_tickets(query=TicketQuery(**kwargs))]
+
+
+def test_list_tickets_query_filters_on_index(tmp_path: os.PathLike[str]) -> None:
+    store = TicketStore(root=tmp_path)
+    store.create_ticket(subject="Mine", body="Body", assignee="alice", tags=["api"], status="in-progress")
+    store.create_ticket(subject="Theirs", body="Body", assignee="bob", tags=["api"], status="in-progress")
+    store.create_ticket(subject="Backlog", body="Needle in body", assignee="alice", tags=["ui"], status="todo")
+
+    assert _subjects(store, statuses=["in-progress"], assignee="Alice") == ["Mine"]
+    assert _subjects(store, tags=["ui"]) == ["Backlog"]
+    assert _subjects(store, text="needle") == ["Backlog"]
+    assert _subjects(store, sort="status") == ["Backlog", "Mine", "Theirs"]
+    assert _subjects(store, sort="subject", limit=2, offset=1) == ["Mine", "Theirs"]
+
+
+def test_list_tickets_query_updated_since(tmp_path: os.PathLike[str]) -> None:
+    store = TicketStore(root=tmp_path)
+    old = store.create_ticket(subject="Old", body="Body")
+    old.updated_at = "2020-01-01T00:00:00+00:00"
+    store.save_ticket(old)
+    store.create_ticket(subject="New", body="Body")
+
+    assert _subjects(store, updated_since="2024-01-01T00:00:00Z") == ["New"]
+
+
+def test_ticket_query_rejects_unknown_sort() -> None:
+    with pytest.raises(ValueError, match="Unknown sort"):
+        TicketQuery(sort="priority")
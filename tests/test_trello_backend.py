@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import json
 import os
-from typing import Any, Dict, List, Tuple
+import threading
+from email.message import Message
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, unquote
 
 import pytest
 
 from tkts.backends import get_backend_from_env
+from tkts.query import TicketQuery
 from tkts.trello_backend import TrelloBackend
+from tkts.trello.pool import HttpResponse
 from tkts.trello_client import TrelloAmbiguousIdError, TrelloConfigError, TrelloClient
 
 
@@ -17,15 +23,38 @@ def _set_required_env(monkeypatch) -> None:
 
 
 def _install_fake_request(monkeypatch, responses: Dict[Tuple[str, str], Any], calls: List[Tuple[str, str, dict[str, Any]]]) -> None:
-    def fake_request(self: TrelloClient, method: str, path: str, *, params=None, json_body=None) -> Any:
+    def fake_request(method: str, path: str, params: Optional[Mapping[str, Any]]) -> Any:
         calls.append((method.upper(), path, dict(params or {})))
         key = (method.upper(), path)
+        if key == ("GET", "/batch") and key not in responses:
+            results = []
+            for route in (params or {})["urls"].split(","):
+                route_path, _, query = route.partition("?")
+                results.append({"200": fake_request("GET", unquote(route_path), dict(parse_qsl(query)))})
+            return results
         if key not in responses:
             raise AssertionError(f"Unexpected Trello request: {key}")
         value = responses[key]
         return value(params or {})
 
-    monkeypatch.setattr(TrelloClient, "_request", fake_request, raising=True)
+    def fake_send(self: TrelloClient, method: str, path: str, *, params=None, json_body=None, headers=None) -> HttpResponse:
+        return _json_response(fake_request(method, path, params))
+
+    monkeypatch.setattr(TrelloClient, "_send", fake_send, raising=True)
+
+
+def _json_response(payload: Any, *, status: int = 200, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+    message = Message()
+    message["Content-Type"] = "application/json; charset=utf-8"
+    for name, value in (headers or {}).items():
+        message[name] = value
+    return HttpResponse(status=status, headers=message, body=json.dumps(payload).encode("utf-8") if status != 304 else b"")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_root(monkeypatch, tmp_path) -> None:
+    # The board cache persists under the tkts root; keep it per test.
+    monkeypatch.setenv("TKTS_ROOT", str(tmp_path))
 
 
 def test_backend_registration_via_env(monkeypatch) -> None:
@@ -255,6 +284,8 @@ def test_update_ticket_moves_list_and_adds_comments(monkeypatch) -> None:
 
     comment_calls = [call for call in calls if call[0] == "POST" and call[1].endswith("/actions/comments")]
     assert len(comment_calls) == 3
+    assert [path for _, path, _ in calls].count("/boards/board123/cards") == 1
+    assert ("GET", "/cards/c1") not in {(method, path) for method, path, _ in calls}
 
 
 def test_tail_ticket_changelog_returns_chronological(monkeypatch) -> None:
@@ -286,3 +317,275 @@ def test_tail_ticket_changelog_returns_chronological(monkeypatch) -> None:
     entries = backend.tail_ticket_changelog("abc", limit=10)
     assert entries[0].endswith("First")
     assert entries[1].endswith("Second")
+
+
+def test_list_tickets_query_fetches_only_status_lists(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+    _install_fake_request(
+        monkeypatch,
+        responses={
+            ("GET", "/boards/board123/lists"): lambda _: [
+                {"id": "l1", "name": "todo"},
+                {"id": "l2", "name": "in-progress"},
+            ],
+            ("GET", "/boards/board123/labels"): lambda _: [],
+            ("GET", "/boards/board123/members"): lambda _: [{"id": "m1", "username": "alice", "fullName": "Alice"}],
+            ("GET", "/lists/l2/cards"): lambda _: [
+                {"id": "c1", "shortLink": "abc12345", "name": "Mine", "idList": "l2", "labels": [], "members": [{"id": "m1", "username": "alice"}], "dateLastActivity": None, "url": ""},
+                {"id": "c2", "shortLink": "def67890", "name": "Other", "idList": "l2", "labels": [], "members": [], "dateLastActivity": None, "url": ""},
+            ],
+        },
+        calls=calls,
+    )
+
+    backend = TrelloBackend()
+    tickets = backend.list_tickets(query=TicketQuery(statuses=["in-progress"], assignee="alice"))
+
+    assert [ticket.subject for ticket in tickets] == ["Mine"]
+    assert ("GET", "/boards/board123/cards") not in {(method, path) for method, path, _ in calls}
+
+
+def test_bulk_create_loads_board_once_and_creates_labels_once(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("TRELLO_CREATE_MISSING_LABELS", "true")
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+    counter = iter(range(100))
+
+    def post_cards(params: dict[str, Any]) -> dict[str, Any]:
+        idx = next(counter)
+        return {"id": f"c{idx}", "shortLink": f"short{idx:03d}", "name": params["name"], "idList": params["idList"]}
+
+    _install_fake_request(
+        monkeypatch,
+        responses={
+            ("GET", "/boards/board123/lists"): lambda _: [{"id": "l1", "name": "todo"}],
+            ("GET", "/boards/board123/labels"): lambda _: [],
+            ("GET", "/boards/board123/members"): lambda _: [],
+            ("POST", "/labels"): lambda params: {"id": "labx", "name": params["name"]},
+            ("POST", "/cards"): post_cards,
+            **{
+                ("GET", f"/cards/short{idx:03d}"): (lambda params, idx=idx: {"id": f"c{idx}", "shortLink": f"short{idx:03d}", "name": "x", "idList": "l1"})
+                for idx in range(3)
+            },
+        },
+        calls=calls,
+    )
+
+    backend = TrelloBackend()
+    tickets = backend.create_tickets([{"subject": f"T{idx}", "tags": ["plan"]} for idx in range(3)])
+
+    assert sorted(ticket.ticket_id for ticket in tickets) == ["short000", "short001", "short002"]
+    paths = [path for _, path, _ in calls]
+    assert paths.count("/boards/board123/lists") == 1
+    assert paths.count("/labels") == 1
+    assert paths.count("/cards") == 3
+
+
+def test_changed_tickets_follows_board_action_feed(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+    pages = iter(
+        [
+            [{"id": "a1", "type": "createCard", "data": {"card": {"id": "c0", "shortLink": "old00000"}}}],
+            [
+                {"id": "a3", "type": "commentCard", "data": {"card": {"id": "c2", "shortLink": "def67890"}}},
+                {"id": "a2", "type": "updateCard", "data": {"card": {"id": "c1", "shortLink": "abc12345"}}},
+            ],
+            [],
+            [{"id": "a4", "type": "updateList", "data": {"list": {"id": "l1", "name": "renamed"}}}],
+        ]
+    )
+    _install_fake_request(
+        monkeypatch,
+        responses={("GET", "/boards/board123/actions"): lambda _: next(pages)},
+        calls=calls,
+    )
+
+    backend = TrelloBackend()
+    assert backend.changed_tickets(None) == (set(), "a1")
+    assert backend.changed_tickets("a1") == ({"abc12345", "def67890"}, "a3")
+    assert backend.changed_tickets("a3") == (set(), "a3")
+    assert backend.changed_tickets("a3") == (None, "a4")
+    assert [params.get("since") for _, _, params in calls] == [None, "a1", "a3", "a3"]
+
+
+def test_mirror_answers_reads_locally_and_applies_action_deltas(monkeypatch, tmp_path) -> None:
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("TRELLO_MIRROR", "true")
+    monkeypatch.setenv("TRELLO_MIRROR_REFRESH", "0")
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+    cards = {
+        "abc12345": {"id": "c1", "shortLink": "abc12345", "name": "First", "idList": "l1", "labels": [], "members": []},
+        "def67890": {"id": "c2", "shortLink": "def67890", "name": "Second", "idList": "l1", "labels": [], "members": []},
+    }
+    actions = [{"id": "a1", "data": {"card": {"id": "c1", "shortLink": "abc12345"}}}]
+
+    def board_actions(params: dict[str, Any]) -> list[dict[str, Any]]:
+        since = params.get("since")
+        newer = [action for action in actions if not since or action["id"] > since]
+        return newer[: params["limit"]]
+
+    _install_fake_request(
+        monkeypatch,
+        responses={
+            ("GET", "/boards/board123/lists"): lambda _: [{"id": "l1", "name": "todo"}],
+            ("GET", "/boards/board123/labels"): lambda _: [],
+            ("GET", "/boards/board123/members"): lambda _: [],
+            ("GET", "/boards/board123/actions"): board_actions,
+            ("GET", "/boards/board123/cards"): lambda _: list(cards.values()),
+            ("GET", "/cards/def67890"): lambda _: dict(cards["def67890"]),
+        },
+        calls=calls,
+    )
+
+    backend = TrelloBackend(root=str(tmp_path))
+    assert [ticket.subject for ticket in backend.list_tickets()] == ["First", "Second"]
+    assert backend.get_ticket("def").subject == "Second"  # type: ignore[union-attr]
+
+    cards["def67890"]["name"] = "Renamed"
+    actions.insert(0, {"id": "a2", "data": {"card": {"id": "c2", "shortLink": "def67890"}}})
+    assert [ticket.subject for ticket in TrelloBackend(root=str(tmp_path)).list_tickets()] == ["First", "Renamed"]
+
+    paths = [path for _, path, _ in calls]
+    assert paths.count("/boards/board123/cards") == 1
+    assert paths.count("/cards/def67890") == 1
+
+
+def test_batch_get_reads_cards_ten_per_request(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+    batches: list[str] = []
+
+    def batch(params: dict[str, Any]) -> list[Any]:
+        batches.append(params["urls"])
+        results: list[Any] = []
+        for route in params["urls"].split(","):
+            card_id = unquote(route.split("?")[0].rsplit("/", 1)[-1])
+            if card_id == "gone0000":
+                results.append({"name": "NotFoundError", "statusCode": 404})
+            else:
+                results.append({"200": {"id": card_id, "shortLink": card_id, "name": card_id.upper(), "idList": "l1"}})
+        return results
+
+    _install_fake_request(
+        monkeypatch,
+        responses={
+            ("GET", "/boards/board123/lists"): lambda _: [{"id": "l1", "name": "todo"}],
+            ("GET", "/boards/board123/labels"): lambda _: [],
+            ("GET", "/boards/board123/members"): lambda _: [],
+            ("GET", "/batch"): batch,
+        },
+        calls=calls,
+    )
+
+    backend = TrelloBackend()
+    ids = [f"card{idx:04d}" for idx in range(11)] + ["gone0000"]
+    tickets = backend.get_tickets(ids)
+
+    assert [ticket.subject if ticket else None for ticket in tickets] == [ref.upper() for ref in ids[:-1]] + [None]
+    assert len(batches) == 2
+    # Routes are encoded exactly once: commas inside a query are %2C, never double-escaped to %252C.
+    query = "fields=shortLink%2Cname%2Cdesc%2CidList%2Clabels%2CidMembers%2CdateLastActivity%2Curl&members=true&member_fields=username%2CfullName"
+    assert batches[1] == f"/cards/card0010?{query},/cards/gone0000?{query}"
+    assert batches[0].split(",") == [f"/cards/{ref}?{query}" for ref in ids[:10]]
+
+
+def test_tail_ticket_changelog_batches_card_and_actions(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+    _install_fake_request(
+        monkeypatch,
+        responses={
+            ("GET", "/cards/abc12345"): lambda _: {"id": "c1", "shortLink": "abc12345"},
+            ("GET", "/cards/abc12345/actions"): lambda params: [
+                {"date": "2026-04-08T00:00:00.000Z", "memberCreator": {"fullName": "Bob"}, "data": {"text": "Hi"}}
+            ][: int(params["limit"])],
+        },
+        calls=calls,
+    )
+
+    entries = TrelloBackend().tail_ticket_changelog("abc12345", limit=5)
+
+    assert entries == ["[2026-04-08T00:00:00.000Z] Bob: Hi"]
+    assert [path for _, path, _ in calls] == ["/batch", "/cards/abc12345", "/cards/abc12345/actions"]
+
+
+def test_board_cache_persists_and_revalidates_with_etags(monkeypatch, tmp_path) -> None:
+    _set_required_env(monkeypatch)
+    sent: list[tuple[str, dict[str, str]]] = []
+    lists = [{"id": "l1", "name": "todo"}]
+
+    def fake_send(self: TrelloClient, method: str, path: str, *, params=None, json_body=None, headers=None) -> HttpResponse:
+        sent.append((path, dict(headers or {})))
+        kind = path.rsplit("/", 1)[-1]
+        etag = f'"{kind}-{len(lists)}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return _json_response(None, status=304, headers={"ETag": etag})
+        return _json_response(lists if kind == "lists" else [], headers={"ETag": etag})
+
+    monkeypatch.setattr(TrelloClient, "_send", fake_send, raising=True)
+
+    assert TrelloBackend()._list_id_for_status("todo") == "l1"
+    assert len(sent) == 3
+    assert (tmp_path / "trello" / "board123.board.json").exists()
+
+    # A new process within the TTL reads the board from disk.
+    assert TrelloBackend()._list_id_for_status("todo") == "l1"
+    assert len(sent) == 3
+
+    # Past the TTL it revalidates; unchanged resources come back 304 and are reused.
+    monkeypatch.setenv("TRELLO_BOARD_CACHE_TTL", "0.000001")
+    assert TrelloBackend()._list_id_for_status("todo") == "l1"
+    assert [headers.get("If-None-Match") for _, headers in sent[3:]] == ['"lists-1"', '"labels-1"', '"members-1"']
+
+    # A lookup that misses a disk copy refetches before failing.
+    monkeypatch.delenv("TRELLO_BOARD_CACHE_TTL")
+    lists.append({"id": "l2", "name": "in-progress"})
+    assert TrelloBackend()._list_id_for_status("in-progress") == "l2"
+    assert sent[-3][0] == "/boards/board123/lists" and sent[-3][1].get("If-None-Match") == '"lists-1"'
+
+
+def test_update_ticket_writes_concurrently_and_builds_ticket_from_response(monkeypatch) -> None:
+    _set_required_env(monkeypatch)
+    calls: list[tuple[str, str, dict[str, Any]]] = []
+    # The update and the first comment must be in flight together to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    card = {"id": "c1", "shortLink": "abc12345", "name": "Old", "idList": "l1", "labels": [], "members": []}
+    comments: list[str] = []
+
+    def put_card(params: dict[str, Any]) -> dict[str, Any]:
+        barrier.wait()
+        return {**card, "name": params["name"], "idMembers": ["m1"], "dateLastActivity": "2026-04-09T00:00:00.000Z"}
+
+    def post_comment(params: dict[str, Any]) -> dict[str, Any]:
+        if not comments:
+            barrier.wait()
+        comments.append(params["text"])
+        return {"id": f"a{len(comments)}", "date": f"2026-04-0{len(comments)}T00:00:00.000Z"}
+
+    _install_fake_request(
+        monkeypatch,
+        responses={
+            ("GET", "/boards/board123/lists"): lambda _: [{"id": "l1", "name": "todo"}],
+            ("GET", "/boards/board123/labels"): lambda _: [],
+            ("GET", "/boards/board123/members"): lambda _: [{"id": "m1", "username": "alice", "fullName": "Alice"}],
+            ("GET", "/cards/abc12345"): lambda _: dict(card),
+            ("PUT", "/cards/c1"): put_card,
+            ("POST", "/cards/c1/actions/comments"): post_comment,
+        },
+        calls=calls,
+    )
+
+    backend = TrelloBackend()
+    updated = backend.update_ticket("abc12345", subject="New", assignee="alice", append_body="A", comment="B", log_message="C")
+
+    assert (updated.subject, updated.assignee, updated.updated_at) == ("New", "alice", "2026-04-09T00:00:00.000Z")
+    assert comments == ["Append: A", "B", "Log: C"]
+    assert [path for method, path, _ in calls if method == "GET" and path.startswith("/cards")] == ["/cards/abc12345"]
+
+    # Without a PUT the comments are the only activity, so the newest one dates the ticket.
+    comments.clear()
+    barrier = threading.Barrier(1)
+    updated = backend.update_ticket("abc12345", comment="D", log_message="E")
+    assert updated.updated_at == "2026-04-02T00:00:00.000Z"
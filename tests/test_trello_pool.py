@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import pytest
+
+from tkts.trello import client as client_module
+from tkts.trello.client import TrelloClient, TrelloCredentials
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    statuses: List[int] = []
+    drop_after_response = False
+
+    def setup(self) -> None:
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self) -> None:
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = json.dumps({"id": "c1", "path": self.path}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.drop_after_response:
+            # Close without announcing it, like a server timing out an idle keep-alive connection.
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return None
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    _Handler.statuses = []
+    _Handler.drop_after_response = False
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _client(httpd: ThreadingHTTPServer) -> TrelloClient:
+    host, port = httpd.server_address[:2]
+    return TrelloClient(credentials=TrelloCredentials(api_key="k", api_token="t"), base_url=f"http://{host}:{port}/1")
+
+
+def test_requests_reuse_one_connection(server: ThreadingHTTPServer) -> None:
+    client = _client(server)
+
+    for _ in range(5):
+        assert client.get_card("c1", fields="name")["id"] == "c1"
+
+    assert [pool.connections_opened for pool in client._pools.values()] == [1]
+    client.close()
+
+
+def test_stale_connection_is_replaced_transparently(server: ThreadingHTTPServer) -> None:
+    _Handler.drop_after_response = True
+    client = _client(server)
+
+    for _ in range(3):
+        assert client.get_card("c1", fields="name")["path"].startswith("/1/cards/c1?")
+
+    client.close()
+
+
+def test_retryable_status_is_retried_on_the_pool(server: ThreadingHTTPServer, monkeypatch: Any) -> None:
+    sleeps: List[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    _Handler.statuses = [429, 503]
+    client = _client(server)
+
+    assert client.get_card("c1", fields="name")["id"] == "c1"
+    assert len(sleeps) == 2
+    client.close()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import List
+
+from tkts.trello.ratelimit import BACKOFF_CAP_S, TokenBucket, backoff_delay, retry_after
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_bucket_allows_a_burst_then_paces_to_the_rate() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(10, 10.0, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(10)] == [0.0] * 10
+    assert bucket.acquire() == 1.0
+    assert clock.sleeps == [1.0]
+
+
+def test_pause_and_rate_limit_headers_hold_callers() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(10, 10.0, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(5.0)
+    assert bucket.acquire() == 6.0  # the pause, then one token's worth of refill
+
+    bucket = TokenBucket(10, 10.0, clock=clock, sleep=clock.sleep)
+    bucket.observe({"x-rate-limit-api-token-remaining": "0"})
+    assert bucket.acquire() == 1.0
+
+
+def test_retry_after_and_backoff() -> None:
+    assert retry_after({"Retry-After": "3"}) == 3.0
+    assert retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert retry_after({}) is None
+    assert all(0 <= backoff_delay(attempt) <= min(BACKOFF_CAP_S, 0.5 * 2**attempt) for attempt in range(10))
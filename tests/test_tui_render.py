@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+from tkts.ncurses_tui import TuiApp
+from tkts.storage import TicketStore
+
+
+class _FakeScreen:
+    def __init__(self, height: int = 12, width: int = 100) -> None:
+        self.size = (height, width)
+        self.writes: List[Tuple[int, str]] = []
+        self.erases = 0
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.size
+
+    def erase(self) -> None:
+        self.erases += 1
+
+    def move(self, y: int, x: int) -> None:
+        pass
+
+    def clrtoeol(self) -> None:
+        pass
+
+    def addstr(self, y: int, x: int, text: str, *args: Any) -> None:
+        self.writes.append((y, text))
+
+    def refresh(self) -> None:
+        pass
+
+
+def _app(tmp_path: os.PathLike[str], subjects: List[str]) -> TuiApp:
+    store = TicketStore(root=Path(tmp_path))
+    for subject in subjects:
+        store.create_ticket(subject=subject, body=f"{subject} body", status="todo")
+    app = TuiApp(store)
+    app.refresh_tickets()
+    return app
+
+
+def test_render_repaints_only_changed_lines(tmp_path: os.PathLike[str]) -> None:
+    app = _app(tmp_path, ["Alpha", "Beta", "Gamma"])
+    screen = _FakeScreen()
+
+    app._render(screen)  # type: ignore[arg-type]
+    assert screen.erases == 1
+    screen.writes.clear()
+
+    app._render(screen)  # type: ignore[arg-type]
+    assert screen.writes == []
+
+    app._move_selection(1)
+    app._render(screen)  # type: ignore[arg-type]
+    assert sorted(y for y, _ in screen.writes) == [2, 3]
+    assert screen.erases == 1
+
+
+def test_search_narrows_previous_results(tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _app(tmp_path, ["Fix login", "Fix logout", "Write docs", "Tune cache"])
+    app.search_query = "fix"
+    app.apply_filters()
+    assert len(app.rows) == 2
+
+    checked: List[str] = []
+    original = TuiApp._match_search
+
+    def _tracking(self: TuiApp, ticket: Any, needle: str) -> bool:
+        checked.append(ticket.subject)
+        return original(self, ticket, needle)
+
+    monkeypatch.setattr(TuiApp, "_match_search", _tracking)
+    app.search_query = "fix logo"
+    app.apply_filters()
+
+    assert sorted(checked) == ["Fix login", "Fix logout"]
+    assert [row.ticket.subject for row in app.rows] == ["Fix logout"]  # type: ignore[union-attr]
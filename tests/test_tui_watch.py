@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from tkts.ncurses_tui import TuiApp
+from tkts.storage import TicketStore
+from tkts.watch import InotifyWatcher, MtimeWatcher, watch_directories
+
+
+def _watchers(directory: Path) -> list:
+    watchers = [MtimeWatcher([(directory, ".tkt")])]
+    if sys.platform.startswith("linux"):
+        watchers.append(InotifyWatcher([(directory, ".tkt")]))
+    return watchers
+
+
+def test_watchers_report_changed_ticket_ids(tmp_path: os.PathLike[str]) -> None:
+    directory = Path(tmp_path)
+    (directory / "keep.tkt").write_text("a", encoding="utf-8")
+    (directory / "gone.tkt").write_text("a", encoding="utf-8")
+    watchers = _watchers(directory)
+
+    (directory / "new.tkt").write_text("b", encoding="utf-8")
+    (directory / "gone.tkt").unlink()
+    (directory / ".new.tkt.tmp").write_text("ignored", encoding="utf-8")
+
+    for watcher in watchers:
+        assert watcher.poll() == {"new", "gone"}
+        assert watcher.poll() == set()
+        watcher.close()
+
+
+def test_tui_poll_reloads_only_changed_tickets(tmp_path: os.PathLike[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    store = TicketStore(root=Path(tmp_path))
+    first = store.create_ticket(subject="First", status="todo")
+    second = store.create_ticket(subject="Second", status="todo")
+    app = TuiApp(store, watch=1.0)
+    app.refresh_tickets()
+    assert app._watcher is not None
+
+    assert app.poll_changes() is False
+
+    def _no_full_reload(**_kwargs):  # type: ignore[no-untyped-def]
+        raise AssertionError("watch tick should not re-list every ticket")
+
+    monkeypatch.setattr(store, "list_tickets", _no_full_reload)
+    other = TicketStore(root=Path(tmp_path))
+    other.update_ticket(second.ticket_id, subject="Second (changed)", status="in-progress")
+    third = other.create_ticket(subject="Third", status="todo")
+
+    assert app.poll_changes() is True
+    subjects = {row.ticket.ticket_id: row.ticket.subject for row in app.rows if row.ticket}
+    assert subjects == {
+        first.ticket_id: "First",
+        second.ticket_id: "Second (changed)",
+        third.ticket_id: "Third",
+    }
+    assert app.rows[0].ticket.ticket_id == second.ticket_id  # type: ignore[union-attr]
+
+
+def test_watch_directories_falls_back_for_missing_directory(tmp_path: os.PathLike[str]) -> None:
+    watcher = watch_directories([(Path(tmp_path) / "missing", ".tkt")])
+    assert isinstance(watcher, MtimeWatcher)
@@ -1,10 +1,54 @@
-from tkts.api import create_ticket, get_ticket, get_store, list_tickets
+from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-try:
-    __version__ = version("tkts")
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "0.0.0"
+if TYPE_CHECKING:
+    from tkts.api import create_ticket, create_tickets, get_ticket, get_store, list_tickets, update_tickets
+    from tkts.query import TicketQuery
+    from tkts.storage import TicketConflictError
 
-__all__ = ["__version__", "create_ticket", "get_ticket", "get_store", "list_tickets"]
+__all__ = [
+    "__version__",
+    "TicketConflictError",
+    "TicketQuery",
+    "create_ticket",
+    "create_tickets",
+    "get_ticket",
+    "get_store",
+    "list_tickets",
+    "update_tickets",
+]
+
+# `import tkts` runs before every CLI verb; resolve the public API on first use instead.
+_LAZY = {
+    "create_ticket": "tkts.api",
+    "create_tickets": "tkts.api",
+    "get_ticket": "tkts.api",
+    "get_store": "tkts.api",
+    "list_tickets": "tkts.api",
+    "update_tickets": "tkts.api",
+    "TicketQuery": "tkts.query",
+    "TicketConflictError": "tkts.storage",
+}
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("tkts")
+    except PackageNotFoundError:  # pragma: no cover
+        return "0.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value: Any = _version()
+    elif name in _LAZY:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
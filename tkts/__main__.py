@@ -11,11 +11,11 @@ import tempfile
 from typing import List, Optional, Sequence
 
 from tkts.backends import Backend, get_backend_from_env
-from tkts.trello import TrelloError
+from tkts.query import TicketQuery
+from tkts.jira.errors import JiraError
+from tkts.trello.errors import TrelloError
 
 
-_STATUS_ORDER = ["todo", "in-progress", "in-review", "blocked", "done"]
-_STATUS_RANK = {status: idx for idx, status in enumerate(_STATUS_ORDER)}
 _EXEC_PROMPT = (
     "@PRD.md @progress.txt \\\n"
     "  1. Follow @AGENTS.md\n"
@@ -57,9 +57,9 @@ def _parse_args() -> ArgumentParser:
     try:
         from tkts.backends import available_backends
 
-        backend_names = ", ".join(available_backends())
+        backend_names = ", ".join(available_backends(entry_points=False))
     except Exception:
-        backend_names = "local, file, trello"
+        backend_names = "local, file, trello, jira"
 
     parser = ArgumentParser(
         prog="tkts",
@@ -160,6 +160,12 @@ def _parse_args() -> ArgumentParser:
         action="store_true",
         help="Run MCP server in read-only mode (no writes).",
     )
+    parser.add_argument(
+        "--listen",
+        metavar="[HOST:]PORT",
+        default=None,
+        help="MCP only: serve streamable HTTP on HOST:PORT (default host 127.0.0.1) instead of stdio.",
+    )
     parser.add_argument(
         "--watch",
         nargs="?",
@@ -181,18 +187,10 @@ def _render_list(backend: Backend, *, list_name: Optional[str]) -> int:
         list_name = os.environ.get("TKTS_TRELLO_LIST") or None
         if list_name is not None:
             list_name = list_name.strip() or None
-    tickets = backend.list_tickets(list_name=list_name)
+    tickets = backend.list_tickets(list_name=list_name, query=TicketQuery(sort="status"))
     if not tickets:
         print("No tickets found.")
         return 0
-    tickets = sorted(
-        tickets,
-        key=lambda ticket: (
-            _STATUS_RANK.get(ticket.status or "unknown", len(_STATUS_RANK)),
-            (ticket.subject or "").lower(),
-            ticket.ticket_id,
-        ),
-    )
     for ticket in tickets:
         status = ticket.status or "unknown"
         short_id = ticket.ticket_id[:5]
@@ -403,7 +401,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return _handle_trello(trello_args)
     try:
         backend = get_backend_from_env()
-    except (ValueError, TrelloError) as exc:
+    except (ValueError, TrelloError, JiraError) as exc:
         raise SystemExit(str(exc)) from None
 
     verb = args.verb or "list"
@@ -478,7 +476,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if verb == "mcp":
         from tkts.mcp_server import run_mcp_server
 
-        return run_mcp_server(read_only=args.read_only)
+        return run_mcp_server(read_only=args.read_only, listen=args.listen)
     if verb in {"tui", "ncurses"}:
         try:
             from tkts.ncurses_tui import run_tui
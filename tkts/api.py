@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 
 from tkts.backends import Backend, get_backend, get_backend_from_env
 from tkts.models import Ticket
+from tkts.query import TicketQuery
 
 
 def get_store(root: Optional[str] = None, backend: Optional[str] = None) -> Backend:
@@ -12,9 +13,14 @@ def get_store(root: Optional[str] = None, backend: Optional[str] = None) -> Back
     return get_backend_from_env()
 
 
-def list_tickets(store: Optional[Backend] = None, *, list_name: Optional[str] = None) -> List[Ticket]:
+def list_tickets(
+    store: Optional[Backend] = None,
+    *,
+    list_name: Optional[str] = None,
+    query: Optional[TicketQuery] = None,
+) -> List[Ticket]:
     store = store or get_store()
-    return store.list_tickets(list_name=list_name)
+    return store.list_tickets(list_name=list_name, query=query)
 
 
 def get_ticket(ticket_id: str, store: Optional[Backend] = None) -> Optional[Ticket]:
@@ -32,3 +38,13 @@ def create_ticket(
 ) -> Ticket:
     store = store or get_store()
     return store.create_ticket(subject=subject, body=body, assignee=assignee, tags=tags, status=status)
+
+
+def create_tickets(tickets: Iterable[Mapping[str, Any]], store: Optional[Backend] = None) -> List[Ticket]:
+    store = store or get_store()
+    return store.create_tickets(tickets)
+
+
+def update_tickets(updates: Iterable[Mapping[str, Any]], store: Optional[Backend] = None) -> List[Ticket]:
+    store = store or get_store()
+    return store.update_tickets(updates)
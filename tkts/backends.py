@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import os
+from importlib import import_module
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Protocol
 
 from tkts.models import Ticket
-from tkts.storage import TicketStore, load_config
+from tkts.query import TicketQuery
+from tkts.storage import TicketStore, journal_enabled, load_config
 
 
 class Backend(Protocol):
-    def list_tickets(self, *, list_name: Optional[str] = None) -> List[Ticket]:
+    def list_tickets(
+        self, *, list_name: Optional[str] = None, query: Optional[TicketQuery] = None
+    ) -> List[Ticket]:
         ...
 
     def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
@@ -42,6 +46,12 @@ class Backend(Protocol):
     ) -> Ticket:
         ...
 
+    def create_tickets(self, tickets: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        ...
+
+    def update_tickets(self, updates: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        ...
+
     def tail_ticket_changelog(self, ticket_id: str, limit: int = 10) -> List[str]:
         ...
 
@@ -50,6 +60,15 @@ BackendFactory = Callable[[Optional[str]], Backend]
 
 _BACKENDS: Dict[str, BackendFactory] = {}
 
+# Built-in backends that register themselves on import; loaded only when selected so
+# `tkts new` on the local store never pays for http.client/ssl/sqlite3.
+_LAZY_BACKENDS: Dict[str, str] = {
+    "trello": "tkts.trello.backend",
+    "jira": "tkts.jira.backend",
+    "sqlite": "tkts.sqlite.backend",
+}
+_ENTRY_POINT_GROUP = "tkts.backends"
+
 
 def register_backend(name: str, factory: BackendFactory) -> None:
     key = name.strip().lower()
@@ -58,13 +77,41 @@ def register_backend(name: str, factory: BackendFactory) -> None:
     _BACKENDS[key] = factory
 
 
-def available_backends() -> List[str]:
-    return sorted(_BACKENDS.keys())
+def _entry_points() -> List[Any]:
+    from importlib.metadata import entry_points
+
+    try:
+        return list(entry_points(group=_ENTRY_POINT_GROUP))
+    except Exception:
+        return []
+
+
+def _load_backend(key: str) -> Optional[BackendFactory]:
+    module = _LAZY_BACKENDS.get(key)
+    if module:
+        import_module(module)
+        return _BACKENDS.get(key)
+    for entry in _entry_points():
+        if entry.name.strip().lower() == key:
+            # An entry point names either the factory itself or a module that calls register_backend.
+            loaded = entry.load()
+            if key not in _BACKENDS and callable(loaded):
+                register_backend(key, loaded)
+            return _BACKENDS.get(key)
+    return None
+
+
+def available_backends(*, entry_points: bool = True) -> List[str]:
+    """Registered and built-in backend names; ``entry_points=False`` skips the (slow) installed-plugin scan."""
+    names = set(_BACKENDS) | set(_LAZY_BACKENDS)
+    if entry_points:
+        names.update(entry.name.strip().lower() for entry in _entry_points())
+    return sorted(names)
 
 
 def get_backend(name: Optional[str] = None, root: Optional[str] = None) -> Backend:
     key = (name or "local").strip().lower()
-    factory = _BACKENDS.get(key)
+    factory = _BACKENDS.get(key) or _load_backend(key)
     if not factory:
         raise ValueError(f"Unknown backend: {name}")
     return factory(root)
@@ -79,14 +126,10 @@ def get_backend_from_env(start: Optional[Path] = None) -> Backend:
 
 def _local_backend(root: Optional[str]) -> Backend:
     if root:
-        return TicketStore(Path(root).expanduser())
+        return TicketStore(Path(root).expanduser(), journal=journal_enabled())
     return TicketStore.from_env()
 
 
 register_backend("local", _local_backend)
 register_backend("file", _local_backend)
 
-try:
-    import tkts.trello.backend  # noqa: F401
-except Exception:
-    pass
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Tuple
+
+
+CREATE_FIELDS = ("subject", "body", "assignee", "tags", "status")
+UPDATE_FIELDS = ("subject", "body", "assignee", "tags", "status", "append_body", "comment", "log_message")
+
+
+def _check_fields(spec: Mapping[str, Any], allowed: Tuple[str, ...]) -> None:
+    unknown = sorted(key for key in spec if key not in allowed)
+    if unknown:
+        raise ValueError(f"Unknown ticket field(s): {', '.join(unknown)}.")
+
+
+def create_kwargs(spec: Mapping[str, Any]) -> Dict[str, Any]:
+    _check_fields(spec, CREATE_FIELDS)
+    subject = str(spec.get("subject") or "").strip()
+    if not subject:
+        raise ValueError("subject is required for every ticket.")
+    tags = spec.get("tags")
+    return {
+        "subject": subject,
+        "body": str(spec.get("body") or ""),
+        "assignee": spec.get("assignee") or None,
+        "tags": list(tags) if tags is not None else None,
+        "status": spec.get("status") or None,
+    }
+
+
+def update_kwargs(spec: Mapping[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    fields = dict(spec)
+    # `id` is accepted as an alias; pop both so neither is left behind as an unknown field.
+    primary = str(fields.pop("ticket_id", None) or "").strip()
+    alias = str(fields.pop("id", None) or "").strip()
+    if primary and alias and primary != alias:
+        raise ValueError(f"ticket_id '{primary}' and id '{alias}' name different tickets.")
+    ticket_id = primary or alias
+    if not ticket_id:
+        raise ValueError("ticket_id is required for every update.")
+    _check_fields(fields, UPDATE_FIELDS)
+    if fields.get("tags") is not None:
+        fields["tags"] = list(fields["tags"])
+    return ticket_id, fields
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from tkts.locking import atomic_write_text
+from tkts.models import Ticket
+
+
+_INDEX_VERSION = 1
+_INDEX_FILENAME = "index.json"
+# Writes append their changes to index.log; the snapshot is only rewritten once the log outgrows this share of it.
+_LOG_COMPACT_RATIO = 4
+_LOG_COMPACT_MIN = 256
+
+
+@dataclass
+class IndexEntry:
+    ticket_id: str
+    subject: str = ""
+    status: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    assignee: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    extra_headers: Dict[str, str] = field(default_factory=dict)
+    mtime_ns: int = 0
+    size: int = 0
+    journal_mtime_ns: int = 0
+    journal_size: int = 0
+
+    @classmethod
+    def from_ticket(
+        cls, ticket: Ticket, stat: os.stat_result, journal_stat: Optional[os.stat_result] = None
+    ) -> "IndexEntry":
+        return cls(
+            ticket_id=ticket.ticket_id,
+            subject=ticket.subject,
+            status=ticket.status,
+            tags=list(ticket.tags),
+            assignee=ticket.assignee,
+            created_at=ticket.created_at,
+            updated_at=ticket.updated_at,
+            extra_headers=dict(ticket.extra_headers),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            journal_mtime_ns=journal_stat.st_mtime_ns if journal_stat else 0,
+            journal_size=journal_stat.st_size if journal_stat else 0,
+        )
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "IndexEntry":
+        return cls(
+            ticket_id=str(payload["ticket_id"]),
+            subject=str(payload.get("subject") or ""),
+            status=payload.get("status"),
+            tags=list(payload.get("tags") or []),
+            assignee=payload.get("assignee"),
+            created_at=payload.get("created_at"),
+            updated_at=payload.get("updated_at"),
+            extra_headers=dict(payload.get("extra_headers") or {}),
+            mtime_ns=int(payload.get("mtime_ns") or 0),
+            size=int(payload.get("size") or 0),
+            journal_mtime_ns=int(payload.get("journal_mtime_ns") or 0),
+            journal_size=int(payload.get("journal_size") or 0),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Hand-written: dataclasses.asdict deep-copies every field, which dominates large index writes.
+        return {
+            "ticket_id": self.ticket_id,
+            "subject": self.subject,
+            "status": self.status,
+            "tags": self.tags,
+            "assignee": self.assignee,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "extra_headers": self.extra_headers,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "journal_mtime_ns": self.journal_mtime_ns,
+            "journal_size": self.journal_size,
+        }
+
+    def is_current(self, stat: os.stat_result, journal_stat: Optional[os.stat_result] = None) -> bool:
+        if self.mtime_ns != stat.st_mtime_ns or self.size != stat.st_size:
+            return False
+        if journal_stat is None:
+            return self.journal_size == 0 and self.journal_mtime_ns == 0
+        return self.journal_mtime_ns == journal_stat.st_mtime_ns and self.journal_size == journal_stat.st_size
+
+
+class TicketIndex:
+    """Header index of a store: a JSON snapshot plus an append-only log of the writes made since.
+
+    Every entry is checked against the file's stat before use, so a lost or stale record only costs a reparse.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.log_path = path.with_suffix(".log")
+        self.entries: Dict[str, IndexEntry] = {}
+        self.ids: List[str] = []
+        self.dir_mtime_ns = 0
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+        # Changes since the last flush; None / False mark a dropped entry / id.
+        self._pending_entries: Dict[str, Optional[IndexEntry]] = {}
+        self._pending_ids: Dict[str, bool] = {}
+        self._rewrite = False
+        # Log lines only count against the snapshot they were written for.
+        self._log_id: Optional[str] = None
+        self._log_records = 0
+
+    @classmethod
+    def for_root(cls, root: Path) -> "TicketIndex":
+        return cls(root / _INDEX_FILENAME)
+
+    def load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return
+            if not isinstance(payload, dict) or payload.get("version") != _INDEX_VERSION:
+                return
+            ids = payload.get("ids")
+            if isinstance(ids, list):
+                self.ids = sorted(str(file_id) for file_id in ids)
+                self.dir_mtime_ns = int(payload.get("dir_mtime_ns") or 0)
+            entries = payload.get("entries")
+            if isinstance(entries, dict):
+                for file_id, raw in entries.items():
+                    try:
+                        self.entries[str(file_id)] = IndexEntry.from_dict(raw)
+                    except (KeyError, TypeError, ValueError):
+                        continue
+            self._log_id = payload.get("log") if isinstance(payload.get("log"), str) else None
+            if self._log_id is not None:
+                self._replay_log()
+
+    def _replay_log(self) -> None:
+        try:
+            lines = self.log_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # a write cut short
+            if not isinstance(record, dict) or record.get("log") != self._log_id:
+                continue
+            self._log_records += 1
+            for file_id, present in (record.get("ids") or {}).items():
+                position = bisect.bisect_left(self.ids, file_id)
+                listed = position < len(self.ids) and self.ids[position] == file_id
+                if present and not listed:
+                    self.ids.insert(position, file_id)
+                elif not present and listed:
+                    del self.ids[position]
+            for file_id, raw in (record.get("entries") or {}).items():
+                if raw is None:
+                    self.entries.pop(file_id, None)
+                    continue
+                try:
+                    self.entries[file_id] = IndexEntry.from_dict(raw)
+                except (KeyError, TypeError, ValueError):
+                    self.entries.pop(file_id, None)
+            if "dir_mtime_ns" in record:
+                self.dir_mtime_ns = int(record.get("dir_mtime_ns") or 0)
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            compact_at = max(_LOG_COMPACT_MIN, len(self.entries) // _LOG_COMPACT_RATIO)
+            if self._rewrite or self._log_id is None or self._log_records >= compact_at:
+                self._write_snapshot()
+            else:
+                self._append_log()
+            self._pending_entries.clear()
+            self._pending_ids.clear()
+            self._rewrite = False
+            self._dirty = False
+
+    def _write_snapshot(self) -> None:
+        self._log_id = os.urandom(8).hex()
+        payload = {
+            "version": _INDEX_VERSION,
+            "log": self._log_id,
+            "dir_mtime_ns": self.dir_mtime_ns,
+            "ids": self.ids,
+            "entries": {file_id: entry.to_dict() for file_id, entry in sorted(self.entries.items())},
+        }
+        atomic_write_text(self.path, json.dumps(payload, ensure_ascii=True), fsync=False)
+        self._log_records = 0
+        try:
+            self.log_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _append_log(self) -> None:
+        record = {
+            "log": self._log_id,
+            "dir_mtime_ns": self.dir_mtime_ns,
+            "ids": self._pending_ids,
+            "entries": {
+                file_id: entry.to_dict() if entry is not None else None
+                for file_id, entry in self._pending_entries.items()
+            },
+        }
+        # One short append per write; O_APPEND keeps concurrent writers' lines whole.
+        with self.log_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, ensure_ascii=True) + "\n")
+        self._log_records += 1
+
+    def record(
+        self,
+        file_id: str,
+        ticket: Ticket,
+        stat: os.stat_result,
+        journal_stat: Optional[os.stat_result] = None,
+    ) -> IndexEntry:
+        self.load()
+        entry = IndexEntry.from_ticket(ticket, stat, journal_stat)
+        with self._lock:
+            self.entries[file_id] = entry
+            self._pending_entries[file_id] = entry
+            self._dirty = True
+        return entry
+
+    def add_id(self, file_id: str, *, dir_mtime_before: int, dir_mtime_after: int) -> None:
+        with self._lock:
+            self.load()
+            position = bisect.bisect_left(self.ids, file_id)
+            if position >= len(self.ids) or self.ids[position] != file_id:
+                self.ids.insert(position, file_id)
+                self._pending_ids[file_id] = True
+                self._dirty = True
+            # Atomic replaces touch the directory too; only trust our own change.
+            if self.dir_mtime_ns == dir_mtime_before and dir_mtime_after != dir_mtime_before:
+                self.dir_mtime_ns = dir_mtime_after
+                self._dirty = True
+
+    def sync_ids(self, directory: Path, *, force: bool = False) -> None:
+        self.load()
+        try:
+            dir_mtime_ns = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime_ns = 0
+        if not force and dir_mtime_ns and dir_mtime_ns == self.dir_mtime_ns:
+            return
+        ids = sorted(path.stem for path in directory.glob("*.tkt")) if dir_mtime_ns else []
+        self._set_ids(ids, dir_mtime_ns)
+        self.flush()
+
+    def _set_ids(self, ids: List[str], dir_mtime_ns: int) -> None:
+        with self._lock:
+            if ids != self.ids or dir_mtime_ns != self.dir_mtime_ns:
+                self.ids = ids
+                self.dir_mtime_ns = dir_mtime_ns
+                # A rescan already costs O(N); take the chance to fold the log into a new snapshot.
+                self._rewrite = True
+                self._dirty = True
+            known = set(ids)
+            for file_id in [file_id for file_id in self.entries if file_id not in known]:
+                self.discard(file_id)
+
+    def prefix_matches(self, prefix: str) -> List[str]:
+        matches: List[str] = []
+        position = bisect.bisect_left(self.ids, prefix)
+        while position < len(self.ids) and self.ids[position].startswith(prefix):
+            matches.append(self.ids[position])
+            position += 1
+        return matches
+
+    def discard(self, file_id: str) -> None:
+        with self._lock:
+            self.load()
+            if self.entries.pop(file_id, None) is not None:
+                self._pending_entries[file_id] = None
+                self._dirty = True
+
+    def refresh(
+        self,
+        directory: Path,
+        parse: Callable[[Path], Ticket],
+        *,
+        journal_dir: Optional[Path] = None,
+        journal_updated_at: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> List[Tuple[str, IndexEntry]]:
+        self.load()
+        seen: Dict[str, os.stat_result] = {}
+        dir_mtime_ns = 0
+        if directory.exists():
+            dir_mtime_ns = directory.stat().st_mtime_ns
+            with os.scandir(directory) as it:
+                for dirent in it:
+                    if not dirent.name.endswith(".tkt") or not dirent.is_file():
+                        continue
+                    seen[dirent.name[: -len(".tkt")]] = dirent.stat()
+
+        journals: Dict[str, os.stat_result] = {}
+        if journal_dir is not None and journal_dir.exists():
+            with os.scandir(journal_dir) as it:
+                for dirent in it:
+                    if dirent.name.endswith(".log") and dirent.is_file():
+                        journals[dirent.name[: -len(".log")]] = dirent.stat()
+
+        self._set_ids(sorted(seen), dir_mtime_ns)
+
+        for file_id, stat in seen.items():
+            self._refresh_entry(directory, file_id, stat, journals.get(file_id), parse, journal_updated_at)
+
+        self.flush()
+        return [(file_id, self.entries[file_id]) for file_id in self.ids if file_id in self.entries]
+
+    def refresh_ids(
+        self,
+        directory: Path,
+        file_ids: Iterable[str],
+        parse: Callable[[Path], Ticket],
+        *,
+        journal_dir: Optional[Path] = None,
+        journal_updated_at: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> Dict[str, Optional[IndexEntry]]:
+        self.load()
+        results: Dict[str, Optional[IndexEntry]] = {}
+        for file_id in file_ids:
+            try:
+                stat = (directory / f"{file_id}.tkt").stat()
+            except FileNotFoundError:
+                with self._lock:
+                    if file_id in self.ids:
+                        self.ids.remove(file_id)
+                        self._pending_ids[file_id] = False
+                        self._dirty = True
+                self.discard(file_id)
+                results[file_id] = None
+                continue
+            journal_stat = None
+            if journal_dir is not None:
+                try:
+                    journal_stat = (journal_dir / f"{file_id}.log").stat()
+                except FileNotFoundError:
+                    pass
+            with self._lock:
+                position = bisect.bisect_left(self.ids, file_id)
+                if position >= len(self.ids) or self.ids[position] != file_id:
+                    self.ids.insert(position, file_id)
+                    self._pending_ids[file_id] = True
+                    self._dirty = True
+            results[file_id] = self._refresh_entry(directory, file_id, stat, journal_stat, parse, journal_updated_at)
+        self.flush()
+        return results
+
+    def _refresh_entry(
+        self,
+        directory: Path,
+        file_id: str,
+        stat: os.stat_result,
+        journal_stat: Optional[os.stat_result],
+        parse: Callable[[Path], Ticket],
+        journal_updated_at: Optional[Callable[[str], Optional[str]]],
+    ) -> Optional[IndexEntry]:
+        entry = self.entries.get(file_id)
+        if entry and entry.is_current(stat, journal_stat):
+            return entry
+        try:
+            ticket = parse(directory / f"{file_id}.tkt")
+        except (OSError, ValueError):
+            return entry
+        if journal_stat is not None and journal_updated_at is not None:
+            ticket.updated_at = journal_updated_at(file_id) or ticket.updated_at
+        return self.record(file_id, ticket, stat, journal_stat)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from tkts.jira.errors import JiraApiError, JiraAuthError, JiraConfigError, JiraError, JiraNotFoundError
+
+if TYPE_CHECKING:
+    from tkts.jira.client import JiraClient, JiraCredentials
+
+__all__ = [
+    "JiraApiError",
+    "JiraAuthError",
+    "JiraClient",
+    "JiraConfigError",
+    "JiraCredentials",
+    "JiraError",
+    "JiraNotFoundError",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Like tkts.trello, keep http.client/ssl out of `import tkts.jira` until a request is made.
+    if name in {"JiraClient", "JiraCredentials"}:
+        from tkts.jira import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
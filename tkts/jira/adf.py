@@ -0,0 +1,93 @@
+"""Atlassian Document Format (the JSON Jira Cloud's v3 API uses for descriptions and comments) to and from text."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+
+def _marked(text: str, marks: List[Dict[str, Any]]) -> str:
+    for mark in marks:
+        kind = mark.get("type")
+        if kind == "strong":
+            text = f"**{text}**"
+        elif kind == "em":
+            text = f"*{text}*"
+        elif kind == "code":
+            text = f"`{text}`"
+        elif kind == "link":
+            href = (mark.get("attrs") or {}).get("href")
+            if href:
+                text = f"[{text}]({href})"
+    return text
+
+
+def _inline(node: Dict[str, Any]) -> str:
+    kind = node.get("type")
+    attrs = node.get("attrs") or {}
+    if kind == "text":
+        return _marked(str(node.get("text") or ""), node.get("marks") or [])
+    if kind == "hardBreak":
+        return "\n"
+    if kind in {"mention", "emoji"}:
+        return str(attrs.get("text") or attrs.get("shortName") or "")
+    if kind in {"inlineCard", "blockCard"}:
+        return str(attrs.get("url") or "")
+    return "".join(_inline(child) for child in node.get("content") or [])
+
+
+def _block(node: Dict[str, Any]) -> str:
+    kind = node.get("type")
+    content = node.get("content") or []
+    attrs = node.get("attrs") or {}
+    if kind == "heading":
+        level = max(1, min(int(attrs.get("level") or 1), 6))
+        return "#" * level + " " + "".join(_inline(child) for child in content)
+    if kind in {"bulletList", "orderedList"}:
+        start = int(attrs.get("order") or 1)
+        items: List[str] = []
+        for idx, item in enumerate(content):
+            prefix = "- " if kind == "bulletList" else f"{start + idx}. "
+            text = "\n".join(_block(child) for child in item.get("content") or [])
+            items.append(prefix + text.replace("\n", "\n" + " " * len(prefix)))
+        return "\n".join(items)
+    if kind == "codeBlock":
+        code = "".join(str(child.get("text") or "") for child in content)
+        return f"```{attrs.get('language') or ''}\n{code}\n```"
+    if kind == "blockquote":
+        inner = "\n\n".join(_block(child) for child in content)
+        return "\n".join(f"> {line}" if line else ">" for line in inner.splitlines())
+    if kind == "rule":
+        return "---"
+    if kind in {"panel", "expand", "layoutSection", "layoutColumn", "table", "tableRow", "tableCell", "tableHeader"}:
+        return "\n\n".join(_block(child) for child in content)
+    return "".join(_inline(child) for child in content) if content else _inline(node)
+
+
+def to_text(value: Any) -> str:
+    """Render an ADF document (or a plain v2 string) as Markdown-ish text."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if not isinstance(value, dict):
+        return ""
+    blocks = [_block(node) for node in value.get("content") or []]
+    return "\n\n".join(block for block in blocks if block)
+
+
+def from_text(text: str) -> Optional[Dict[str, Any]]:
+    """One ADF paragraph per blank-line separated block, with hard breaks for single newlines."""
+    paragraphs: List[Dict[str, Any]] = []
+    for block in text.strip().split("\n\n"):
+        lines = block.strip("\n").split("\n")
+        content: List[Dict[str, Any]] = []
+        for idx, line in enumerate(lines):
+            if idx:
+                content.append({"type": "hardBreak"})
+            if line:
+                content.append({"type": "text", "text": line})
+        if content:
+            paragraphs.append({"type": "paragraph", "content": content})
+    if not paragraphs:
+        return None
+    return {"type": "doc", "version": 1, "content": paragraphs}
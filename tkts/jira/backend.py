@@ -0,0 +1,513 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, TypeVar
+from urllib.parse import urlsplit
+
+from tkts.backends import register_backend
+from tkts.bulk import create_kwargs, update_kwargs
+from tkts.jira import adf
+from tkts.jira.cache import IssueCache
+from tkts.jira.client import DEFAULT_PAGE_SIZE, JiraClient, JiraCredentials
+from tkts.jira.errors import JiraConfigError, JiraNotFoundError
+from tkts.models import LazyTicket, Ticket
+from tkts.query import TicketQuery, apply_query
+from tkts.storage import TicketStore
+
+
+_ALLOWED_STATUSES = {"todo", "in-progress", "in-review", "blocked", "done"}
+# List views only need these; the description is fetched when a ticket's body is read.
+_LIST_FIELDS = ("summary", "status", "assignee", "labels", "created", "updated")
+_ISSUE_FIELDS = _LIST_FIELDS + ("description",)
+_CATEGORY_STATUS = {"new": "todo", "indeterminate": "in-progress", "done": "done"}
+_ASSIGNEE_FIELDS = {"displayName", "emailAddress", "accountId", "name"}
+_KEY_BATCH = 100
+_ORDER_BY = re.compile(r"\border\s+by\b.*$", re.IGNORECASE | re.DOTALL)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _normalize_status(status: Optional[str]) -> Optional[str]:
+    if status is None:
+        return None
+    normalized = status.strip().lower()
+    if not normalized:
+        return None
+    if normalized not in _ALLOWED_STATUSES:
+        allowed = ", ".join(sorted(_ALLOWED_STATUSES))
+        raise ValueError(f"Unknown status '{status}'. Allowed values: {allowed}.")
+    return normalized
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    normalized = raw.strip().lower()
+    if normalized in {"1", "true", "yes", "y", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "n", "off"}:
+        return False
+    return default
+
+
+def _env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    value = raw.strip()
+    return value or default
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = _env_str(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise JiraConfigError(f"{name} must be an integer.") from exc
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = _env_str(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise JiraConfigError(f"{name} must be a number.") from exc
+
+
+def _parse_status_map(raw: Optional[str]) -> Dict[str, str]:
+    """``JIRA_STATUS_MAP``: tkts status -> Jira status name, as a JSON object or ``k:v,k:v``."""
+    if not raw:
+        return {}
+    if raw.startswith("{"):
+        payload = json.loads(raw)
+        if not isinstance(payload, dict):
+            raise JiraConfigError("JIRA_STATUS_MAP must be a JSON object or 'k:v,k:v' string.")
+        pairs = [(key, value) for key, value in payload.items() if isinstance(key, str) and isinstance(value, str)]
+    else:
+        pairs = [tuple(part.split(":", 1)) for part in raw.split(",") if ":" in part]  # type: ignore[misc]
+    mapping: Dict[str, str] = {}
+    for key, value in pairs:
+        normalized = _normalize_status(key)
+        if normalized and value.strip():
+            mapping[normalized] = value.strip()
+    return mapping
+
+
+def _quote_jql(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class JiraBackend:
+    def __init__(self, root: Optional[str] = None) -> None:
+        self._project = _env_str("JIRA_PROJECT")
+        scope = _env_str("JIRA_JQL")
+        if not scope and not self._project:
+            raise JiraConfigError("Missing Jira project: set `JIRA_PROJECT` (or `JIRA_JQL`).")
+        # The scope is combined with other clauses, so any ORDER BY is dropped; searches add their own.
+        self._scope = _ORDER_BY.sub("", scope).strip() if scope else f"project = {_quote_jql(self._project or '')}"
+        self._custom_scope = bool(scope)
+        self._include_done = _env_bool("JIRA_INCLUDE_DONE", False)
+        self._issue_type = _env_str("JIRA_ISSUE_TYPE", "Task") or "Task"
+        self._edit_opens_browser = _env_bool("JIRA_EDIT_OPENS_BROWSER", False)
+        self._status_map = _parse_status_map(_env_str("JIRA_STATUS_MAP"))
+        self._assignee_field = _env_str("JIRA_ASSIGNEE_FIELD", "displayName") or "displayName"
+        if self._assignee_field not in _ASSIGNEE_FIELDS:
+            raise JiraConfigError(f"JIRA_ASSIGNEE_FIELD must be one of: {', '.join(sorted(_ASSIGNEE_FIELDS))}.")
+        self._page_size = max(1, _env_int("JIRA_PAGE_SIZE", DEFAULT_PAGE_SIZE))
+        self._workers = max(1, _env_int("JIRA_WORKERS", 4))
+
+        self._client = JiraClient(credentials=JiraCredentials.from_env(), workers=self._workers)
+        self._users: Dict[str, Dict[str, Any]] = {}
+        self._users_lock = threading.Lock()
+
+        self._cache: Optional[IssueCache] = None
+        self._cache_refresh = max(0.0, _env_float("JIRA_CACHE_REFRESH", 5.0))
+        self._cache_lock = threading.Lock()
+        if _env_bool("JIRA_CACHE", True):
+            base = Path(root).expanduser() if root else TicketStore.from_env().root
+            host = urlsplit(self._client.base_url).netloc or "jira"
+            digest = hashlib.sha1(self._scope.encode("utf-8")).hexdigest()[:12]
+            self._cache = IssueCache(base / "jira" / f"{host}-{digest}.sqlite3")
+
+    @property
+    def _base_jql(self) -> str:
+        """What list views show: the scope, minus finished issues unless JIRA_INCLUDE_DONE."""
+        if self._include_done:
+            return self._scope
+        return f"({self._scope}) AND statusCategory != Done"
+
+    def _in_base(self, issue: Mapping[str, Any]) -> bool:
+        return self._include_done or self._status_category(issue) != "done"
+
+    @staticmethod
+    def _status_category(issue: Mapping[str, Any]) -> str:
+        status = (issue.get("fields") or {}).get("status") or {}
+        return str((status.get("statusCategory") or {}).get("key") or "")
+
+    def _status_from_issue(self, issue: Mapping[str, Any]) -> Optional[str]:
+        status = (issue.get("fields") or {}).get("status") or {}
+        name = str(status.get("name") or "").strip()
+        name_lc = name.lower()
+        for tkts_status, mapped in self._status_map.items():
+            if mapped.lower() == name_lc:
+                return tkts_status
+        if name_lc in _ALLOWED_STATUSES:
+            return name_lc
+        return _CATEGORY_STATUS.get(self._status_category(issue)) or name or None
+
+    def _assignee_from_issue(self, issue: Mapping[str, Any]) -> Optional[str]:
+        assignee = (issue.get("fields") or {}).get("assignee") or {}
+        return str(assignee.get(self._assignee_field) or "") or None
+
+    def _ticket_fields(self, issue: Mapping[str, Any]) -> Dict[str, Any]:
+        fields = issue.get("fields") or {}
+        key = str(issue.get("key") or "")
+        return {
+            "ticket_id": key,
+            "subject": str(fields.get("summary") or ""),
+            "assignee": self._assignee_from_issue(issue),
+            "tags": [str(label) for label in fields.get("labels") or [] if label],
+            "status": self._status_from_issue(issue),
+            "created_at": fields.get("created") or None,
+            "updated_at": fields.get("updated") or None,
+            "extra_headers": {
+                "Jira-Issue-Id": str(issue.get("id") or ""),
+                "Jira-Url": f"{self._client.base_url}/browse/{key}" if key else "",
+            },
+        }
+
+    def _ticket_from_issue(self, issue: Mapping[str, Any]) -> Ticket:
+        fields = issue.get("fields") or {}
+        if "description" in fields:
+            return Ticket(body=adf.to_text(fields.get("description")), **self._ticket_fields(issue))
+        key = str(issue.get("key") or "")
+        return LazyTicket(loader=lambda: self._load_ticket(key), **self._ticket_fields(issue))
+
+    def _load_ticket(self, key: str) -> Ticket:
+        ticket = self.get_ticket(key)
+        if ticket is None:
+            raise JiraNotFoundError(f"Ticket {key} not found.")
+        return ticket
+
+    def _normalize_key(self, ticket_id: str) -> str:
+        key = (ticket_id or "").strip().upper()
+        if key.isdigit() and self._project:
+            return f"{self._project.upper()}-{key}"
+        return key
+
+    def _sync_cache(self, *, force: bool = False) -> None:
+        """Bring the issue cache up to date, at most every JIRA_CACHE_REFRESH seconds.
+
+        An incremental sync asks only for issues updated since the newest cached ``updated`` and, in the same
+        round trip, for the size of the base query; if the merged cache then disagrees with that count
+        (issues deleted or moved out of scope), it falls back to a full resync. Cloud's count is approximate, so
+        a lagging count costs at most an extra resync.
+        """
+        cache = self._cache
+        assert cache is not None
+        with self._cache_lock:
+            if not force and time.time() - cache.synced_at() < self._cache_refresh:
+                return
+            updated = cache.cursor() if cache.scope() == self._base_jql else None
+            if updated is None:
+                cache.replace(self._search(self._base_jql, fields=_LIST_FIELDS), self._base_jql)
+                return
+            # JQL dates have minute precision in the user's time zone, which is the offset Jira reported.
+            since = (updated - timedelta(minutes=1)).strftime("%Y/%m/%d %H:%M")
+            changed_jql = f'({self._scope}) AND updated >= "{since}"'
+            changed, total = self._run_parallel(
+                lambda job: job(),
+                [
+                    lambda: self._search(changed_jql, fields=_LIST_FIELDS),
+                    lambda: self._client.count(self._base_jql),
+                ],
+            )
+            cache.apply(
+                [issue for issue in changed if self._in_base(issue)],
+                [str(issue.get("key") or "") for issue in changed if not self._in_base(issue)],
+            )
+            if total is not None and total != cache.count():
+                cache.replace(self._search(self._base_jql, fields=_LIST_FIELDS), self._base_jql)
+
+    def _cache_written(self, issue: Mapping[str, Any]) -> None:
+        """Put an issue we just wrote into the cache, so readers here and in other processes see it right away.
+
+        Only Jira can tell whether an issue matches a custom ``JIRA_JQL``; when that is the open question
+        (a new issue, or one the cache does not hold) the cache is expired instead, so the next read syncs.
+        """
+        cache = self._cache
+        if cache is None or cache.scope() != self._base_jql:
+            return
+        key = str(issue.get("key") or "")
+        if not self._in_base(issue):
+            cache.remember([], [key])
+        elif self._custom_scope and not cache.contains(key):
+            cache.expire()
+        else:
+            fields = issue.get("fields") or {}
+            cache.remember([{**issue, "fields": {name: fields.get(name) for name in _LIST_FIELDS}}], [])
+
+    def _search(self, jql: str, *, fields: Sequence[str]) -> List[Dict[str, Any]]:
+        return self._client.search(f"{jql} ORDER BY created ASC", fields=fields, page_size=self._page_size)
+
+    def list_tickets(
+        self, *, list_name: Optional[str] = None, query: Optional[TicketQuery] = None
+    ) -> List[Ticket]:
+        if query and query.text:
+            # Text search reads bodies; fetch descriptions with the page instead of one request per ticket.
+            issues = self._search(self._base_jql, fields=_ISSUE_FIELDS)
+        elif self._cache is not None:
+            self._sync_cache()
+            issues = self._cache.issues()
+        else:
+            issues = self._search(self._base_jql, fields=_LIST_FIELDS)
+        if not self._include_done and query and query.statuses and "done" in query.statuses:
+            fields = _ISSUE_FIELDS if query.text else _LIST_FIELDS
+            issues.extend(self._search(f"({self._scope}) AND statusCategory = Done", fields=fields))
+        if list_name:
+            # Jira has no lists; filter by workflow status name instead.
+            wanted = list_name.strip().lower()
+            issues = [
+                issue
+                for issue in issues
+                if str(((issue.get("fields") or {}).get("status") or {}).get("name") or "").lower() == wanted
+            ]
+        tickets = [self._ticket_from_issue(issue) for issue in issues]
+        if not self._include_done and not (query and query.statuses):
+            tickets = [ticket for ticket in tickets if ticket.status != "done"]
+        return apply_query(tickets, query)
+
+    def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
+        issue = self._get_issue(self._normalize_key(ticket_id))
+        return self._ticket_from_issue(issue) if issue is not None else None
+
+    def _get_issue(self, key: str) -> Optional[Dict[str, Any]]:
+        if not key:
+            return None
+        try:
+            return self._client.get_issue(key, fields=_ISSUE_FIELDS)
+        except JiraNotFoundError:
+            return None
+
+    def _read_back(self, key: str) -> Optional[Ticket]:
+        # Jira answers writes with an id at most (edits are 204 No Content), so the result is read back.
+        issue = self._get_issue(key)
+        if issue is None:
+            return None
+        self._cache_written(issue)
+        return self._ticket_from_issue(issue)
+
+    def get_tickets(self, ticket_ids: Sequence[str]) -> List[Optional[Ticket]]:
+        """Bulk ``get_ticket``: one `key in (...)` search per hundred keys instead of a request per issue."""
+        issues = self._issues_by_key(ticket_ids)
+        return [
+            self._ticket_from_issue(issues[key]) if key in issues else None
+            for key in (self._normalize_key(ticket_id) for ticket_id in ticket_ids)
+        ]
+
+    def _issues_by_key(self, ticket_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        keys = [key for key in dict.fromkeys(self._normalize_key(ticket_id) for ticket_id in ticket_ids) if key]
+        batches = [keys[start : start + _KEY_BATCH] for start in range(0, len(keys), _KEY_BATCH)]
+        found: Dict[str, Dict[str, Any]] = {}
+        for issues in self._run_parallel(
+            lambda batch: self._client.search(
+                f"key in ({', '.join(_quote_jql(key) for key in batch)})", fields=_ISSUE_FIELDS
+            ),
+            batches,
+        ):
+            for issue in issues:
+                found[str(issue.get("key") or "").upper()] = issue
+        return found
+
+    def _user_for_assignee(self, assignee: str) -> Dict[str, Any]:
+        needle = assignee.strip().lower()
+        with self._users_lock:
+            cached = self._users.get(needle)
+        if cached is not None:
+            return cached
+        if not self._project:
+            raise JiraConfigError("Assigning tickets requires `JIRA_PROJECT`.")
+        users = self._client.find_assignable_users(self._project, assignee.strip())
+        matches = [
+            user
+            for user in users
+            if any(str(user.get(field) or "").lower() == needle for field in _ASSIGNEE_FIELDS)
+        ]
+        if not matches and len(users) == 1:
+            matches = users
+        if len(matches) != 1:
+            problem = "matched multiple" if matches else "not found among"
+            raise JiraConfigError(f"Assignee '{assignee}' {problem} assignable Jira users.")
+        with self._users_lock:
+            self._users[needle] = matches[0]
+        return matches[0]
+
+    def _assignee_value(self, assignee: Optional[str]) -> Optional[Dict[str, str]]:
+        value = (assignee or "").strip()
+        if not value:
+            return None
+        user = self._user_for_assignee(value)
+        if user.get("accountId"):
+            return {"accountId": str(user["accountId"])}
+        return {"name": str(user.get("name") or value)}
+
+    def _document(self, text: str) -> Any:
+        # v3 takes Atlassian Document Format; v2 (Server/Data Center) takes plain text.
+        if self._client.api_version == "2":
+            return text or None
+        return adf.from_text(text)
+
+    def _transition_to(self, key: str, status: str) -> None:
+        for transition in self._client.get_transitions(key):
+            if self._status_from_issue({"fields": {"status": transition.get("to") or {}}}) == status:
+                self._client.transition_issue(key, str(transition.get("id") or ""))
+                return
+        raise JiraConfigError(f"No Jira transition from the current status of {key} leads to '{status}'.")
+
+    def create_ticket(
+        self,
+        subject: str,
+        body: str = "",
+        assignee: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        status: Optional[str] = None,
+    ) -> Ticket:
+        subject = (subject or "").strip()
+        if not subject:
+            raise ValueError("Subject is required.")
+        status = _normalize_status(status)
+        if not self._project:
+            raise JiraConfigError("Creating tickets requires `JIRA_PROJECT`.")
+        fields: Dict[str, Any] = {
+            "project": {"key": self._project},
+            "summary": subject,
+            "issuetype": {"name": self._issue_type},
+        }
+        if body:
+            fields["description"] = self._document(body)
+        if tags:
+            fields["labels"] = [tag.strip() for tag in tags if tag and tag.strip()]
+        if assignee:
+            fields["assignee"] = self._assignee_value(assignee)
+        key = str(self._client.create_issue(fields).get("key") or "")
+        ticket = self._read_back(key)
+        if ticket is None:
+            raise JiraNotFoundError(f"Created issue {key} could not be read back.")
+        if status and ticket.status != status:
+            self._transition_to(key, status)
+            ticket = self._read_back(key) or ticket
+        return ticket
+
+    def edit_ticket(self, ticket_id: str) -> Ticket:
+        ticket = self.get_ticket(ticket_id)
+        if not ticket:
+            raise JiraNotFoundError(f"Ticket {ticket_id} not found.")
+        url = ticket.extra_headers.get("Jira-Url")
+        if self._edit_opens_browser and url:
+            webbrowser.open(url)
+        return ticket
+
+    def update_ticket(
+        self,
+        ticket_id: str,
+        subject: Optional[str] = None,
+        body: Optional[str] = None,
+        assignee: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        append_body: Optional[str] = None,
+        comment: Optional[str] = None,
+        log_message: Optional[str] = None,
+    ) -> Ticket:
+        key = self._normalize_key(ticket_id)
+        if not key:
+            raise JiraNotFoundError(f"Ticket {ticket_id} not found.")
+        status = _normalize_status(status)
+        fields: Dict[str, Any] = {}
+        if subject is not None:
+            fields["summary"] = subject
+        if body is not None:
+            fields["description"] = self._document(body)
+        if assignee is not None:
+            fields["assignee"] = self._assignee_value(assignee)
+        if tags is not None:
+            fields["labels"] = [tag.strip() for tag in tags if tag and tag.strip()]
+        comments = [
+            text
+            for text in (
+                f"Append: {append_body}" if append_body else None,
+                comment or None,
+                f"Log: {log_message}" if log_message else None,
+            )
+            if text
+        ]
+
+        def post_comments() -> None:
+            # Sequential, so Append/comment/Log land on the issue in that order.
+            for text in comments:
+                self._client.add_comment(key, self._document(text))
+
+        # The field edit, the transition and the comments are independent requests.
+        writes: List[Callable[[], Any]] = [post_comments] if comments else []
+        if fields:
+            writes.insert(0, lambda: self._client.update_issue(key, fields))
+        if status:
+            writes.append(lambda: self._transition_to(key, status))
+        self._run_parallel(lambda write: write(), writes)
+        ticket = self._read_back(key)
+        if ticket is None:
+            raise JiraNotFoundError(f"Ticket {ticket_id} not found.")
+        return ticket
+
+    def create_tickets(self, tickets: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        specs = [create_kwargs(spec) for spec in tickets]
+        return self._run_parallel(lambda spec: self.create_ticket(**spec), specs)
+
+    def update_tickets(self, updates: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        specs = [update_kwargs(spec) for spec in updates]
+        return self._run_parallel(lambda item: self.update_ticket(item[0], **item[1]), specs)
+
+    def _run_parallel(self, func: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        workers = min(self._workers, len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    def tail_ticket_changelog(self, ticket_id: str, limit: int = 10) -> List[str]:
+        key = self._normalize_key(ticket_id)
+        if limit <= 0:
+            return []
+        try:
+            comments = self._client.list_comments(key, limit=limit)
+        except JiraNotFoundError:
+            raise JiraNotFoundError(f"Ticket {ticket_id} not found.") from None
+        lines: List[str] = []
+        for comment in reversed(comments):
+            author = comment.get("author") or {}
+            name = str(author.get("displayName") or author.get("name") or "unknown")
+            text = adf.to_text(comment.get("body"))
+            lines.append(f"[{comment.get('created') or ''}] {name}: {text}")
+        return lines
+
+
+def _jira_backend_factory(root: Optional[str]) -> JiraBackend:
+    return JiraBackend(root=root)
+
+
+register_backend("jira", _jira_backend_factory)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+# Bump when the layout changes; older cache files are dropped and rebuilt by the next full sync.
+_SCHEMA_VERSION = 2
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_updated ON issues(updated);
+CREATE INDEX IF NOT EXISTS issues_created ON issues(created);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _parse_time(raw: str) -> Optional[datetime]:
+    # Jira writes offsets without a colon (2026-04-08T10:00:00.000+0200), which fromisoformat rejects before 3.11.
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(raw, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _timestamp(raw: str) -> float:
+    value = _parse_time(raw)
+    return value.timestamp() if value else 0.0
+
+
+def _epoch(issue: Dict[str, Any], field: str) -> float:
+    return _timestamp(str((issue.get("fields") or {}).get(field) or ""))
+
+
+class IssueCache:
+    """Issues matching one JQL scope in a local SQLite file, keyed by issue key and ``updated``."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS issues; DROP TABLE IF EXISTS meta;")
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def scope(self) -> Optional[str]:
+        with self._lock:
+            return self._meta("scope")
+
+    def synced_at(self) -> float:
+        with self._lock:
+            return float(self._meta("synced_at") or 0.0)
+
+    def cursor(self) -> Optional[datetime]:
+        """The newest ``updated`` a sync has seen; incremental syncs ask Jira for anything since."""
+        with self._lock:
+            raw = self._meta("cursor")
+        return _parse_time(raw) if raw else None
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return self._connect().execute("SELECT 1 FROM issues WHERE key = ?", (key,)).fetchone() is not None
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._connect().execute("SELECT COUNT(*) FROM issues").fetchone()[0])
+
+    def _commit(
+        self,
+        *,
+        issues: Iterable[Dict[str, Any]] = (),
+        removed: Sequence[str] = (),
+        scope: Optional[str] = None,
+        replace: bool = False,
+        synced: bool = True,
+    ) -> None:
+        issues = list(issues)
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if replace:
+                    conn.execute("DELETE FROM issues")
+                for key in removed:
+                    conn.execute("DELETE FROM issues WHERE key = ?", (key,))
+                for issue in issues:
+                    key = str(issue.get("key") or "")
+                    if not key:
+                        continue
+                    # Never let an older copy (e.g. a page fetched before a concurrent edit) replace a newer one.
+                    conn.execute(
+                        "INSERT INTO issues (key, created, updated, data) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET updated = excluded.updated, data = excluded.data "
+                        "WHERE excluded.updated >= issues.updated",
+                        (key, _epoch(issue, "created"), _epoch(issue, "updated"), json.dumps(issue)),
+                    )
+                if scope is not None:
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('scope', ?)", (scope,))
+                if synced:
+                    self._advance(issues, reset=replace)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _advance(self, issues: Sequence[Dict[str, Any]], *, reset: bool) -> None:
+        conn = self._connect()
+        cursor = None if reset else self._meta("cursor")
+        newest = max(issues, key=lambda issue: _epoch(issue, "updated"), default=None)
+        if newest is not None and (cursor is None or _epoch(newest, "updated") > _timestamp(cursor)):
+            cursor = str((newest.get("fields") or {}).get("updated") or "") or cursor
+        if cursor is not None:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('cursor', ?)", (cursor,))
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_at', ?)", (repr(time.time()),))
+
+    def replace(self, issues: Sequence[Dict[str, Any]], scope: str) -> None:
+        self._commit(issues=issues, scope=scope, replace=True)
+
+    def apply(self, issues: Sequence[Dict[str, Any]], removed: Sequence[str]) -> None:
+        self._commit(issues=issues, removed=removed)
+
+    def remember(self, issues: Sequence[Dict[str, Any]], removed: Sequence[str]) -> None:
+        """Write our own edits through without counting as a sync: neither the cursor nor ``synced_at`` move,
+        so the next incremental sync still covers everyone else's changes since the last one."""
+        self._commit(issues=issues, removed=removed, synced=False)
+
+    def expire(self) -> None:
+        """Make the next read sync, whatever JIRA_CACHE_REFRESH says."""
+        with self._lock:
+            self._connect().execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_at', '0.0')")
+
+    def issues(self) -> List[Dict[str, Any]]:
+        """Cached issues oldest first, the order uncached searches use (``ORDER BY created ASC``)."""
+        with self._lock:
+            rows = self._connect().execute("SELECT data FROM issues ORDER BY created, key").fetchall()
+        return [json.loads(data) for (data,) in rows]
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import base64
+import http.client
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import quote, urlencode, urljoin, urlsplit
+
+from tkts.jira.errors import JiraApiError, JiraAuthError, JiraConfigError, JiraNotFoundError
+from tkts.trello.pool import ConnectionPool, HttpResponse
+from tkts.trello.ratelimit import backoff_delay, retry_after
+
+
+def _env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    value = raw.strip()
+    return value or default
+
+
+# Jira Cloud caps search pages at 100 issues whatever maxResults asks for.
+DEFAULT_PAGE_SIZE = 100
+
+
+def _error_detail(body: bytes) -> str:
+    # Jira explains 400s (bad JQL, unknown field, invalid label) in errorMessages / errors.
+    try:
+        payload = json.loads(body.decode("utf-8"))
+    except ValueError:
+        return ""
+    if not isinstance(payload, dict):
+        return ""
+    messages = [str(message) for message in payload.get("errorMessages") or []]
+    messages.extend(f"{field}: {message}" for field, message in (payload.get("errors") or {}).items())
+    return " ".join(messages)
+
+
+def _dedupe(pages: Sequence[Sequence[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    # Pages are windows onto a live result set; an issue edited mid-scan can appear twice.
+    issues: List[Dict[str, Any]] = []
+    seen: set[str] = set()
+    for page in pages:
+        for issue in page:
+            key = str(issue.get("key") or "")
+            if key not in seen:
+                seen.add(key)
+                issues.append(issue)
+    return issues
+
+
+@dataclass(frozen=True)
+class JiraCredentials:
+    email: Optional[str] = None
+    api_token: Optional[str] = None
+    personal_token: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> JiraCredentials:
+        personal_token = _env_str("JIRA_PERSONAL_TOKEN")
+        if personal_token:
+            return cls(personal_token=personal_token)
+        email = _env_str("JIRA_EMAIL")
+        api_token = _env_str("JIRA_API_TOKEN")
+        missing: list[str] = []
+        if not email:
+            missing.append("JIRA_EMAIL")
+        if not api_token:
+            missing.append("JIRA_API_TOKEN")
+        if missing:
+            raise JiraConfigError(
+                f"Missing Jira credentials: {', '.join(missing)} (or `JIRA_PERSONAL_TOKEN` for Jira Server/Data Center)."
+            )
+        return cls(email=email, api_token=api_token)
+
+    def authorization(self) -> str:
+        if self.personal_token:
+            return f"Bearer {self.personal_token}"
+        raw = f"{self.email}:{self.api_token}".encode("utf-8")
+        return "Basic " + base64.b64encode(raw).decode("ascii")
+
+
+class JiraClient:
+    def __init__(
+        self,
+        *,
+        credentials: JiraCredentials,
+        base_url: Optional[str] = None,
+        api_version: Optional[str] = None,
+        timeout_s: float = 10.0,
+        max_retries: int = 3,
+        workers: int = 4,
+    ) -> None:
+        base_url = base_url or _env_str("JIRA_BASE_URL")
+        if not base_url:
+            raise JiraConfigError("Missing Jira site: `JIRA_BASE_URL` (e.g. https://example.atlassian.net).")
+        self._authorization = credentials.authorization()
+        self._base_url = base_url.rstrip("/") + "/"
+        self.api_version = api_version or _env_str("JIRA_API_VERSION", "3") or "3"
+        self._timeout_s = timeout_s
+        self._max_retries = max(0, int(max_retries))
+        self._workers = max(1, int(workers))
+        self._pools: Dict[Tuple[str, str], ConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url.rstrip("/")
+
+    def _pool(self, scheme: str, host: str) -> ConnectionPool:
+        with self._pools_lock:
+            pool = self._pools.get((scheme, host))
+            if pool is None:
+                pool = ConnectionPool(scheme, host, timeout_s=self._timeout_s, max_idle=max(8, self._workers))
+                self._pools[(scheme, host)] = pool
+            return pool
+
+    def close(self) -> None:
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def _api(self, path: str) -> str:
+        return f"/rest/api/{self.api_version}/{path.lstrip('/')}"
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        json_body: Optional[Any] = None,
+    ) -> Any:
+        resp = self._send(method, path, params=params, json_body=json_body)
+        if not resp.body:
+            return None
+        if "application/json" in resp.headers.get("Content-Type", ""):
+            return json.loads(resp.body.decode("utf-8"))
+        return resp.body.decode("utf-8", errors="replace")
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        json_body: Optional[Any] = None,
+    ) -> HttpResponse:
+        url = urljoin(self._base_url, path.lstrip("/"))
+        query = {k: v for k, v in (params or {}).items() if v is not None}
+        if query:
+            url = f"{url}?{urlencode(query, doseq=True)}"
+
+        body_bytes: Optional[bytes] = None
+        headers = {"Accept": "application/json", "Authorization": self._authorization}
+        if json_body is not None:
+            body_bytes = json.dumps(json_body).encode("utf-8")
+            headers["Content-Type"] = "application/json; charset=utf-8"
+
+        parts = urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        pool = self._pool(parts.scheme, parts.netloc)
+
+        attempts = self._max_retries + 1
+        last_error: Exception | None = None
+        for attempt in range(attempts):
+            try:
+                resp = pool.request(method.upper(), target, body=body_bytes, headers=headers)
+            except (OSError, http.client.HTTPException) as exc:
+                if attempt < attempts - 1:
+                    time.sleep(backoff_delay(attempt))
+                    last_error = exc
+                    continue
+                raise JiraApiError("Jira request failed due to a network error.") from exc
+            status = resp.status
+            if status >= 400:
+                safe_context = f"Jira request failed (status={status})."
+                detail = _error_detail(resp.body)
+                if detail:
+                    safe_context = f"{safe_context} {detail}"
+                retryable = status in {429, 500, 502, 503, 504}
+                if retryable and attempt < attempts - 1:
+                    delay = retry_after(resp.headers)
+                    time.sleep(backoff_delay(attempt) if delay is None else delay)
+                    last_error = JiraApiError(safe_context, status=status)
+                    continue
+                if status in {401, 403}:
+                    raise JiraAuthError(f"{safe_context} Check `JIRA_EMAIL` and `JIRA_API_TOKEN`.")
+                if status == 404:
+                    raise JiraNotFoundError("Jira resource not found.")
+                raise JiraApiError(safe_context, status=status)
+            return resp
+
+        if last_error:
+            raise JiraApiError("Jira request failed after retries.") from last_error
+        raise JiraApiError("Jira request failed.")
+
+    @property
+    def token_paging(self) -> bool:
+        # Jira Cloud retired the offset-paged /search for /search/jql, which pages with an opaque token.
+        # Server/Data Center (v2) only has the offset-paged endpoint.
+        return self.api_version != "2"
+
+    def search_page(
+        self,
+        jql: str,
+        *,
+        fields: Sequence[str],
+        start_at: int = 0,
+        max_results: int = DEFAULT_PAGE_SIZE,
+        page_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """One page of ``jql``: by ``page_token`` on /search/jql, by ``start_at`` on the v2 /search."""
+        # POST keeps long JQL (e.g. `key in (...)` for a bulk read) out of the URL.
+        body: Dict[str, Any] = {"jql": jql, "maxResults": max_results, "fields": list(fields)}
+        if self.token_paging:
+            if page_token:
+                body["nextPageToken"] = page_token
+            return self._request("POST", self._api("search/jql"), json_body=body) or {}
+        body.update({"startAt": start_at, "validateQuery": "warn"})
+        return self._request("POST", self._api("search"), json_body=body) or {}
+
+    def search(self, jql: str, *, fields: Sequence[str], page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """Every issue matching ``jql``.
+
+        /search/jql pages are chained by token, so they are read one after another. On v2 the first page
+        reports the total and the remaining pages are requested concurrently, sized by what the server
+        actually returned (it may cap ``maxResults``).
+        """
+        if self.token_paging:
+            pages: List[List[Dict[str, Any]]] = []
+            token: Optional[str] = None
+            while True:
+                page = self.search_page(jql, fields=fields, max_results=page_size, page_token=token)
+                pages.append(list(page.get("issues") or []))
+                token = page.get("nextPageToken")
+                if page.get("isLast", True) or not token or not pages[-1]:
+                    return _dedupe(pages)
+        first = self.search_page(jql, fields=fields, max_results=page_size)
+        issues: List[Dict[str, Any]] = list(first.get("issues") or [])
+        total = first.get("total")
+        stride = len(issues)
+        if total is None or not stride or stride >= int(total):
+            return issues
+        starts = list(range(stride, int(total), stride))
+        workers = min(self._workers, len(starts))
+
+        def offset_page(start: int) -> List[Dict[str, Any]]:
+            return list(self.search_page(jql, fields=fields, start_at=start, max_results=stride).get("issues") or [])
+
+        if workers <= 1:
+            rest = [offset_page(start) for start in starts]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                rest = list(executor.map(offset_page, starts))
+        return _dedupe([issues, *rest])
+
+    def count(self, jql: str) -> Optional[int]:
+        """How many issues match ``jql``; approximate (recent edits may lag) on Jira Cloud."""
+        if self.token_paging:
+            payload = self._request("POST", self._api("search/approximate-count"), json_body={"jql": jql}) or {}
+            total = payload.get("count")
+        else:
+            total = self.search_page(jql, fields=[], max_results=0).get("total")
+        return int(total) if total is not None else None
+
+    def get_issue(self, key: str, *, fields: Sequence[str]) -> Dict[str, Any]:
+        return self._request("GET", self._api(f"issue/{quote(key)}"), params={"fields": ",".join(fields)})
+
+    def create_issue(self, fields: Mapping[str, Any]) -> Dict[str, Any]:
+        return self._request("POST", self._api("issue"), json_body={"fields": dict(fields)}) or {}
+
+    def update_issue(self, key: str, fields: Mapping[str, Any]) -> None:
+        self._request("PUT", self._api(f"issue/{quote(key)}"), json_body={"fields": dict(fields)})
+
+    def get_transitions(self, key: str) -> List[Dict[str, Any]]:
+        payload = self._request("GET", self._api(f"issue/{quote(key)}/transitions")) or {}
+        return list(payload.get("transitions") or [])
+
+    def transition_issue(self, key: str, transition_id: str) -> None:
+        self._request(
+            "POST", self._api(f"issue/{quote(key)}/transitions"), json_body={"transition": {"id": transition_id}}
+        )
+
+    def add_comment(self, key: str, body: Any) -> Dict[str, Any]:
+        return self._request("POST", self._api(f"issue/{quote(key)}/comment"), json_body={"body": body}) or {}
+
+    def list_comments(self, key: str, *, limit: int = 50) -> List[Dict[str, Any]]:
+        """The newest ``limit`` comments, newest first."""
+        payload = self._request(
+            "GET",
+            self._api(f"issue/{quote(key)}/comment"),
+            params={"orderBy": "-created", "maxResults": limit},
+        ) or {}
+        return list(payload.get("comments") or [])
+
+    def find_assignable_users(self, project: str, query: str) -> List[Dict[str, Any]]:
+        # Cloud searches by `query`; Server/Data Center still expects `username`.
+        params: Dict[str, Any] = {"project": project, "query": query}
+        if self.api_version == "2":
+            params["username"] = query
+        return self._request("GET", self._api("user/assignable/search"), params=params) or []
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Optional
+
+
+class JiraError(RuntimeError):
+    pass
+
+
+class JiraConfigError(JiraError):
+    pass
+
+
+class JiraAuthError(JiraError):
+    pass
+
+
+class JiraNotFoundError(JiraError):
+    pass
+
+
+class JiraApiError(JiraError):
+    def __init__(self, message: str, *, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
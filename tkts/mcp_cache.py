@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from tkts.watch import MtimeWatcher, Watcher, watch_directories
+
+
+DEFAULT_TTL = 5.0
+_MTIME_POLL_INTERVAL = 1.0
+
+
+class _WatcherChanges:
+    """Change detection for file-backed stores via ``tkts.watch``."""
+
+    blocking = False
+
+    def __init__(self, watcher: Watcher) -> None:
+        self._watcher = watcher
+        # The portable fallback rescans whole directories, so do it at most once a second.
+        self._interval = _MTIME_POLL_INTERVAL if isinstance(watcher, MtimeWatcher) else 0.0
+        self._last = time.monotonic()
+
+    def poll(self) -> Optional[Set[str]]:
+        now = time.monotonic()
+        if now - self._last < self._interval:
+            return set()
+        self._last = now
+        return self._watcher.poll()
+
+    def close(self) -> None:
+        self._watcher.close()
+
+
+class _DataVersionChanges:
+    """Change detection for backends exposing a monotonically changing ``data_version()``."""
+
+    blocking = False
+
+    def __init__(self, backend: Any) -> None:
+        self._backend = backend
+        self._version = backend.data_version()
+
+    def poll(self) -> Optional[Set[str]]:
+        version = self._backend.data_version()
+        if version == self._version:
+            return set()
+        self._version = version
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class _DeltaChanges:
+    """Backends with a change feed (``changed_tickets(cursor)``), polled at most every ``interval`` seconds."""
+
+    # The feed is a network call: never poll it from the event loop.
+    blocking = True
+
+    def __init__(self, backend: Any, interval: float) -> None:
+        self._backend = backend
+        self._interval = interval
+        self._cursor: Optional[str] = None
+        self._next = 0.0
+
+    def due(self) -> bool:
+        return time.monotonic() >= self._next
+
+    def poll(self) -> Optional[Set[str]]:
+        now = time.monotonic()
+        if now < self._next:
+            return set()
+        self._next = now + self._interval
+        changed, self._cursor = self._backend.changed_tickets(self._cursor)
+        return changed
+
+    def close(self) -> None:
+        return None
+
+
+class _ExpiryChanges:
+    """Backends without change detection: treat everything as changed every ``ttl`` seconds."""
+
+    blocking = False
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._expires = time.monotonic() + ttl
+
+    def poll(self) -> Optional[Set[str]]:
+        now = time.monotonic()
+        if now < self._expires:
+            return set()
+        self._expires = now + self._ttl
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _cache_ttl() -> float:
+    raw = os.environ.get("TKTS_MCP_CACHE_TTL", "").strip()
+    if not raw:
+        return DEFAULT_TTL
+    try:
+        return max(0.0, float(raw))
+    except ValueError as exc:
+        raise ValueError(f"TKTS_MCP_CACHE_TTL must be a number of seconds, got {raw!r}.") from exc
+
+
+def change_source(backend: Any) -> Any:
+    if hasattr(backend, "watch_directories"):
+        return _WatcherChanges(watch_directories(backend.watch_directories()))
+    if hasattr(backend, "data_version"):
+        return _DataVersionChanges(backend)
+    if hasattr(backend, "changed_tickets"):
+        return _DeltaChanges(backend, _cache_ttl())
+    return _ExpiryChanges(_cache_ttl())
+
+
+class ResponseCache:
+    """Serialized MCP responses, dropped when the server writes or the backend reports changes.
+
+    Ticket payloads are held per full ticket id, so a change to one ticket only evicts that
+    ticket. List pages and change log tails depend on every ticket and are dropped on any change.
+    """
+
+    def __init__(self, changes: Any = None, *, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._changes = changes
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._generation = 0
+        self._tickets: Dict[str, Dict[Hashable, str]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._queries: Dict[Hashable, str] = {}
+        self._listeners: List[Callable[[Optional[Set[str]]], None]] = []
+
+    @classmethod
+    def for_backend(cls, backend: Any) -> "ResponseCache":
+        enabled = os.environ.get("TKTS_MCP_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+        # Change detection stays on without caching so subscriptions still get notified.
+        return cls(change_source(backend), enabled=enabled)
+
+    def add_listener(self, listener: Callable[[Optional[Set[str]]], None]) -> None:
+        """Call ``listener`` with the changed ticket ids (None: anything may have changed)."""
+        self._listeners.append(listener)
+
+    def ticket(
+        self,
+        ticket_ref: str,
+        key: Hashable,
+        load: Callable[[], Tuple[str, str]],
+    ) -> str:
+        """Return the cached payload for ``ticket_ref``; ``load`` returns (ticket_id, text)."""
+        if not self.enabled:
+            return load()[1]
+        self.sync()
+        cached = self._lookup_ticket(ticket_ref, key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            generation = self._generation
+        ticket_id, text = load()
+        with self._lock:
+            if generation == self._generation:
+                self._aliases[ticket_ref] = ticket_id
+                self._tickets.setdefault(ticket_id, {})[key] = text
+        return text
+
+    def query(self, key: Hashable, load: Callable[[], str]) -> str:
+        if not self.enabled:
+            return load()
+        self.sync()
+        with self._lock:
+            cached = self._queries.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            generation = self._generation
+        text = load()
+        with self._lock:
+            if generation == self._generation:
+                self._queries[key] = text
+        return text
+
+    def cached_ticket(self, ticket_ref: str, key: Hashable) -> Optional[str]:
+        """Non-blocking lookup for the event loop; None means "go through ``ticket()`` in a worker"."""
+        if not self.enabled or not self._sync_nowait():
+            return None
+        return self._lookup_ticket(ticket_ref, key)
+
+    def cached_query(self, key: Hashable) -> Optional[str]:
+        """Non-blocking lookup for the event loop; None means "go through ``query()`` in a worker"."""
+        if not self.enabled or not self._sync_nowait():
+            return None
+        with self._lock:
+            return self._queries.get(key)
+
+    def _lookup_ticket(self, ticket_ref: str, key: Hashable) -> Optional[str]:
+        with self._lock:
+            ticket_id = self._aliases.get(ticket_ref)
+            return self._tickets.get(ticket_id, {}).get(key) if ticket_id else None
+
+    def _sync_nowait(self) -> bool:
+        """Sync without blocking: False when that would mean waiting on a network poll or on another poller."""
+        changes = self._changes
+        if changes is None:
+            return True
+        if changes.blocking:
+            # Fresh until the next poll is due; the due poll itself runs in a worker thread.
+            return not changes.due() and not self._poll_lock.locked()
+        if not self._poll_lock.acquire(blocking=False):
+            return False
+        try:
+            changed = changes.poll()
+        finally:
+            self._poll_lock.release()
+        self._apply(changed)
+        return True
+
+    def sync(self) -> None:
+        with self._poll_lock:
+            if self._changes is None:
+                return
+            changed = self._changes.poll()
+        self._apply(changed)
+
+    def _apply(self, changed: Optional[Set[str]]) -> None:
+        if changed is None:
+            self.invalidate()
+        elif changed:
+            self.invalidate(changed)
+
+    def invalidate(self, ticket_ids: Optional[Iterable[str]] = None) -> None:
+        """Drop everything, or only ``ticket_ids`` plus every list/changelog response."""
+        changed = set(ticket_ids) if ticket_ids is not None else None
+        with self._lock:
+            self._generation += 1
+            self._queries.clear()
+            if changed is None:
+                self._tickets.clear()
+                self._aliases.clear()
+            else:
+                for ticket_id in changed:
+                    self._tickets.pop(ticket_id, None)
+                # A new ticket can make a short prefix ambiguous, so only exact ids stay aliased.
+                self._aliases = {ref: ticket_id for ref, ticket_id in self._aliases.items() if ref == ticket_id}
+        for listener in list(self._listeners):
+            listener(changed)
+
+    def close(self) -> None:
+        with self._poll_lock:
+            if self._changes is not None:
+                self._changes.close()
+                self._changes = None
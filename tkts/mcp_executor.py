@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+DEFAULT_WORKERS = 8
+DEFAULT_TIMEOUT = 30.0
+
+
+def env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be a number, got {raw!r}.") from exc
+
+
+class _Call:
+    def __init__(self, future: "asyncio.Future[Any]") -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class BackendExecutor:
+    """Run blocking backend calls off the event loop.
+
+    Calls go to a bounded thread pool and are awaited with a timeout. Reads that pass the
+    same ``key`` while one is already running share its result instead of hitting the
+    backend again. When every caller waiting on a call is cancelled or times out, the call
+    is cancelled if it has not started yet; a call already running in a thread finishes in
+    the background and its result is discarded.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None) -> None:
+        if max_workers is None:
+            max_workers = int(env_number("TKTS_MCP_WORKERS", DEFAULT_WORKERS))
+        if timeout is None:
+            timeout = env_number("TKTS_MCP_TIMEOUT", DEFAULT_TIMEOUT)
+        self.timeout = timeout if timeout > 0 else None
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="tkts-mcp")
+        self._inflight: Dict[Hashable, _Call] = {}
+
+    async def run(self, fn: Callable[[], Any], *, key: Optional[Hashable] = None) -> Any:
+        loop = asyncio.get_running_loop()
+        call = self._inflight.get(key) if key is not None else None
+        if call is None:
+            call = _Call(loop.run_in_executor(self._pool, fn))
+            if key is not None:
+                self._inflight[key] = call
+                call.future.add_done_callback(lambda _, key=key, call=call: self._finish(key, call))
+        call.waiters += 1
+        try:
+            # asyncio.wait leaves the shared future alone on timeout or cancellation, unlike wait_for.
+            done, _ = await asyncio.wait({call.future}, timeout=self.timeout)
+            if not done:
+                raise TimeoutError(f"Backend call timed out after {self.timeout:g}s.")
+            return call.future.result()
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.future.done():
+                call.future.cancel()
+                self._finish(key, call)
+
+    def _finish(self, key: Optional[Hashable], call: _Call) -> None:
+        if key is not None and self._inflight.get(key) is call:
+            del self._inflight[key]
+
+    def forget(self) -> None:
+        """Stop coalescing with reads that started before a write finished."""
+        self._inflight.clear()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -1,9 +1,46 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
 import json
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
 
 from tkts.backends import Backend, get_backend_from_env
+from tkts.mcp_cache import ResponseCache
+from tkts.mcp_executor import BackendExecutor, env_number
+from tkts.query import SORT_KEYS, TicketQuery
+
+
+_STATUS_SCHEMA = {"type": "string", "enum": ["todo", "in-progress", "in-review", "blocked", "done"]}
+_CREATE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "subject": {"type": "string"},
+        "body": {"type": "string"},
+        "assignee": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "status": _STATUS_SCHEMA,
+    },
+    "required": ["subject"],
+}
+_UPDATE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "ticket_id": {"type": "string"},
+        "subject": {"type": "string"},
+        "body": {"type": "string"},
+        "assignee": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "status": _STATUS_SCHEMA,
+        "append_body": {"type": "string"},
+        "comment": {"type": "string"},
+        "log_message": {"type": "string"},
+    },
+    "required": ["ticket_id"],
+}
 
 
 def _require_mcp() -> Any:
@@ -14,28 +51,252 @@ def _require_mcp() -> Any:
             ReadResourceContents,
         )
         from mcp.server.stdio import stdio_server  # type: ignore
-        from mcp.types import Resource, TextContent, Tool  # type: ignore
+        from mcp.types import Resource, ResourceTemplate, TextContent, Tool  # type: ignore
     except ModuleNotFoundError as exc:  # pragma: no cover - import guard
         raise SystemExit(
             "The mcp Python SDK is required. Install `mcp` to use `tkts mcp`."
         ) from exc
 
-    return mcp, Server, stdio_server, TextContent, Tool, Resource, ReadResourceContents
+    return mcp, Server, stdio_server, TextContent, Tool, Resource, ReadResourceContents, ResourceTemplate
+
+
+def _require_http() -> Any:
+    try:
+        import uvicorn  # type: ignore
+        from mcp.server.streamable_http_manager import StreamableHTTPSessionManager  # type: ignore
+        from starlette.applications import Starlette  # type: ignore
+        from starlette.routing import Mount  # type: ignore
+    except ModuleNotFoundError as exc:  # pragma: no cover - import guard
+        raise SystemExit(
+            "`tkts mcp --listen` needs the mcp SDK with its HTTP extras (starlette, uvicorn)."
+        ) from exc
+
+    return uvicorn, StreamableHTTPSessionManager, Starlette, Mount
+
+
+DEFAULT_LISTEN_HOST = "127.0.0.1"
+HTTP_PATH = "/mcp"
+
+
+def _parse_listen(value: str) -> Tuple[str, int]:
+    host, sep, port_text = value.strip().rpartition(":")
+    if not sep:
+        host = ""
+    host = host.strip("[]") or DEFAULT_LISTEN_HOST
+    try:
+        port = int(port_text)
+    except ValueError:
+        raise ValueError(f"--listen expects [HOST:]PORT, got {value!r}.") from None
+    if not 0 < port < 65536:
+        raise ValueError(f"--listen port must be between 1 and 65535, got {port}.")
+    return host, port
+
+
+_FIELD_GETTERS: Dict[str, Callable[[Any], Any]] = {
+    "id": lambda ticket: ticket.ticket_id,
+    "subject": lambda ticket: ticket.subject,
+    "body": lambda ticket: ticket.body,
+    "assignee": lambda ticket: ticket.assignee,
+    "tags": lambda ticket: ticket.tags,
+    "status": lambda ticket: getattr(ticket, "status", None),
+    "created_at": lambda ticket: ticket.created_at,
+    "updated_at": lambda ticket: ticket.updated_at,
+}
+TICKET_FIELDS = tuple(_FIELD_GETTERS)
+SUMMARY_FIELDS = tuple(name for name in TICKET_FIELDS if name != "body")
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def _ticket_to_dict(ticket: Any, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    return {name: _FIELD_GETTERS[name](ticket) for name in (fields or TICKET_FIELDS)}
+
+
+def _as_list(value: Any) -> Optional[List[str]]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return [part.strip() for part in value.split(",") if part.strip()]
+    return [str(part) for part in value]
+
+
+def _fields_from_arguments(arguments: Mapping[str, Any]) -> List[str]:
+    fields = _as_list(arguments.get("fields"))
+    if not fields:
+        return list(SUMMARY_FIELDS)
+    unknown = sorted(name for name in fields if name not in _FIELD_GETTERS)
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(TICKET_FIELDS)}.")
+    return ["id"] + [name for name in dict.fromkeys(fields) if name != "id"]
+
+
+def _query_from_arguments(arguments: Mapping[str, Any]) -> TicketQuery:
+    return TicketQuery(
+        statuses=_as_list(arguments.get("status")),
+        tags=_as_list(arguments.get("tags")),
+        assignee=str(arguments["assignee"]) if arguments.get("assignee") else None,
+        text=str(arguments["text"]) if arguments.get("text") else None,
+        updated_since=str(arguments["updated_since"]) if arguments.get("updated_since") else None,
+        sort=str(arguments.get("sort") or "id"),
+    )
+
+
+def _query_fingerprint(query: TicketQuery) -> str:
+    raw = json.dumps(
+        [query.statuses, query.tags, query.assignee, query.text, query.updated_since, query.sort],
+        ensure_ascii=True,
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def _encode_cursor(offset: int, fingerprint: str) -> str:
+    raw = json.dumps({"o": offset, "q": fingerprint}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
 
 
-def _ticket_to_dict(ticket: Any) -> Dict[str, Any]:
+def _decode_cursor(cursor: str, fingerprint: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        offset = int(payload["o"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError("Invalid cursor.") from exc
+    if payload.get("q") != fingerprint or offset < 0:
+        raise ValueError("Cursor does not match this query; restart without a cursor.")
+    return offset
+
+
+def _list_page(backend: Backend, arguments: Mapping[str, Any]) -> Dict[str, Any]:
+    query = _query_from_arguments(arguments)
+    fields = _fields_from_arguments(arguments)
+    limit = arguments.get("limit")
+    page_size = DEFAULT_PAGE_SIZE if limit is None else int(limit)
+    if page_size < 1:
+        raise ValueError("limit must be >= 1.")
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    fingerprint = _query_fingerprint(query)
+    cursor = arguments.get("cursor")
+    offset = _decode_cursor(str(cursor), fingerprint) if cursor else 0
+
+    query.offset = offset
+    query.limit = page_size + 1
+    tickets = backend.list_tickets(query=query)
+    has_more = len(tickets) > page_size
     return {
-        "id": ticket.ticket_id,
-        "subject": ticket.subject,
-        "body": ticket.body,
-        "assignee": ticket.assignee,
-        "tags": ticket.tags,
-        "status": getattr(ticket, "status", None),
-        "created_at": ticket.created_at,
-        "updated_at": ticket.updated_at,
+        "tickets": [_ticket_to_dict(ticket, fields) for ticket in tickets[:page_size]],
+        "next_cursor": _encode_cursor(offset + page_size, fingerprint) if has_more else None,
     }
 
 
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=True)
+
+
+def _arguments_from_uri(uri: str) -> Dict[str, Any]:
+    arguments: Dict[str, Any] = {}
+    for key, values in parse_qs(urlsplit(uri).query).items():
+        arguments[key] = values[-1]
+    if "limit" in arguments:
+        arguments["limit"] = int(arguments["limit"])
+    return arguments
+
+
+LIST_URI = "tkts://tickets"
+TICKET_URI_PREFIX = "tkts://tickets/"
+
+
+def _is_list_uri(uri: str) -> bool:
+    return uri == LIST_URI or uri.startswith(LIST_URI + "?")
+
+
+class _Subscriptions:
+    """Sessions subscribed to ticket resources, notified from the response cache's change events.
+
+    Notifications only ever name a subscribed URI. A ``tkts://tickets/{id}`` subscriber hears about
+    that ticket; a list subscriber (``tkts://tickets``, filtered or not) is sent its own list URI on
+    any change, since a ticket may have entered or left the view. While anyone is subscribed, a
+    background task polls the backend's change detection every ``interval`` seconds.
+    """
+
+    def __init__(self, cache: ResponseCache, executor: BackendExecutor, interval: float) -> None:
+        self._cache = cache
+        self._executor = executor
+        self._interval = interval
+        self._sessions: Dict[str, set] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        cache.add_listener(self._on_change)
+
+    def subscribe(self, uri: str, session: Any) -> None:
+        self._sessions.setdefault(uri, set()).add(session)
+        self._loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._poll())
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        sessions = self._sessions.get(uri)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._sessions[uri]
+
+    def _drop(self, session: Any) -> None:
+        for uri in list(self._sessions):
+            self.unsubscribe(uri, session)
+
+    def _on_change(self, changed: Optional[Set[str]]) -> None:
+        # Called from whichever thread noticed the change.
+        loop = self._loop
+        if loop is None or not self._sessions:
+            return
+        try:
+            loop.call_soon_threadsafe(lambda: loop.create_task(self.notify(changed)))
+        except RuntimeError:
+            pass  # loop already closed
+
+    def targets(self, changed: Optional[Set[str]]) -> Dict[Any, List[str]]:
+        targets: Dict[Any, List[str]] = {}
+        for uri, sessions in self._sessions.items():
+            if not _is_list_uri(uri):
+                ref = uri[len(TICKET_URI_PREFIX) :]
+                if changed is not None and not any(ticket_id.startswith(ref) for ticket_id in changed):
+                    continue
+            for session in sessions:
+                pending = targets.setdefault(session, [])
+                if uri not in pending:
+                    pending.append(uri)
+        return targets
+
+    async def notify(self, changed: Optional[Set[str]]) -> None:
+        for session, uris in self.targets(changed).items():
+            try:
+                for uri in uris:
+                    await session.send_resource_updated(uri)
+            except Exception:
+                self._drop(session)  # session closed
+
+    async def _poll(self) -> None:
+        while self._sessions:
+            try:
+                await self._executor.run(self._cache.sync, key="sync")
+            except Exception:
+                pass  # transient backend errors; try again next tick
+            await asyncio.sleep(self._interval)
+
+
+def _enable_subscribe_capability(server: Any) -> None:
+    original = server.create_initialization_options
+
+    def create_initialization_options(*args: Any, **kwargs: Any) -> Any:
+        options = original(*args, **kwargs)
+        resources = getattr(options.capabilities, "resources", None)
+        if resources is not None:
+            resources.subscribe = True
+        return options
+
+    server.create_initialization_options = create_initialization_options
+
+
 def _build_server(
     *,
     backend: Backend,
@@ -45,16 +306,115 @@ def _build_server(
     Tool: Any,
     Resource: Any,
     ReadResourceContents: Any,
+    ResourceTemplate: Any = None,
+    cache: Optional[ResponseCache] = None,
+    executor: Optional[BackendExecutor] = None,
 ) -> Any:
     server = Server("tkts")
+    if cache is None:
+        cache = ResponseCache.for_backend(backend)
+    if executor is None:
+        executor = BackendExecutor()
+
+    async def ticket_json(ticket_ref: str) -> str:
+        cached = cache.cached_ticket(ticket_ref, "ticket")
+        if cached is not None:
+            return cached
+
+        def load() -> Any:
+            ticket = backend.get_ticket(ticket_ref)
+            if not ticket:
+                raise ValueError(f"Ticket {ticket_ref} not found")
+            return ticket.ticket_id, _dumps(_ticket_to_dict(ticket))
+
+        return await executor.run(lambda: cache.ticket(ticket_ref, "ticket", load), key=("ticket", ticket_ref))
+
+    async def query_json(key: Any, load: Callable[[], str]) -> str:
+        cached = cache.cached_query(key)
+        if cached is not None:
+            return cached
+        return await executor.run(lambda: cache.query(key, load), key=key)
+
+    async def page_json(arguments: Mapping[str, Any]) -> str:
+        key = ("page", json.dumps(arguments, sort_keys=True, default=str))
+        return await query_json(key, lambda: _dumps(_list_page(backend, arguments)))
+
+    async def changelog_json(ticket_ref: str, limit: int) -> str:
+        return await query_json(
+            ("changelog", ticket_ref, limit),
+            lambda: _dumps(backend.tail_ticket_changelog(ticket_ref, limit=limit)),
+        )
+
+    def apply(fn: Callable[[], Any]) -> Any:
+        # Runs in the worker thread so the cache is invalidated even if the caller timed out.
+        try:
+            result = fn()
+        except BaseException:
+            # A failed (bulk) write may still have changed some tickets.
+            cache.invalidate()
+            raise
+        tickets = result if isinstance(result, list) else [result]
+        cache.invalidate([ticket.ticket_id for ticket in tickets])
+        return result
+
+    async def write(fn: Callable[[], Any]) -> Any:
+        try:
+            return await executor.run(lambda: apply(fn))
+        finally:
+            executor.forget()
+
+    if hasattr(server, "subscribe_resource"):
+        subscriptions = _Subscriptions(cache, executor, env_number("TKTS_MCP_NOTIFY_INTERVAL", 1.0))
+
+        @server.subscribe_resource()
+        async def subscribe_resource(uri: Any) -> None:
+            uri_str = str(uri)
+            is_ticket_uri = uri_str.startswith(TICKET_URI_PREFIX) and len(uri_str) > len(TICKET_URI_PREFIX)
+            if not (_is_list_uri(uri_str) or is_ticket_uri):
+                raise ValueError(f"Unknown resource: {uri_str}")
+            subscriptions.subscribe(uri_str, server.request_context.session)
+
+        @server.unsubscribe_resource()
+        async def unsubscribe_resource(uri: Any) -> None:
+            subscriptions.unsubscribe(str(uri), server.request_context.session)
+
+        if hasattr(server, "create_initialization_options"):
+            _enable_subscribe_capability(server)
 
     @server.list_tools()
     async def list_tools() -> List[Tool]:
         tools = [
             Tool(
                 name="list_tickets",
-                description="List all tickets.",
-                inputSchema={"type": "object", "properties": {}, "required": []},
+                description=(
+                    "List tickets one page at a time. Returns {tickets, next_cursor}; pass next_cursor back "
+                    "to get the following page. Bodies are omitted unless requested via fields."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "status": {
+                            "type": "array",
+                            "items": {
+                                "type": "string",
+                                "enum": ["todo", "in-progress", "in-review", "blocked", "done", "unknown"],
+                            },
+                        },
+                        "tags": {"type": "array", "items": {"type": "string"}},
+                        "assignee": {"type": "string"},
+                        "text": {"type": "string"},
+                        "updated_since": {"type": "string", "description": "ISO-8601 timestamp."},
+                        "sort": {"type": "string", "enum": list(SORT_KEYS)},
+                        "fields": {
+                            "type": "array",
+                            "items": {"type": "string", "enum": list(TICKET_FIELDS)},
+                            "description": "Fields to return (default: every field except body).",
+                        },
+                        "limit": {"type": "integer", "minimum": 1, "maximum": MAX_PAGE_SIZE},
+                        "cursor": {"type": "string"},
+                    },
+                    "required": [],
+                },
             ),
             Tool(
                 name="get_ticket",
@@ -83,43 +443,35 @@ def _build_server(
                 Tool(
                     name="create_ticket",
                     description="Create a new ticket.",
+                    inputSchema=_CREATE_SCHEMA,
+                )
+            )
+            tools.append(
+                Tool(
+                    name="update_ticket",
+                    description="Update ticket fields, status, or append comments.",
+                    inputSchema=_UPDATE_SCHEMA,
+                )
+            )
+            tools.append(
+                Tool(
+                    name="create_tickets",
+                    description="Create several tickets in one call.",
                     inputSchema={
                         "type": "object",
-                        "properties": {
-                            "subject": {"type": "string"},
-                            "body": {"type": "string"},
-                            "assignee": {"type": "string"},
-                            "tags": {"type": "array", "items": {"type": "string"}},
-                            "status": {
-                                "type": "string",
-                                "enum": ["todo", "in-progress", "in-review", "blocked", "done"],
-                            },
-                        },
-                        "required": ["subject"],
+                        "properties": {"tickets": {"type": "array", "items": _CREATE_SCHEMA, "minItems": 1}},
+                        "required": ["tickets"],
                     },
                 )
             )
             tools.append(
                 Tool(
-                    name="update_ticket",
-                    description="Update ticket fields, status, or append comments.",
+                    name="update_tickets",
+                    description="Apply several ticket updates in one call.",
                     inputSchema={
                         "type": "object",
-                        "properties": {
-                            "ticket_id": {"type": "string"},
-                            "subject": {"type": "string"},
-                            "body": {"type": "string"},
-                            "assignee": {"type": "string"},
-                            "tags": {"type": "array", "items": {"type": "string"}},
-                            "status": {
-                                "type": "string",
-                                "enum": ["todo", "in-progress", "in-review", "blocked", "done"],
-                            },
-                            "append_body": {"type": "string"},
-                            "comment": {"type": "string"},
-                            "log_message": {"type": "string"},
-                        },
-                        "required": ["ticket_id"],
+                        "properties": {"updates": {"type": "array", "items": _UPDATE_SCHEMA, "minItems": 1}},
+                        "required": ["updates"],
                     },
                 )
             )
@@ -127,50 +479,50 @@ def _build_server(
 
     @server.list_resources()
     async def list_resources() -> List[Resource]:
-        tickets = backend.list_tickets()
-        resources: List[Resource] = [
+        return [
             Resource(
                 name="tickets",
                 title="Tickets",
                 uri="tkts://tickets",
-                description="List all tickets.",
+                description=(
+                    "First page of ticket summaries. Accepts the list_tickets arguments as a query string, "
+                    "e.g. tkts://tickets?status=todo&fields=id,subject&cursor=..."
+                ),
                 mimeType="application/json",
             )
         ]
-        for ticket in tickets:
-            resources.append(
-                Resource(
-                    name=f"ticket-{ticket.ticket_id}",
-                    title=ticket.subject or f"Ticket {ticket.ticket_id}",
-                    uri=f"tkts://tickets/{ticket.ticket_id}",
-                    description="Single ticket.",
+
+    if ResourceTemplate is not None and hasattr(server, "list_resource_templates"):
+
+        @server.list_resource_templates()
+        async def list_resource_templates() -> List[Any]:
+            return [
+                ResourceTemplate(
+                    name="ticket",
+                    title="Ticket",
+                    uriTemplate="tkts://tickets/{ticket_id}",
+                    description="Single ticket, including its body.",
                     mimeType="application/json",
                 )
-            )
-        return resources
+            ]
 
     @server.read_resource()
     async def read_resource(uri: Any) -> List[ReadResourceContents]:
         uri_str = str(uri)
-        if uri_str == "tkts://tickets":
-            tickets = [_ticket_to_dict(ticket) for ticket in backend.list_tickets()]
+        if _is_list_uri(uri_str):
             return [
                 ReadResourceContents(
-                    content=json.dumps(tickets, ensure_ascii=True),
+                    content=await page_json(_arguments_from_uri(uri_str)),
                     mime_type="application/json",
                 )
             ]
-        prefix = "tkts://tickets/"
-        if uri_str.startswith(prefix):
-            ticket_id = uri_str[len(prefix) :]
+        if uri_str.startswith(TICKET_URI_PREFIX):
+            ticket_id = uri_str[len(TICKET_URI_PREFIX) :]
             if not ticket_id:
                 raise ValueError("ticket_id is required")
-            ticket = backend.get_ticket(str(ticket_id))
-            if not ticket:
-                raise ValueError(f"Ticket {ticket_id} not found")
             return [
                 ReadResourceContents(
-                    content=json.dumps(_ticket_to_dict(ticket), ensure_ascii=True),
+                    content=await ticket_json(str(ticket_id)),
                     mime_type="application/json",
                 )
             ]
@@ -180,16 +532,12 @@ def _build_server(
     async def call_tool(name: str, arguments: Optional[Dict[str, Any]]) -> List[TextContent]:
         arguments = arguments or {}
         if name == "list_tickets":
-            tickets = [_ticket_to_dict(ticket) for ticket in backend.list_tickets()]
-            return [TextContent(type="text", text=json.dumps(tickets, ensure_ascii=True))]
+            return [TextContent(type="text", text=await page_json(arguments))]
         if name == "get_ticket":
             ticket_id = arguments.get("ticket_id")
             if not ticket_id:
                 raise ValueError("ticket_id is required")
-            ticket = backend.get_ticket(str(ticket_id))
-            if not ticket:
-                raise ValueError(f"Ticket {ticket_id} not found")
-            return [TextContent(type="text", text=json.dumps(_ticket_to_dict(ticket), ensure_ascii=True))]
+            return [TextContent(type="text", text=await ticket_json(str(ticket_id)))]
         if name == "create_ticket":
             if read_only:
                 raise ValueError("create_ticket is disabled in read-only mode")
@@ -200,12 +548,14 @@ def _build_server(
             assignee = arguments.get("assignee")
             tags = arguments.get("tags")
             status = arguments.get("status")
-            ticket = backend.create_ticket(
-                subject=str(subject),
-                body=body,
-                assignee=str(assignee) if assignee else None,
-                tags=tags if isinstance(tags, list) else None,
-                status=str(status) if status else None,
+            ticket = await write(
+                lambda: backend.create_ticket(
+                    subject=str(subject),
+                    body=body,
+                    assignee=str(assignee) if assignee else None,
+                    tags=tags if isinstance(tags, list) else None,
+                    status=str(status) if status else None,
+                )
             )
             return [TextContent(type="text", text=json.dumps(_ticket_to_dict(ticket), ensure_ascii=True))]
         if name == "update_ticket":
@@ -214,36 +564,75 @@ def _build_server(
             ticket_id = arguments.get("ticket_id")
             if not ticket_id:
                 raise ValueError("ticket_id is required")
-            ticket = backend.update_ticket(
-                str(ticket_id),
-                subject=arguments.get("subject"),
-                body=arguments.get("body"),
-                assignee=arguments.get("assignee"),
-                tags=arguments.get("tags") if isinstance(arguments.get("tags"), list) else None,
-                status=arguments.get("status"),
-                append_body=arguments.get("append_body"),
-                comment=arguments.get("comment"),
-                log_message=arguments.get("log_message"),
+            ticket = await write(
+                lambda: backend.update_ticket(
+                    str(ticket_id),
+                    subject=arguments.get("subject"),
+                    body=arguments.get("body"),
+                    assignee=arguments.get("assignee"),
+                    tags=arguments.get("tags") if isinstance(arguments.get("tags"), list) else None,
+                    status=arguments.get("status"),
+                    append_body=arguments.get("append_body"),
+                    comment=arguments.get("comment"),
+                    log_message=arguments.get("log_message"),
+                )
             )
             return [TextContent(type="text", text=json.dumps(_ticket_to_dict(ticket), ensure_ascii=True))]
+        if name in {"create_tickets", "update_tickets"}:
+            if read_only:
+                raise ValueError(f"{name} is disabled in read-only mode")
+            key = "tickets" if name == "create_tickets" else "updates"
+            items = arguments.get(key)
+            if not isinstance(items, list) or not items:
+                raise ValueError(f"{key} must be a non-empty list")
+            if name == "create_tickets":
+                tickets = await write(lambda: backend.create_tickets(items))
+            else:
+                tickets = await write(lambda: backend.update_tickets(items))
+            payload = [_ticket_to_dict(ticket) for ticket in tickets]
+            return [TextContent(type="text", text=json.dumps(payload, ensure_ascii=True))]
         if name == "tail_ticket_changelog":
             ticket_id = arguments.get("ticket_id")
             if not ticket_id:
                 raise ValueError("ticket_id is required")
             limit = arguments.get("limit")
             limit_value = int(limit) if limit is not None else 10
-            entries = backend.tail_ticket_changelog(str(ticket_id), limit=limit_value)
-            return [TextContent(type="text", text=json.dumps(entries, ensure_ascii=True))]
+            return [TextContent(type="text", text=await changelog_json(str(ticket_id), limit_value))]
 
         raise ValueError(f"Unknown tool: {name}")
 
     return server
 
 
-def run_mcp_server(read_only: bool = False) -> int:
-    _, Server, stdio_server, TextContent, Tool, Resource, ReadResourceContents = _require_mcp()
+def _serve_http(server: Any, host: str, port: int) -> None:
+    import contextlib
+
+    uvicorn, StreamableHTTPSessionManager, Starlette, Mount = _require_http()
+    # Stateful sessions so each agent keeps its own stream, sharing this process's backend and caches.
+    session_manager = StreamableHTTPSessionManager(app=server, event_store=None, json_response=False, stateless=False)
+
+    async def handle(scope: Any, receive: Any, send: Any) -> None:
+        await session_manager.handle_request(scope, receive, send)
 
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Any) -> Any:
+        async with session_manager.run():
+            yield
+
+    app = Starlette(routes=[Mount(HTTP_PATH, app=handle)], lifespan=lifespan)
+    uvicorn.run(app, host=host, port=port, log_level="warning")
+
+
+def run_mcp_server(read_only: bool = False, listen: Optional[str] = None) -> int:
+    _, Server, stdio_server, TextContent, Tool, Resource, ReadResourceContents, ResourceTemplate = _require_mcp()
+
+    try:
+        address = _parse_listen(listen) if listen else None
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from None
     backend: Backend = get_backend_from_env()
+    cache = ResponseCache.for_backend(backend)
+    executor = BackendExecutor()
     server = _build_server(
         backend=backend,
         read_only=read_only,
@@ -252,13 +641,23 @@ def run_mcp_server(read_only: bool = False) -> int:
         Tool=Tool,
         Resource=Resource,
         ReadResourceContents=ReadResourceContents,
+        ResourceTemplate=ResourceTemplate,
+        cache=cache,
+        executor=executor,
     )
 
     async def _run() -> None:
         async with stdio_server() as (read_stream, write_stream):
             await server.run(read_stream, write_stream, server.create_initialization_options())
 
-    import asyncio
-
-    asyncio.run(_run())
+    try:
+        if address:
+            host, port = address
+            print(f"tkts MCP server listening on http://{host}:{port}{HTTP_PATH}", file=sys.stderr)
+            _serve_http(server, host, port)
+        else:
+            asyncio.run(_run())
+    finally:
+        executor.shutdown()
+        cache.close()
     return 0
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import binascii
+import random
+import re
+import sys
 from dataclasses import dataclass, field
-from email.message import EmailMessage
-from email.parser import Parser
-from email.policy import default
-from typing import Dict, List, Optional
+from email import quoprimime
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from email.message import EmailMessage
+    from email.parser import Parser
+
+
+# email.parser / email.policy are imported where tickets are parsed, so commands that only write
+# tickets (the fast serializer below) never load them.
+def _parser() -> Parser:
+    from email.parser import Parser
+    from email.policy import default
+
+    return Parser(policy=default)
 
 
 def _split_tags(raw: str) -> List[str]:
@@ -32,6 +47,110 @@ def _extract_documents(message: EmailMessage) -> List[str]:
     return [body_text] if body_text else []
 
 
+_RESERVED_HEADERS = {
+    "Id",
+    "Ticket-Id",
+    "Subject",
+    "Assignee",
+    "Tags",
+    "Status",
+    "Created",
+    "Updated",
+    "Content-Type",
+    "Content-Transfer-Encoding",
+    "MIME-Version",
+}
+
+
+def _split_header_block(raw: str) -> str:
+    for separator in ("\n\n", "\r\n\r\n"):
+        position = raw.find(separator)
+        if position != -1:
+            return raw[: position + len(separator)]
+    return raw
+
+
+def _header_fields(message: EmailMessage, fallback_id: Optional[str]) -> Dict[str, object]:
+    ticket_id = message.get("Id") or message.get("Ticket-Id") or fallback_id
+    if not ticket_id:
+        raise ValueError("Ticket id missing")
+
+    extra_headers: Dict[str, str] = {}
+    for key, value in message.items():
+        if key in _RESERVED_HEADERS:
+            continue
+        extra_headers[key] = value
+
+    return {
+        "ticket_id": ticket_id,
+        "subject": message.get("Subject", "").strip(),
+        "assignee": message.get("Assignee"),
+        "tags": _split_tags(message.get("Tags", "")),
+        "status": message.get("Status"),
+        "created_at": message.get("Created"),
+        "updated_at": message.get("Updated"),
+        "extra_headers": extra_headers,
+    }
+
+
+# Fast serializer: writes exactly what to_message().as_string() would for the common case (short
+# ASCII headers, ASCII bodies) and returns None for anything the email package would encode or fold.
+# The non-unstructured headers of email.headerregistry.HeaderRegistry, and email.policy.default.max_line_length.
+_STRUCTURED_HEADERS = frozenset(
+    {
+        "bcc", "cc", "content-disposition", "content-transfer-encoding", "content-type", "date", "from",
+        "message-id", "mime-version", "orig-date", "reply-to", "resent-bcc", "resent-cc", "resent-date",
+        "resent-from", "resent-sender", "resent-to", "sender", "to",
+    }
+)
+_MAX_LINE_LENGTH = 78
+_HEADER_NAME = re.compile(r"[!-9;-~]+")
+_HEADER_VALUE = re.compile(r"[ -~\t]+")
+_BOUNDARY_FORMAT = "%%0%dd" % len(repr(sys.maxsize - 1))
+_ATTACHMENT_HEADERS = "MIME-Version: 1.0\nContent-Disposition: attachment\n"
+
+
+def _fast_header(name: str, value: object) -> Optional[str]:
+    if not isinstance(value, str) or not _HEADER_NAME.fullmatch(name) or name.lower() in _STRUCTURED_HEADERS:
+        return None
+    if len(name) + 2 + len(value) > _MAX_LINE_LENGTH or not _HEADER_VALUE.fullmatch(value) or "=?" in value:
+        return None
+    return f"{name}: {value}\n"
+
+
+def _fast_body(text: str) -> Optional[Tuple[str, str]]:
+    """Content-Transfer-Encoding and payload, chosen the way email.contentmanager picks them for text."""
+    if not text.isascii():
+        return None  # becomes 8bit, which the generator then rewrites as base64
+    max_length = _MAX_LINE_LENGTH
+    lines = text.encode("ascii").splitlines()
+    body = b"\n".join(lines) + b"\n"
+    if max((len(line) for line in lines), default=0) <= max_length:
+        return "7bit", body.decode("ascii")
+    sniff = b"\n".join(lines[:10]) + b"\n"
+    sniff_qp = quoprimime.body_encode(sniff.decode("latin-1"), max_length)
+    if len(sniff_qp) > len(binascii.b2a_base64(sniff)):
+        chunk = max_length // 4 * 3
+        return "base64", "".join(
+            binascii.b2a_base64(body[start : start + chunk]).decode("ascii") for start in range(0, len(body), chunk)
+        )
+    if len(lines) <= 10:
+        return "quoted-printable", sniff_qp
+    return "quoted-printable", quoprimime.body_encode(body.decode("latin-1"), max_length)
+
+
+def _text_part(cte: str) -> str:
+    return f'Content-Type: text/plain; charset="utf-8"\nContent-Transfer-Encoding: {cte}\n'
+
+
+def _fast_boundary(bodies: List[Tuple[str, str]]) -> str:
+    boundary = "=" * 15 + (_BOUNDARY_FORMAT % random.randrange(sys.maxsize)) + "=="
+    candidate, counter = boundary, 0
+    while any(f"--{candidate}" in body for _, body in bodies):
+        candidate, counter = f"{boundary}.{counter}", counter + 1
+    return candidate
+
+
 @dataclass
 class Ticket:
     ticket_id: str
@@ -46,55 +165,32 @@ class Ticket:
     extra_headers: Dict[str, str] = field(default_factory=dict)
 
     @classmethod
-    def from_string(cls, raw: str, fallback_id: Optional[str] = None) -> "Ticket":
-        message = Parser(policy=default).parsestr(raw)
-        ticket_id = message.get("Id") or message.get("Ticket-Id") or fallback_id
-        if not ticket_id:
-            raise ValueError("Ticket id missing")
+    def from_string(
+        cls, raw: str, fallback_id: Optional[str] = None, *, headers_only: bool = False
+    ) -> "Ticket":
+        if headers_only:
+            return cls.from_headers(
+                _split_header_block(raw),
+                fallback_id=fallback_id,
+                loader=lambda: Ticket.from_string(raw, fallback_id=fallback_id),
+            )
 
-        subject = message.get("Subject", "").strip()
+        message = _parser().parsestr(raw)
+        fields = _header_fields(message, fallback_id)
         documents = _extract_documents(message)
         body_text = documents[0] if documents else ""
+        return cls(body=body_text, documents=documents, **fields)
 
-        assignee = message.get("Assignee")
-        tags = _split_tags(message.get("Tags", ""))
-        status = message.get("Status")
-
-        created_at = message.get("Created")
-        updated_at = message.get("Updated")
-
-        extra_headers: Dict[str, str] = {}
-        for key, value in message.items():
-            if key in {
-                "Id",
-                "Ticket-Id",
-                "Subject",
-                "Assignee",
-                "Tags",
-                "Status",
-                "Created",
-                "Updated",
-                "Content-Type",
-                "Content-Transfer-Encoding",
-                "MIME-Version",
-            }:
-                continue
-            extra_headers[key] = value
-
-        return cls(
-            ticket_id=ticket_id,
-            subject=subject,
-            body=body_text,
-            assignee=assignee,
-            tags=tags,
-            status=status,
-            created_at=created_at,
-            updated_at=updated_at,
-            documents=documents,
-            extra_headers=extra_headers,
-        )
+    @classmethod
+    def from_headers(
+        cls, header_block: str, *, loader: Callable[[], "Ticket"], fallback_id: Optional[str] = None
+    ) -> "LazyTicket":
+        message = _parser().parsestr(header_block, headersonly=True)
+        return LazyTicket(loader=loader, **_header_fields(message, fallback_id))
 
     def to_message(self) -> EmailMessage:
+        from email.message import EmailMessage
+
         message = EmailMessage()
         message["Id"] = self.ticket_id
         message["Subject"] = self.subject
@@ -125,4 +221,76 @@ class Ticket:
         return message
 
     def to_string(self) -> str:
-        return self.to_message().as_string()
+        fast = self._fast_string()
+        return fast if fast is not None else self.to_message().as_string()
+
+    def _fast_string(self) -> Optional[str]:
+        headers: List[Optional[str]] = [_fast_header("Id", self.ticket_id), _fast_header("Subject", self.subject)]
+        seen = {"id", "subject"}
+        for name, value in (
+            ("Assignee", self.assignee),
+            ("Tags", self.tags),
+            ("Status", self.status),
+            ("Created", self.created_at),
+            ("Updated", self.updated_at),
+        ):
+            if value:
+                headers.append(_fast_header(name, _join_tags(value) if name == "Tags" else value))
+                seen.add(name.lower())
+        for name, value in self.extra_headers.items():
+            if name.lower() in seen:
+                continue
+            headers.append(_fast_header(name, value))
+            seen.add(name.lower())
+        documents = self.documents or ([self.body] if self.body else [""])
+        bodies = [_fast_body(document) for document in documents]
+        if any(header is None for header in headers) or any(body is None for body in bodies):
+            return None
+        head = "".join(headers)  # type: ignore[arg-type]
+        encoded: List[Tuple[str, str]] = bodies  # type: ignore[assignment]
+        if len(encoded) == 1:
+            cte, payload = encoded[0]
+            return f"{head}{_text_part(cte)}MIME-Version: 1.0\n\n{payload}"
+        boundary = _fast_boundary(encoded)
+        parts = [f"{head}MIME-Version: 1.0\nContent-Type: multipart/mixed; boundary=\"{boundary}\"\n\n"]
+        cte, payload = encoded[0]
+        parts.append(f"--{boundary}\n{_text_part(cte)}\n{payload}")
+        for cte, payload in encoded[1:]:
+            parts.append(f"\n--{boundary}\n{_text_part(cte)}{_ATTACHMENT_HEADERS}\n{payload}")
+        parts.append(f"\n--{boundary}--\n")
+        return "".join(parts)
+
+
+class LazyTicket(Ticket):
+    def __init__(self, *, loader: Callable[[], Ticket], **fields: object) -> None:
+        super().__init__(body="", documents=[], **fields)  # type: ignore[arg-type]
+        self._loader: Optional[Callable[[], Ticket]] = loader
+
+    def _materialize(self) -> None:
+        loader = getattr(self, "_loader", None)
+        if loader is None:
+            return
+        self._loader = None
+        loaded = loader()
+        self._body = loaded.body
+        self._documents = loaded.documents
+
+    @property  # type: ignore[override]
+    def body(self) -> str:
+        self._materialize()
+        return self._body
+
+    @body.setter
+    def body(self, value: str) -> None:
+        self._materialize()
+        self._body = value
+
+    @property  # type: ignore[override]
+    def documents(self) -> List[str]:
+        self._materialize()
+        return self._documents
+
+    @documents.setter
+    def documents(self, value: List[str]) -> None:
+        self._materialize()
+        self._documents = value
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import bisect
 import curses
 from curses import textpad
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from tkts.backends import Backend, get_backend_from_env
 from tkts.models import Ticket
+from tkts.watch import Watcher, watch_directories
 
 
 STATUS_ORDER = ["in-progress", "in-review", "todo", "blocked", "done"]
@@ -15,6 +18,20 @@ STATUS_RANK = {status: idx for idx, status in enumerate(STATUS_ORDER)}
 SORT_MODES = ["status", "updated", "created", "subject"]
 
 
+@lru_cache(maxsize=65536)
+def _parse_timestamp(value: str) -> float:
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt).timestamp()
+        except ValueError:
+            continue
+    return 0.0
+
+
 @dataclass
 class Row:
     kind: str
@@ -66,6 +83,16 @@ class TuiApp:
 
         self.watch_interval = 5.0
         self.watch_enabled = False
+        self._watcher: Optional[Watcher] = None
+        self._filtered: Optional[List[Ticket]] = None
+        self._filter_state: Optional[Tuple[FrozenSet[str], FrozenSet[str], str, str]] = None
+        self._subject_lc: Dict[str, str] = {}
+        self._body_lc: Dict[str, str] = {}
+        self._sort_keys: Dict[str, Dict[str, Any]] = {}
+        self._ticket_rows: Dict[str, Row] = {}
+
+        self._screen_lines: Dict[int, Tuple[str, int]] = {}
+        self._screen_key: Optional[Tuple[str, int, int]] = None
         if watch is not None:
             self.watch_interval = max(0.1, float(watch))
             self.watch_enabled = True
@@ -77,33 +104,119 @@ class TuiApp:
         self.message = ""
 
     def refresh_tickets(self) -> None:
-        focused_id: Optional[str] = None
-        if self.mode == "detail" and self.detail_ticket:
-            focused_id = self.detail_ticket.ticket_id
-        elif self.mode == "list":
-            row = self._current_row()
-            if row and row.kind == "ticket" and row.ticket:
-                focused_id = row.ticket.ticket_id
-
+        focused_id = self._focused_id()
+        self._reset_watcher()
         self.tickets = self.backend.list_tickets()
+        self._forget(None)
         valid_ids = {ticket.ticket_id for ticket in self.tickets}
         self.selection = {tid: True for tid in self.selection if tid in valid_ids}
         self.apply_filters()
-        if focused_id:
-            for idx, row in enumerate(self.rows):
-                if row.kind == "ticket" and row.ticket and row.ticket.ticket_id == focused_id:
-                    self.selected_idx = idx
-                    break
-
-    def apply_filters(self) -> None:
-        filtered = [ticket for ticket in self.tickets if self._match_filters(ticket)]
-        filtered = self._sort_tickets(filtered)
+        self._restore_focus(focused_id)
+
+    def poll_changes(self) -> bool:
+        if self._watcher is None:
+            self.refresh_tickets()
+            return True
+        changed = self._watcher.poll()
+        if changed is None:
+            self.refresh_tickets()
+            return True
+        if not changed:
+            return False
+        focused_id = self._focused_id()
+        reloaded: Dict[str, Optional[Ticket]] = self.backend.reload_tickets(changed)  # type: ignore[attr-defined]
+        self._forget(reloaded)
+        self.tickets = [ticket for ticket in self.tickets if ticket.ticket_id not in reloaded]
+        self.tickets.extend(ticket for ticket in reloaded.values() if ticket)
+        for ticket_id, ticket in reloaded.items():
+            if ticket is None:
+                self.selection.pop(ticket_id, None)
+        self.apply_filters(changed=reloaded)
+        self._restore_focus(focused_id)
+        return True
+
+    def _close_watcher(self) -> None:
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def _reset_watcher(self) -> None:
+        self._close_watcher()
+        if not self.watch_enabled:
+            return
+        if not hasattr(self.backend, "watch_directories") or not hasattr(self.backend, "reload_tickets"):
+            return
+        try:
+            self._watcher = watch_directories(self.backend.watch_directories())  # type: ignore[attr-defined]
+        except OSError:
+            self._watcher = None
+
+    def _focused_id(self) -> Optional[str]:
+        if self.mode == "detail" and self.detail_ticket:
+            return self.detail_ticket.ticket_id
+        if self.mode == "list":
+            row = self._current_row()
+            if row and row.kind == "ticket" and row.ticket:
+                return row.ticket.ticket_id
+        return None
+
+    def _restore_focus(self, focused_id: Optional[str]) -> None:
+        if not focused_id:
+            return
+        for idx, row in enumerate(self.rows):
+            if row.kind == "ticket" and row.ticket and row.ticket.ticket_id == focused_id:
+                self.selected_idx = idx
+                break
+
+    def apply_filters(self, changed: Optional[Dict[str, Optional[Ticket]]] = None) -> None:
+        state = (
+            frozenset(self.filter_statuses),
+            frozenset(self.filter_tags),
+            self.search_query.lower(),
+            self.sort_mode,
+        )
+        previous = self._filter_state
+        if changed is not None and self._filtered is not None and previous == state:
+            # Watch tick: drop the changed tickets and insert the survivors in sort order.
+            filtered = [ticket for ticket in self._filtered if ticket.ticket_id not in changed]
+            key = self._sort_key()
+            for ticket in changed.values():
+                if ticket and self._match_filters(ticket):
+                    bisect.insort(filtered, ticket, key=key)
+        elif (
+            changed is None
+            and self._filtered is not None
+            and previous is not None
+            and previous[:2] == state[:2]
+            and state[2].startswith(previous[2])
+        ):
+            # Same status/tag filters and a longer search: narrow the previous (already sorted) result.
+            filtered = self._filtered
+            if state[2] != previous[2]:
+                filtered = [ticket for ticket in filtered if self._match_search(ticket, state[2])]
+            if state[3] != previous[3]:
+                filtered = self._sort_tickets(filtered)
+        else:
+            filtered = self._sort_tickets([ticket for ticket in self.tickets if self._match_filters(ticket)])
+        self._filtered = filtered
+        self._filter_state = state
         self.rows = self._build_rows(filtered)
         if self.selected_idx >= len(self.rows):
             self.selected_idx = max(0, len(self.rows) - 1)
         if self.scroll > self.selected_idx:
             self.scroll = self.selected_idx
 
+    def _forget(self, changed: Optional[Dict[str, Optional[Ticket]]]) -> None:
+        caches: List[Dict[str, Any]] = [self._subject_lc, self._body_lc, self._ticket_rows, *self._sort_keys.values()]
+        for cache in caches:
+            if changed is None:
+                cache.clear()
+                continue
+            for ticket_id in changed:
+                cache.pop(ticket_id, None)
+        if changed is None:
+            self._filtered = None
+
     def _match_filters(self, ticket: Ticket) -> bool:
         if self.filter_statuses:
             if (ticket.status or "") not in self.filter_statuses:
@@ -114,33 +227,59 @@ class TuiApp:
             if not any(tag in self.filter_tags for tag in ticket.tags):
                 return False
         if self.search_query:
-            needle = self.search_query.lower()
-            hay = f"{ticket.subject}\n{ticket.body}".lower()
-            if needle not in hay:
-                return False
+            return self._match_search(ticket, self.search_query.lower())
         return True
 
-    def _sort_tickets(self, tickets: List[Ticket]) -> List[Ticket]:
-        if self.sort_mode == "subject":
-            return sorted(tickets, key=lambda t: (t.subject or "").lower())
-        if self.sort_mode == "created":
-            return sorted(tickets, key=lambda t: self._timestamp(t.created_at), reverse=True)
-        if self.sort_mode == "updated":
-            return sorted(tickets, key=lambda t: self._timestamp(t.updated_at), reverse=True)
-        if self.sort_mode == "status":
-            return sorted(
-                tickets,
-                key=lambda t: (
-                    STATUS_RANK.get(t.status or "", len(STATUS_RANK)),
-                    -self._timestamp(t.updated_at),
-                    (t.subject or "").lower(),
-                ),
+    def _match_search(self, ticket: Ticket, needle: str) -> bool:
+        subject = self._subject_lc.get(ticket.ticket_id)
+        if subject is None:
+            subject = self._subject_lc[ticket.ticket_id] = (ticket.subject or "").lower()
+        if needle in subject:
+            return True
+        body = self._body_lc.get(ticket.ticket_id)
+        if body is None:
+            body = self._body_lc[ticket.ticket_id] = (ticket.body or "").lower()
+        return needle in body
+
+    def _sort_key(self) -> Callable[[Ticket], Any]:
+        mode = self.sort_mode
+        cache = self._sort_keys.setdefault(mode, {})
+
+        def key(ticket: Ticket) -> Any:
+            value = cache.get(ticket.ticket_id)
+            if value is None:
+                value = cache[ticket.ticket_id] = self._compute_sort_key(ticket, mode)
+            return value
+
+        return key
+
+    def _compute_sort_key(self, ticket: Ticket, mode: str) -> Any:
+        if mode == "subject":
+            return (ticket.subject or "").lower()
+        if mode == "created":
+            return -self._timestamp(ticket.created_at)
+        if mode == "updated":
+            return -self._timestamp(ticket.updated_at)
+        if mode == "status":
+            return (
+                STATUS_RANK.get(ticket.status or "", len(STATUS_RANK)),
+                -self._timestamp(ticket.updated_at),
+                (ticket.subject or "").lower(),
             )
-        return tickets
+        return 0
+
+    def _sort_tickets(self, tickets: List[Ticket]) -> List[Ticket]:
+        return sorted(tickets, key=self._sort_key())
+
+    def _ticket_row(self, ticket: Ticket) -> Row:
+        row = self._ticket_rows.get(ticket.ticket_id)
+        if row is None or row.ticket is not ticket:
+            row = self._ticket_rows[ticket.ticket_id] = Row(kind="ticket", ticket=ticket)
+        return row
 
     def _build_rows(self, tickets: List[Ticket]) -> List[Row]:
         if not self.group_view:
-            return [Row(kind="ticket", ticket=ticket) for ticket in tickets]
+            return [self._ticket_row(ticket) for ticket in tickets]
         grouped: Dict[str, List[Ticket]] = {}
         for ticket in tickets:
             group = (ticket.tags[0] if ticket.tags else "untagged")
@@ -155,22 +294,13 @@ class TuiApp:
             if self.collapsed_groups.get(group):
                 continue
             for ticket in grouped[group]:
-                rows.append(Row(kind="ticket", ticket=ticket))
+                rows.append(self._ticket_row(ticket))
         return rows
 
     def _timestamp(self, value: Optional[str]) -> float:
         if not value:
             return 0.0
-        try:
-            return datetime.fromisoformat(value).timestamp()
-        except ValueError:
-            pass
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(value, fmt).timestamp()
-            except ValueError:
-                continue
-        return 0.0
+        return _parse_timestamp(value)
 
     def run(self, stdscr: "curses._CursesWindow") -> int:
         curses.curs_set(0)
@@ -187,31 +317,23 @@ class TuiApp:
             curses.init_pair(5, curses.COLOR_BLUE, -1)
 
         self.refresh_tickets()
+        needs_render = True
         while True:
             self._apply_watch_timeout(stdscr)
-            stdscr.erase()
-            if self.mode == "list":
-                self._render_list(stdscr)
-            elif self.mode == "detail":
-                self._render_detail(stdscr)
-            elif self.mode in {"edit", "create"}:
-                self._render_form(stdscr)
-            elif self.mode == "filter":
-                self._render_filter(stdscr)
-            elif self.mode == "bulk":
-                self._render_bulk(stdscr)
-            elif self.mode == "help":
-                self._render_help(stdscr)
-            stdscr.refresh()
+            if needs_render:
+                self._render(stdscr)
 
             key = stdscr.getch()
             if key == -1:
+                needs_render = False
                 if self.watch_enabled and self.mode == "list":
                     try:
-                        self.refresh_tickets()
+                        needs_render = self.poll_changes()
                     except Exception as exc:
                         self.set_message(f"Refresh failed: {exc}")
-                    continue
+                        needs_render = True
+                continue
+            needs_render = True
             if self.mode == "list":
                 if self._handle_list_key(stdscr, key):
                     return 0
@@ -231,6 +353,40 @@ class TuiApp:
                 if key in {ord("q"), 27, ord("?")}:  # esc
                     self.mode = "list"
 
+    def _render(self, stdscr: "curses._CursesWindow") -> None:
+        height, width = stdscr.getmaxyx()
+        screen_key = (self.mode, height, width)
+        if self.mode != "list" or screen_key != self._screen_key:
+            stdscr.erase()
+            self._screen_lines = {}
+            self._screen_key = screen_key
+        if self.mode == "list":
+            self._render_list(stdscr)
+        elif self.mode == "detail":
+            self._render_detail(stdscr)
+        elif self.mode in {"edit", "create"}:
+            self._render_form(stdscr)
+        elif self.mode == "filter":
+            self._render_filter(stdscr)
+        elif self.mode == "bulk":
+            self._render_bulk(stdscr)
+        elif self.mode == "help":
+            self._render_help(stdscr)
+        stdscr.refresh()
+
+    def _draw_line(self, stdscr: "curses._CursesWindow", y: int, text: str, attr: int = curses.A_NORMAL) -> None:
+        # Only touch lines whose text or attributes changed since the last frame.
+        if self._screen_lines.get(y) == (text, attr):
+            return
+        stdscr.move(y, 0)
+        stdscr.clrtoeol()
+        if text:
+            stdscr.addstr(y, 0, text, attr)
+        self._screen_lines[y] = (text, attr)
+
+    def _invalidate_screen(self) -> None:
+        self._screen_key = None
+
     def _monochrome(self) -> bool:
         return bool(int(__import__("os").environ.get("TKTS_TUI_MONO", "0")))
 
@@ -243,7 +399,7 @@ class TuiApp:
     def _render_list(self, stdscr: "curses._CursesWindow") -> None:
         height, width = stdscr.getmaxyx()
         header = "tkts TUI"
-        stdscr.addstr(0, 0, header[: width - 1], curses.A_BOLD)
+        self._draw_line(stdscr, 0, header[: width - 1], curses.A_BOLD)
 
         columns = self._compute_columns(width)
         header_line = (
@@ -251,7 +407,7 @@ class TuiApp:
             f"{columns['status']:<{columns['status_w']}} {columns['tags']:<{columns['tags_w']}} "
             f"{columns['updated']:<{columns['updated_w']}}"
         )
-        stdscr.addstr(1, 0, header_line[: width - 1], curses.A_DIM)
+        self._draw_line(stdscr, 1, header_line[: width - 1], curses.A_DIM)
 
         max_rows = max(0, height - 4)
         if self.selected_idx < self.scroll:
@@ -276,10 +432,11 @@ class TuiApp:
                 label = f"{prefix} {group}"
                 if summary:
                     label = f"{label} ({summary})"
-                stdscr.addstr(line_no, 0, label[: width - 1], attr | curses.A_BOLD)
+                self._draw_line(stdscr, line_no, label[: width - 1], attr | curses.A_BOLD)
                 continue
             ticket = row.ticket
             if not ticket:
+                self._draw_line(stdscr, line_no, "")
                 continue
             short_id = ticket.ticket_id[:5]
             if self.selection.get(ticket.ticket_id):
@@ -294,7 +451,9 @@ class TuiApp:
                 f"{status:<{columns['status_w']}} {tags:<{columns['tags_w']}} "
                 f"{updated:<{columns['updated_w']}}"
             )
-            stdscr.addstr(line_no, 0, line[: width - 1], attr)
+            self._draw_line(stdscr, line_no, line[: width - 1], attr)
+        for line_no in range(2 + len(visible), 2 + max_rows):
+            self._draw_line(stdscr, line_no, "")
 
         self._render_status_bar(stdscr, "list")
 
@@ -351,10 +510,9 @@ class TuiApp:
             status_line += " | Filters: none"
         hint_line = "Keys: ? help  / search  f filter  s sort  t group  w watch  c create  b bulk  r refresh  q quit"
         message_line = self.message
-        stdscr.addstr(height - 2, 0, self._truncate(message_line, width - 1))
+        self._draw_line(stdscr, height - 2, self._truncate(message_line, width - 1))
         combined = f"{status_line} | {hint_line}"
-        stdscr.addstr(height - 1, 0, " " * (width - 1))
-        stdscr.addstr(height - 1, 0, self._truncate(combined, width - 1), curses.A_BOLD)
+        self._draw_line(stdscr, height - 1, self._truncate(combined, width - 1), curses.A_BOLD)
 
     def _render_detail(self, stdscr: "curses._CursesWindow") -> None:
         height, width = stdscr.getmaxyx()
@@ -473,6 +631,7 @@ class TuiApp:
             self.refresh_tickets()
         elif key in {ord("w")}:  # watch toggle
             self.watch_enabled = not self.watch_enabled
+            self._close_watcher()
             if self.watch_enabled:
                 self.set_message(f"Watch enabled ({self.watch_interval:g}s).")
             else:
@@ -766,6 +925,7 @@ class TuiApp:
         box = textpad.Textbox(edit_win)
         text = box.edit(validator).strip()
         curses.curs_set(0)
+        self._invalidate_screen()
         if cancelled["value"]:
             return None
         return text or ""
@@ -789,6 +949,7 @@ class TuiApp:
         stdscr.refresh()
         text = box.edit().strip()
         curses.curs_set(0)
+        self._invalidate_screen()
         return text
 
     def _format_time(self, value: Optional[str]) -> str:
@@ -825,4 +986,7 @@ class TuiApp:
 def run_tui(*, watch: Optional[float] = None) -> int:
     backend = get_backend_from_env()
     app = TuiApp(backend, watch=watch)
-    return curses.wrapper(app.run)
+    try:
+        return curses.wrapper(app.run)
+    finally:
+        app._close_watcher()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, List, Optional, Sequence, TypeVar
+
+
+STATUS_ORDER = ["todo", "in-progress", "in-review", "blocked", "done"]
+STATUS_RANK = {status: idx for idx, status in enumerate(STATUS_ORDER)}
+SORT_KEYS = ("id", "status", "updated", "created", "subject")
+
+T = TypeVar("T")
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    raw = value.strip()
+    if raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _epoch(value: Optional[str]) -> float:
+    parsed = parse_timestamp(value)
+    return parsed.timestamp() if parsed else 0.0
+
+
+@dataclass
+class TicketQuery:
+    statuses: Optional[List[str]] = None
+    tags: Optional[List[str]] = None
+    assignee: Optional[str] = None
+    text: Optional[str] = None
+    updated_since: Optional[str] = None
+    sort: str = "id"
+    limit: Optional[int] = None
+    offset: int = 0
+
+    def __post_init__(self) -> None:
+        if self.statuses is not None:
+            self.statuses = [status.strip().lower() for status in self.statuses if status and status.strip()]
+        if self.tags is not None:
+            self.tags = [tag.strip() for tag in self.tags if tag and tag.strip()]
+        self.assignee = (self.assignee or "").strip() or None
+        self.text = (self.text or "").strip() or None
+        self.updated_since = (self.updated_since or "").strip() or None
+        if self.updated_since and parse_timestamp(self.updated_since) is None:
+            raise ValueError(f"Invalid updated_since timestamp '{self.updated_since}'.")
+        if self.sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort '{self.sort}'. Allowed values: {', '.join(SORT_KEYS)}.")
+        if self.limit is not None and self.limit < 0:
+            raise ValueError("limit must be >= 0.")
+        if self.offset < 0:
+            raise ValueError("offset must be >= 0.")
+
+    def updated_since_utc(self) -> Optional[datetime]:
+        parsed = parse_timestamp(self.updated_since)
+        return parsed.astimezone(timezone.utc) if parsed else None
+
+    def matches_headers(self, item: Any) -> bool:
+        if self.statuses:
+            if (item.status or "unknown") not in self.statuses:
+                return False
+        if self.tags:
+            if not any(tag in self.tags for tag in item.tags or []):
+                return False
+        if self.assignee:
+            if (item.assignee or "").lower() != self.assignee.lower():
+                return False
+        if self.updated_since:
+            since = self.updated_since_utc()
+            updated = parse_timestamp(item.updated_at)
+            if since and (updated is None or updated < since):
+                return False
+        return True
+
+    def matches_text(self, item: Any) -> bool:
+        if not self.text:
+            return True
+        needle = self.text.lower()
+        if needle in (item.subject or "").lower():
+            return True
+        return needle in (item.body or "").lower()
+
+    def paginate(self, items: Sequence[T]) -> List[T]:
+        end = None if self.limit is None else self.offset + self.limit
+        return list(items[self.offset : end])
+
+
+def sort_items(items: Iterable[T], sort: str) -> List[T]:
+    if sort == "status":
+        return sorted(
+            items,
+            key=lambda item: (
+                STATUS_RANK.get(item.status or "unknown", len(STATUS_RANK)),  # type: ignore[attr-defined]
+                (item.subject or "").lower(),  # type: ignore[attr-defined]
+                item.ticket_id,  # type: ignore[attr-defined]
+            ),
+        )
+    if sort == "updated":
+        return sorted(items, key=lambda item: (-_epoch(item.updated_at), item.ticket_id))  # type: ignore[attr-defined]
+    if sort == "created":
+        return sorted(items, key=lambda item: (-_epoch(item.created_at), item.ticket_id))  # type: ignore[attr-defined]
+    if sort == "subject":
+        return sorted(items, key=lambda item: ((item.subject or "").lower(), item.ticket_id))  # type: ignore[attr-defined]
+    return sorted(items, key=lambda item: item.ticket_id)  # type: ignore[attr-defined]
+
+
+def apply_query(tickets: Iterable[T], query: Optional[TicketQuery]) -> List[T]:
+    if query is None:
+        return list(tickets)
+    matched = [ticket for ticket in tickets if query.matches_headers(ticket) and query.matches_text(ticket)]
+    return query.paginate(sort_items(matched, query.sort))
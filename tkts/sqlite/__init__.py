@@ -0,0 +1,3 @@
+from tkts.sqlite.backend import SqliteBackend
+
+__all__ = ["SqliteBackend"]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pathlib import Path
+import sys
+
+from tkts.sqlite.backend import SqliteBackend
+from tkts.storage import TicketStore
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(
+        prog="python -m tkts.sqlite",
+        description="Import .tkt files into the sqlite backend, or export sqlite tickets back to .tkt files.",
+    )
+    parser.add_argument("action", choices=["import", "export"], help="Direction of the transfer.")
+    parser.add_argument(
+        "--root",
+        default=None,
+        help="Root holding tkts.sqlite3 (defaults to TKTS_ROOT, .tkts/config, or ~/.tkts).",
+    )
+    parser.add_argument(
+        "--files",
+        default=None,
+        help="Root of the file-based store to read or write (defaults to the sqlite root).",
+    )
+    args = parser.parse_args(argv)
+
+    backend = SqliteBackend(root=args.root)
+    store = TicketStore(Path(args.files).expanduser()) if args.files else TicketStore(backend.root)
+    try:
+        if args.action == "import":
+            count = backend.import_tickets(store)
+            print(f"Imported {count} tickets from {store.ticket_dir()} into {backend.path}.")
+        else:
+            count = backend.export_tickets(store)
+            print(f"Exported {count} tickets from {backend.path} to {store.ticket_dir()}.")
+    except (OSError, ValueError) as exc:
+        print(f"Transfer failed: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        backend.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
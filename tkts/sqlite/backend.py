@@ -0,0 +1,547 @@
+from __future__ import annotations
+
+import json
+import os
+import shlex
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from tkts.backends import register_backend
+from tkts.bulk import create_kwargs, update_kwargs
+from tkts.models import LazyTicket, Ticket
+from tkts.query import STATUS_RANK, TicketQuery
+from tkts.storage import (
+    TicketStore,
+    _apply_ticket_updates,
+    _coerce_documents,
+    _extract_change_log,
+    _format_change_log,
+    _normalize_status,
+    _utc_now_iso,
+)
+
+
+_DB_FILENAME = "tkts.sqlite3"
+_TAG_SEPARATOR = "\x1f"
+_HEADER_COLUMNS = (
+    "t.id, t.subject, t.assignee, t.status, t.created_at, t.updated_at, t.extra_headers, "
+    "(SELECT group_concat(tag, char(31)) FROM "
+    "(SELECT tag FROM ticket_tags WHERE ticket_id = t.id ORDER BY position)) AS tags"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    id TEXT PRIMARY KEY,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL DEFAULT '',
+    assignee TEXT,
+    status TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    extra_headers TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS tickets_status ON tickets(status);
+CREATE INDEX IF NOT EXISTS tickets_assignee ON tickets(assignee);
+CREATE INDEX IF NOT EXISTS tickets_updated_at ON tickets(updated_at);
+
+CREATE TABLE IF NOT EXISTS ticket_tags (
+    ticket_id TEXT NOT NULL REFERENCES tickets(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (ticket_id, position)
+);
+CREATE INDEX IF NOT EXISTS ticket_tags_tag ON ticket_tags(tag);
+
+CREATE TABLE IF NOT EXISTS documents (
+    ticket_id TEXT NOT NULL REFERENCES tickets(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    PRIMARY KEY (ticket_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticket_id TEXT NOT NULL REFERENCES tickets(id) ON DELETE CASCADE,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS change_log_ticket ON change_log(ticket_id, seq);
+"""
+
+# Trigrams index every substring of three or more characters, so a MATCH can prefilter the same
+# case-insensitive substring test the other backends apply (``TicketQuery.matches_text``).
+_FTS_SCHEMA = """
+DROP TRIGGER IF EXISTS tickets_fts_insert;
+DROP TRIGGER IF EXISTS tickets_fts_delete;
+DROP TRIGGER IF EXISTS tickets_fts_update;
+DROP TABLE IF EXISTS tickets_fts;
+CREATE VIRTUAL TABLE tickets_fts USING fts5(
+    subject, body, content='tickets', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER tickets_fts_insert AFTER INSERT ON tickets BEGIN
+    INSERT INTO tickets_fts(rowid, subject, body) VALUES (new.rowid, new.subject, new.body);
+END;
+CREATE TRIGGER tickets_fts_delete AFTER DELETE ON tickets BEGIN
+    INSERT INTO tickets_fts(tickets_fts, rowid, subject, body)
+    VALUES ('delete', old.rowid, old.subject, old.body);
+END;
+CREATE TRIGGER tickets_fts_update AFTER UPDATE OF subject, body ON tickets BEGIN
+    INSERT INTO tickets_fts(tickets_fts, rowid, subject, body)
+    VALUES ('delete', old.rowid, old.subject, old.body);
+    INSERT INTO tickets_fts(rowid, subject, body) VALUES (new.rowid, new.subject, new.body);
+END;
+INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild');
+"""
+
+
+_ORDER_BY = {
+    "id": "t.id",
+    "status": "CASE t.status "
+    + " ".join(f"WHEN '{status}' THEN {rank}" for status, rank in STATUS_RANK.items())
+    + f" ELSE {len(STATUS_RANK)} END, lower(t.subject), t.id",
+    "updated": "t.updated_at DESC, t.id",
+    "created": "t.created_at DESC, t.id",
+    "subject": "lower(t.subject), t.id",
+}
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _matches_text(subject: Optional[str], body: Optional[str], text: str) -> bool:
+    return TicketQuery(text=text).matches_text(Ticket(ticket_id="", subject=subject or "", body=body or ""))
+
+
+def _ensure_fts(conn: sqlite3.Connection) -> bool:
+    """Move the full-text index to the trigram tokenizer; False when this SQLite (before 3.34) lacks it."""
+    sql = "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tickets_fts'"
+    row = conn.execute(sql).fetchone()
+    if row and "trigram" in row[0]:
+        return True
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(sql).fetchone()
+        if not (row and "trigram" in row[0]):
+            statement = ""
+            for line in _FTS_SCHEMA.splitlines(keepends=True):
+                # Trigger bodies hold semicolons too; run each statement once SQLite sees it as complete.
+                statement += line
+                if sqlite3.complete_statement(statement):
+                    conn.execute(statement)
+                    statement = ""
+        conn.execute("COMMIT")
+        return True
+    except sqlite3.OperationalError:
+        conn.execute("ROLLBACK")
+        return False
+
+
+class SqliteBackend:
+    def __init__(self, root: Optional[str] = None) -> None:
+        if root:
+            self.root = Path(root).expanduser()
+        else:
+            self.root = TicketStore.from_env().root
+        self.path = self.root / _DB_FILENAME
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._in_transaction = False
+        self._trigram = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(_SCHEMA)
+        self._trigram = _ensure_fts(conn)
+        conn.create_function("tkts_matches_text", 3, _matches_text, deterministic=True)
+        self._conn = conn
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def data_version(self) -> int:
+        """Changes whenever another connection commits to the database."""
+        with self._lock:
+            return int(self._connect().execute("PRAGMA data_version").fetchone()[0])
+
+    def _resolve_ticket_id(self, ticket_id: str) -> Optional[str]:
+        ticket_id = (ticket_id or "").strip()
+        if not ticket_id:
+            return None
+        conn = self._connect()
+        row = conn.execute("SELECT id FROM tickets WHERE id = ?", (ticket_id,)).fetchone()
+        if row:
+            return row[0]
+        rows = conn.execute(
+            "SELECT id FROM tickets WHERE id >= ? AND id < ? ORDER BY id LIMIT 2",
+            (ticket_id, _prefix_upper_bound(ticket_id)),
+        ).fetchall()
+        if not rows:
+            return None
+        if len(rows) > 1:
+            raise ValueError(f"Multiple tickets match '{ticket_id}'. Be more specific.")
+        return rows[0][0]
+
+    def _select(
+        self,
+        where: str = "",
+        params: Sequence[Any] = (),
+        *,
+        joins: str = "",
+        order: str = "t.id",
+        page: str = "",
+    ) -> List[Ticket]:
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                f"SELECT {_HEADER_COLUMNS} FROM tickets t {joins} {where} ORDER BY {order} {page}",
+                tuple(params),
+            ).fetchall()
+        tickets: List[Ticket] = []
+        for ticket_id, subject, assignee, status, created_at, updated_at, extra_headers, tags in rows:
+            tickets.append(
+                LazyTicket(
+                    loader=lambda ticket_id=ticket_id: self._load_or_raise(ticket_id),
+                    ticket_id=ticket_id,
+                    subject=subject,
+                    assignee=assignee,
+                    tags=tags.split(_TAG_SEPARATOR) if tags else [],
+                    status=status,
+                    created_at=created_at,
+                    updated_at=updated_at,
+                    extra_headers=json.loads(extra_headers or "{}"),
+                )
+            )
+        return tickets
+
+    def _load(self, ticket_id: str) -> Optional[Ticket]:
+        conn = self._connect()
+        row = conn.execute(
+            f"SELECT {_HEADER_COLUMNS}, t.body FROM tickets t WHERE t.id = ?", (ticket_id,)
+        ).fetchone()
+        if not row:
+            return None
+        ticket_id, subject, assignee, status, created_at, updated_at, extra_headers, tags, body = row
+        extra_documents = [
+            content
+            for (content,) in conn.execute(
+                "SELECT content FROM documents WHERE ticket_id = ? ORDER BY position", (ticket_id,)
+            )
+        ]
+        entries = [
+            entry
+            for (entry,) in conn.execute("SELECT entry FROM change_log WHERE ticket_id = ? ORDER BY seq", (ticket_id,))
+        ]
+        documents = [body, *extra_documents]
+        if entries:
+            documents.append(_format_change_log(entries))
+        if len(documents) == 1 and not body:
+            documents = []
+        return Ticket(
+            ticket_id=ticket_id,
+            subject=subject,
+            body=body,
+            assignee=assignee,
+            tags=tags.split(_TAG_SEPARATOR) if tags else [],
+            status=status,
+            created_at=created_at,
+            updated_at=updated_at,
+            documents=documents,
+            extra_headers=json.loads(extra_headers or "{}"),
+        )
+
+    def _load_or_raise(self, ticket_id: str) -> Ticket:
+        with self._lock:
+            ticket = self._load(ticket_id)
+        if not ticket:
+            raise FileNotFoundError(f"Ticket {ticket_id} not found.")
+        return ticket
+
+    def _write(self, ticket: Ticket, *, new_entries: Sequence[str] = ()) -> None:
+        documents = _coerce_documents(ticket)
+        change_idx, entries = _extract_change_log(documents)
+        extra_documents = [doc for idx, doc in enumerate(documents) if idx not in {0, change_idx}]
+        replace_log = None if new_entries else entries
+
+        conn = self._connect()
+        with self._transaction():
+            conn.execute(
+                "INSERT INTO tickets (id, subject, body, assignee, status, created_at, updated_at, extra_headers) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET subject = excluded.subject, body = excluded.body, "
+                "assignee = excluded.assignee, status = excluded.status, created_at = excluded.created_at, "
+                "updated_at = excluded.updated_at, extra_headers = excluded.extra_headers",
+                (
+                    ticket.ticket_id,
+                    ticket.subject,
+                    ticket.body or "",
+                    ticket.assignee,
+                    ticket.status,
+                    ticket.created_at,
+                    ticket.updated_at,
+                    json.dumps(ticket.extra_headers, ensure_ascii=True),
+                ),
+            )
+            conn.execute("DELETE FROM ticket_tags WHERE ticket_id = ?", (ticket.ticket_id,))
+            conn.executemany(
+                "INSERT INTO ticket_tags (ticket_id, position, tag) VALUES (?, ?, ?)",
+                [(ticket.ticket_id, idx, tag) for idx, tag in enumerate(ticket.tags)],
+            )
+            conn.execute("DELETE FROM documents WHERE ticket_id = ?", (ticket.ticket_id,))
+            conn.executemany(
+                "INSERT INTO documents (ticket_id, position, content) VALUES (?, ?, ?)",
+                [(ticket.ticket_id, idx, doc) for idx, doc in enumerate(extra_documents)],
+            )
+            if replace_log is not None:
+                conn.execute("DELETE FROM change_log WHERE ticket_id = ?", (ticket.ticket_id,))
+                conn.executemany(
+                    "INSERT INTO change_log (ticket_id, entry) VALUES (?, ?)",
+                    [(ticket.ticket_id, entry) for entry in replace_log],
+                )
+            conn.executemany(
+                "INSERT INTO change_log (ticket_id, entry) VALUES (?, ?)",
+                [(ticket.ticket_id, entry) for entry in new_entries],
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        if self._in_transaction:
+            yield
+            return
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        self._in_transaction = True
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._in_transaction = False
+
+    def list_tickets(
+        self, *, list_name: Optional[str] = None, query: Optional[TicketQuery] = None
+    ) -> List[Ticket]:
+        _ = list_name
+        if query is None:
+            return self._select()
+
+        joins: List[str] = []
+        clauses: List[str] = []
+        params: List[Any] = []
+        if query.statuses:
+            known = [status for status in query.statuses if status != "unknown"]
+            options: List[str] = []
+            if known:
+                options.append(f"t.status IN ({','.join('?' for _ in known)})")
+                params.extend(known)
+            if "unknown" in query.statuses:
+                options.append("t.status IS NULL")
+            clauses.append(f"({' OR '.join(options)})")
+        if query.tags:
+            clauses.append(
+                f"t.id IN (SELECT ticket_id FROM ticket_tags WHERE tag IN ({','.join('?' for _ in query.tags)}))"
+            )
+            params.extend(query.tags)
+        if query.assignee:
+            clauses.append("lower(t.assignee) = lower(?)")
+            params.append(query.assignee)
+        since = query.updated_since_utc()
+        if since:
+            clauses.append("t.updated_at >= ?")
+            params.append(since.isoformat())
+        if query.text:
+            self._connect()
+            if self._trigram and len(query.text) >= 3:
+                # The index narrows the scan; the exact test below decides.
+                clauses.append("t.rowid IN (SELECT rowid FROM tickets_fts WHERE tickets_fts MATCH ?)")
+                params.append(_fts_phrase(query.text))
+            clauses.append("tkts_matches_text(t.subject, t.body, ?)")
+            params.append(query.text)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        page = ""
+        if query.limit is not None or query.offset:
+            page = "LIMIT ? OFFSET ?"
+            params.extend([-1 if query.limit is None else query.limit, query.offset])
+        return self._select(where, params, joins=" ".join(joins), order=_ORDER_BY[query.sort], page=page)
+
+    def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
+        with self._lock:
+            resolved_id = self._resolve_ticket_id(ticket_id)
+            if not resolved_id:
+                return None
+            return self._load(resolved_id)
+
+    def create_ticket(
+        self,
+        subject: str,
+        body: str = "",
+        assignee: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        status: Optional[str] = None,
+    ) -> Ticket:
+        ticket = self._new_ticket(subject=subject, body=body, assignee=assignee, tags=tags, status=status)
+        with self._lock:
+            self._write(ticket)
+        return ticket
+
+    def create_tickets(self, tickets: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        created = [self._new_ticket(**create_kwargs(spec)) for spec in tickets]
+        with self._lock, self._transaction():
+            for ticket in created:
+                self._write(ticket)
+        return created
+
+    def _new_ticket(
+        self,
+        *,
+        subject: str,
+        body: str = "",
+        assignee: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        status: Optional[str] = None,
+    ) -> Ticket:
+        now = _utc_now_iso()
+        return Ticket(
+            ticket_id=uuid.uuid4().hex,
+            subject=subject,
+            body=body,
+            assignee=assignee,
+            tags=list(tags or []),
+            status=_normalize_status(status),
+            created_at=now,
+            updated_at=now,
+        )
+
+    def edit_ticket(self, ticket_id: str) -> Ticket:
+        with self._lock:
+            resolved_id = self._resolve_ticket_id(ticket_id)
+            ticket = self._load(resolved_id) if resolved_id else None
+        if not ticket:
+            raise FileNotFoundError(f"Ticket {ticket_id} not found.")
+
+        with tempfile.NamedTemporaryFile("w", suffix=".tkt", encoding="utf-8", delete=False) as handle:
+            handle.write(ticket.to_string())
+            path = Path(handle.name)
+        try:
+            editor = os.environ.get("EDITOR") or "vi"
+            subprocess.run(shlex.split(editor) + [str(path)], check=False)
+            edited = Ticket.from_string(path.read_text(encoding="utf-8"), fallback_id=ticket.ticket_id)
+        finally:
+            path.unlink(missing_ok=True)
+
+        edited.ticket_id = ticket.ticket_id
+        edited.updated_at = _utc_now_iso()
+        with self._lock:
+            self._write(edited)
+        return edited
+
+    def update_ticket(
+        self,
+        ticket_id: str,
+        subject: Optional[str] = None,
+        body: Optional[str] = None,
+        assignee: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        status: Optional[str] = None,
+        append_body: Optional[str] = None,
+        comment: Optional[str] = None,
+        log_message: Optional[str] = None,
+    ) -> Ticket:
+        with self._lock:
+            return self._update(
+                ticket_id,
+                subject=subject,
+                body=body,
+                assignee=assignee,
+                tags=tags,
+                status=status,
+                append_body=append_body,
+                comment=comment,
+                log_message=log_message,
+            )
+
+    def update_tickets(self, updates: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        specs = [update_kwargs(spec) for spec in updates]
+        with self._lock, self._transaction():
+            return [self._update(ticket_id, **fields) for ticket_id, fields in specs]
+
+    def _update(self, ticket_id: str, **fields: Any) -> Ticket:
+        resolved_id = self._resolve_ticket_id(ticket_id)
+        ticket = self._load(resolved_id) if resolved_id else None
+        if not ticket:
+            raise FileNotFoundError(f"Ticket {ticket_id} not found.")
+
+        now = _utc_now_iso()
+        changes = _apply_ticket_updates(ticket, now, **fields)
+        if not changes:
+            return ticket
+
+        ticket.updated_at = now
+        self._write(ticket, new_entries=changes)
+        return self._load_or_raise(ticket.ticket_id)
+
+    def tail_ticket_changelog(self, ticket_id: str, limit: int = 10) -> List[str]:
+        with self._lock:
+            resolved_id = self._resolve_ticket_id(ticket_id)
+            if not resolved_id:
+                raise FileNotFoundError(f"Ticket {ticket_id} not found.")
+            if limit <= 0:
+                return []
+            rows = self._connect().execute(
+                "SELECT entry FROM change_log WHERE ticket_id = ? ORDER BY seq DESC LIMIT ?",
+                (resolved_id, limit),
+            ).fetchall()
+        return [entry for (entry,) in reversed(rows)]
+
+    def import_tickets(self, store: TicketStore) -> int:
+        count = 0
+        for ticket_id in store.list_ids():
+            ticket = store.get_ticket(ticket_id)
+            if not ticket:
+                continue
+            with self._lock:
+                self._write(ticket)
+            count += 1
+        return count
+
+    def export_tickets(self, store: TicketStore) -> int:
+        with self._lock:
+            ticket_ids = [row[0] for row in self._connect().execute("SELECT id FROM tickets ORDER BY id")]
+        count = 0
+        for ticket_id in ticket_ids:
+            with self._lock:
+                ticket = self._load(ticket_id)
+            if not ticket:
+                continue
+            store.save_ticket(ticket)
+            count += 1
+        return count
+
+
+def _sqlite_backend_factory(root: Optional[str]) -> SqliteBackend:
+    return SqliteBackend(root=root)
+
+
+register_backend("sqlite", _sqlite_backend_factory)
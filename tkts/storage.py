@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import json
 import os
 import shlex
+import shutil
 import subprocess
+import tempfile
 import uuid
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
-from tkts.models import Ticket
+from tkts.bulk import create_kwargs, update_kwargs
+from tkts.index import IndexEntry, TicketIndex
+from tkts.locking import atomic_write_text, file_lock
+from tkts.models import LazyTicket, Ticket
+from tkts.query import TicketQuery, sort_items
 
 
 _ALLOWED_STATUSES = {"todo", "in-progress", "in-review", "blocked", "done"}
 _CHANGE_LOG_HEADER = "Change Log:"
+_JOURNAL_COMPACT_BYTES = 256 * 1024
+_TRUE_VALUES = {"1", "true", "yes", "y", "on"}
 
 
 def _normalize_status(status: Optional[str]) -> Optional[str]:
@@ -86,6 +96,104 @@ def _update_documents(ticket: Ticket, documents: List[str]) -> None:
     ticket.body = documents[0] if documents else ""
 
 
+def _fold_change_log(ticket: Ticket, changes: List[str]) -> None:
+    documents = _coerce_documents(ticket)
+    if documents:
+        documents[0] = ticket.body
+    else:
+        documents = [ticket.body]
+
+    change_idx, entries = _extract_change_log(documents)
+    entries.extend(changes)
+    change_doc = _format_change_log(entries)
+    if change_idx is None:
+        documents.append(change_doc)
+    else:
+        documents[change_idx] = change_doc
+    _update_documents(ticket, documents)
+
+
+def _apply_journal(ticket: Ticket, records: List[Dict[str, Any]]) -> None:
+    changes: List[str] = []
+    for record in records:
+        kind = record.get("kind")
+        if kind == "block":
+            ticket.body = _append_body_block(
+                ticket.body, str(record.get("label") or ""), str(record.get("message") or ""), str(record.get("at") or "")
+            )
+        elif kind == "log":
+            changes.append(str(record.get("entry") or ""))
+        if record.get("at"):
+            ticket.updated_at = str(record["at"])
+    if records:
+        _fold_change_log(ticket, changes)
+
+
+def _apply_ticket_updates(
+    ticket: Ticket,
+    now: str,
+    *,
+    subject: Optional[str] = None,
+    body: Optional[str] = None,
+    assignee: Optional[str] = None,
+    tags: Optional[Iterable[str]] = None,
+    status: Optional[str] = None,
+    append_body: Optional[str] = None,
+    comment: Optional[str] = None,
+    log_message: Optional[str] = None,
+) -> List[str]:
+    changes: List[str] = []
+
+    if subject is not None:
+        normalized_subject = subject.strip()
+        if not normalized_subject:
+            raise ValueError("Subject cannot be empty.")
+        if normalized_subject != ticket.subject:
+            changes.append(f"- {now} subject updated")
+            ticket.subject = normalized_subject
+
+    if body is not None:
+        if body != ticket.body:
+            changes.append(f"- {now} body replaced")
+            ticket.body = body
+
+    if assignee is not None:
+        normalized_assignee = _normalize_optional_string(assignee)
+        if normalized_assignee != ticket.assignee:
+            changes.append(f"- {now} assignee updated")
+            ticket.assignee = normalized_assignee
+
+    if tags is not None:
+        normalized_tags = _normalize_tags(tags) or []
+        if normalized_tags != ticket.tags:
+            changes.append(f"- {now} tags updated")
+            ticket.tags = normalized_tags
+
+    if status is not None:
+        normalized_status = _normalize_optional_string(status)
+        normalized_status = _normalize_status(normalized_status)
+        if normalized_status != ticket.status:
+            from_status = ticket.status or "unknown"
+            to_status = normalized_status or "unknown"
+            changes.append(f"- {now} status {from_status} -> {to_status}")
+            ticket.status = normalized_status
+
+    append_body_text = _normalize_optional_string(append_body)
+    if append_body_text:
+        changes.append(f"- {now} body appended")
+        ticket.body = _append_body_block(ticket.body, "Update", append_body_text, now)
+
+    comment_text = _normalize_optional_string(comment)
+    if comment_text:
+        changes.append(f"- {now} comment added")
+        ticket.body = _append_body_block(ticket.body, "Comment", comment_text, now)
+
+    if log_message:
+        changes.append(f"- {now} note: {log_message.strip()}")
+
+    return changes
+
+
 def _find_config_path(start: Path) -> Optional[Path]:
     resolved = start.resolve()
     for candidate_root in (resolved, *resolved.parents):
@@ -95,10 +203,15 @@ def _find_config_path(start: Path) -> Optional[Path]:
     return None
 
 
+class TicketConflictError(RuntimeError):
+    pass
+
+
 @dataclass
 class TktsConfig:
     root: Optional[str] = None
     backend: Optional[str] = None
+    journal: Optional[bool] = None
 
 
 def _read_config(path: Path) -> TktsConfig:
@@ -118,6 +231,8 @@ def _read_config(path: Path) -> TktsConfig:
                 config.root = value.strip()
             elif normalized in {"backend", "tkts_backend"}:
                 config.backend = value.strip()
+            elif normalized in {"journal", "tkts_journal"}:
+                config.journal = value.strip().lower() in _TRUE_VALUES
             continue
         if config.root is None:
             config.root = stripped
@@ -131,19 +246,31 @@ def load_config(start: Optional[Path] = None) -> TktsConfig:
     return _read_config(candidate)
 
 
+def journal_enabled(config: Optional[TktsConfig] = None) -> bool:
+    raw = os.environ.get("TKTS_JOURNAL")
+    if raw is not None:
+        return raw.strip().lower() in _TRUE_VALUES
+    config = config or load_config()
+    return bool(config.journal)
+
+
 @dataclass
 class TicketStore:
     root: Path
+    journal: bool = False
+    _index: Optional[TicketIndex] = field(default=None, init=False, repr=False, compare=False)
+    _batch_depth: int = field(default=0, init=False, repr=False, compare=False)
 
     @classmethod
     def from_env(cls) -> "TicketStore":
+        config = load_config()
+        journal = journal_enabled(config)
         root = os.environ.get("TKTS_ROOT")
         if root:
-            return cls(Path(root).expanduser())
-        config = load_config()
+            return cls(Path(root).expanduser(), journal=journal)
         if config.root:
-            return cls(Path(config.root).expanduser())
-        return cls(Path.home() / ".tkts")
+            return cls(Path(config.root).expanduser(), journal=journal)
+        return cls(Path.home() / ".tkts", journal=journal)
 
     def ensure(self) -> None:
         self.root.mkdir(parents=True, exist_ok=True)
@@ -154,12 +281,172 @@ class TicketStore:
     def _ticket_path(self, ticket_id: str) -> Path:
         return self.ticket_dir() / f"{ticket_id}.tkt"
 
+    def journal_dir(self) -> Path:
+        return self.root / "journal"
+
+    def _journal_path(self, ticket_id: str) -> Path:
+        return self.journal_dir() / f"{ticket_id}.log"
+
+    def _read_journal(self, ticket_id: str) -> List[Dict[str, Any]]:
+        try:
+            raw = self._journal_path(ticket_id).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return []
+        records: List[Dict[str, Any]] = []
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        return records
+
+    def _tail_journal(self, ticket_id: str, limit: int) -> List[str]:
+        try:
+            handle = self._journal_path(ticket_id).open("rb")
+        except FileNotFoundError:
+            return []
+        entries: List[str] = []
+        with handle:
+            position = handle.seek(0, os.SEEK_END)
+            remainder = b""
+            while position > 0 and len(entries) < limit:
+                step = min(8192, position)
+                position -= step
+                handle.seek(position)
+                lines = (handle.read(step) + remainder).split(b"\n")
+                remainder = lines.pop(0) if position > 0 else b""
+                for line in reversed(lines):
+                    if len(entries) >= limit:
+                        break
+                    try:
+                        record = json.loads(line.decode("utf-8"))
+                    except ValueError:
+                        continue
+                    if record.get("kind") == "log":
+                        entries.append(str(record.get("entry") or ""))
+        entries.reverse()
+        return entries
+
+    def _append_journal(self, ticket_id: str, records: List[Dict[str, Any]]) -> os.stat_result:
+        path = self._journal_path(ticket_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = "".join(json.dumps(record, ensure_ascii=True) + "\n" for record in records)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(payload)
+        return path.stat()
+
+    def _journal_stat(self, ticket_id: str) -> Optional[os.stat_result]:
+        try:
+            return self._journal_path(ticket_id).stat()
+        except FileNotFoundError:
+            return None
+
+    def _discard_journal(self, ticket_id: str) -> None:
+        self._journal_path(ticket_id).unlink(missing_ok=True)
+
+    def _journal_updated_at(self, ticket_id: str) -> Optional[str]:
+        records = self._read_journal(ticket_id)
+        for record in reversed(records):
+            if record.get("at"):
+                return str(record["at"])
+        return None
+
+    def _load_ticket(self, path: Path) -> Ticket:
+        ticket = self._read_ticket_path(path)
+        _apply_journal(ticket, self._read_journal(path.stem))
+        return ticket
+
+    def compact_ticket(self, ticket_id: str) -> Ticket:
+        resolved_id = self._resolve_ticket_id(ticket_id)
+        if not resolved_id:
+            raise FileNotFoundError(f"Ticket {ticket_id} not found.")
+        with self._ticket_lock(resolved_id):
+            ticket = self._load_ticket(self._ticket_path(resolved_id))
+            if self._journal_path(resolved_id).exists():
+                self._write_ticket_file(ticket)
+        return ticket
+
+    def _ticket_lock(self, ticket_id: str) -> ContextManager[None]:
+        return file_lock(self.root / "locks" / f"{ticket_id}.lock")
+
+    def _current_updated_at(self, ticket_id: str) -> Optional[str]:
+        path = self._ticket_path(ticket_id)
+        if not path.exists():
+            return None
+        return self._journal_updated_at(ticket_id) or self._read_ticket_headers(path).updated_at
+
+    def _check_updated_at(self, ticket_id: str, expected_updated_at: Optional[str]) -> None:
+        if expected_updated_at is None:
+            return
+        current = self._current_updated_at(ticket_id)
+        if current != expected_updated_at:
+            raise TicketConflictError(
+                f"Ticket {ticket_id} was updated at {current}, expected {expected_updated_at}. Reload and retry."
+            )
+
+    def _flush_index(self) -> None:
+        if self._batch_depth == 0:
+            self.index().flush()
+
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._flush_index()
+
+    def index(self) -> TicketIndex:
+        if self._index is None:
+            self._index = TicketIndex.for_root(self.root)
+        return self._index
+
+    def _read_ticket_path(self, path: Path) -> Ticket:
+        raw = path.read_text(encoding="utf-8")
+        return Ticket.from_string(raw, fallback_id=path.stem)
+
+    def _read_ticket_headers(self, path: Path) -> Ticket:
+        lines: List[str] = []
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                lines.append(line)
+                if not line.strip():
+                    break
+        return Ticket.from_headers(
+            "".join(lines),
+            fallback_id=path.stem,
+            loader=lambda: self._read_ticket_path(path),
+        )
+
+    def _ticket_from_entry(self, file_id: str, entry: IndexEntry) -> Ticket:
+        path = self._ticket_path(file_id)
+        return LazyTicket(
+            loader=lambda: self._load_ticket(path),
+            ticket_id=entry.ticket_id,
+            subject=entry.subject,
+            assignee=entry.assignee,
+            tags=list(entry.tags),
+            status=entry.status,
+            created_at=entry.created_at,
+            updated_at=entry.updated_at,
+            extra_headers=dict(entry.extra_headers),
+        )
+
     def _resolve_ticket_id(self, ticket_id: str) -> Optional[str]:
         if not ticket_id:
             return None
         if self._ticket_path(ticket_id).exists():
             return ticket_id
-        matches = [candidate for candidate in self.list_ids() if candidate.startswith(ticket_id)]
+        index = self.index()
+        index.sync_ids(self.ticket_dir())
+        matches = index.prefix_matches(ticket_id)
+        if not matches:
+            # A concurrent writer can land inside our directory mtime window; rescan before giving up.
+            index.sync_ids(self.ticket_dir(), force=True)
+            matches = index.prefix_matches(ticket_id)
         if not matches:
             return None
         if len(matches) > 1:
@@ -167,19 +454,61 @@ class TicketStore:
         return matches[0]
 
     def list_ids(self) -> List[str]:
-        directory = self.ticket_dir()
-        if not directory.exists():
-            return []
-        return sorted(path.stem for path in directory.glob("*.tkt"))
+        index = self.index()
+        index.sync_ids(self.ticket_dir())
+        return list(index.ids)
 
-    def list_tickets(self, *, list_name: Optional[str] = None) -> List[Ticket]:
+    def list_tickets(
+        self, *, list_name: Optional[str] = None, query: Optional[TicketQuery] = None
+    ) -> List[Ticket]:
         _ = list_name
-        tickets = []
-        for ticket_id in self.list_ids():
-            ticket = self.get_ticket(ticket_id)
-            if ticket:
-                tickets.append(ticket)
-        return tickets
+        entries = self.index().refresh(
+            self.ticket_dir(),
+            self._read_ticket_headers,
+            journal_dir=self.journal_dir(),
+            journal_updated_at=self._journal_updated_at,
+        )
+        if query is None:
+            return [self._ticket_from_entry(file_id, entry) for file_id, entry in entries]
+
+        tickets = [
+            self._ticket_from_entry(file_id, entry) for file_id, entry in entries if query.matches_headers(entry)
+        ]
+        tickets = sort_items(tickets, query.sort)
+        if query.text:
+            wanted = None if query.limit is None else query.offset + query.limit
+            found: List[Ticket] = []
+            for ticket in tickets:
+                if wanted is not None and len(found) >= wanted:
+                    break
+                if query.matches_text(ticket):
+                    found.append(ticket)
+            tickets = found
+        return query.paginate(tickets)
+
+    def reload_tickets(self, ticket_ids: Iterable[str]) -> Dict[str, Optional[Ticket]]:
+        """Re-index only ``ticket_ids``; a ``None`` value means the ticket file is gone."""
+        entries = self.index().refresh_ids(
+            self.ticket_dir(),
+            ticket_ids,
+            self._read_ticket_headers,
+            journal_dir=self.journal_dir(),
+            journal_updated_at=self._journal_updated_at,
+        )
+        return {
+            file_id: self._ticket_from_entry(file_id, entry) if entry else None
+            for file_id, entry in entries.items()
+        }
+
+    def watch_directories(self) -> List[Tuple[Path, str]]:
+        self.ensure()
+        self.ticket_dir().mkdir(parents=True, exist_ok=True)
+        directories = [(self.ticket_dir(), ".tkt")]
+        if self.journal:
+            self.journal_dir().mkdir(parents=True, exist_ok=True)
+        if self.journal_dir().is_dir():
+            directories.append((self.journal_dir(), ".log"))
+        return directories
 
     def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
         resolved_id = self._resolve_ticket_id(ticket_id)
@@ -188,15 +517,31 @@ class TicketStore:
         path = self._ticket_path(resolved_id)
         if not path.exists():
             return None
-        raw = path.read_text(encoding="utf-8")
-        return Ticket.from_string(raw, fallback_id=resolved_id)
+        return self._load_ticket(path)
+
+    def save_ticket(self, ticket: Ticket, *, expected_updated_at: Optional[str] = None) -> None:
+        with self._ticket_lock(ticket.ticket_id):
+            self._check_updated_at(ticket.ticket_id, expected_updated_at)
+            self._write_ticket_file(ticket)
 
-    def save_ticket(self, ticket: Ticket) -> None:
+    def _write_ticket_file(self, ticket: Ticket, *, keep_journal: bool = False) -> None:
         self.ensure()
         directory = self.ticket_dir()
         directory.mkdir(parents=True, exist_ok=True)
         path = self._ticket_path(ticket.ticket_id)
-        path.write_text(ticket.to_string(), encoding="utf-8")
+        index = self.index()
+        index.sync_ids(directory)
+        dir_mtime_before = directory.stat().st_mtime_ns
+        atomic_write_text(path, ticket.to_string())
+        if not keep_journal:
+            self._discard_journal(ticket.ticket_id)
+        index.add_id(
+            ticket.ticket_id,
+            dir_mtime_before=dir_mtime_before,
+            dir_mtime_after=directory.stat().st_mtime_ns,
+        )
+        index.record(ticket.ticket_id, ticket, path.stat(), self._journal_stat(ticket.ticket_id))
+        self._flush_index()
 
     def create_ticket(
         self,
@@ -222,6 +567,16 @@ class TicketStore:
         self.save_ticket(ticket)
         return ticket
 
+    def create_tickets(self, tickets: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        specs = [create_kwargs(spec) for spec in tickets]
+        with self._batch():
+            return [self.create_ticket(**spec) for spec in specs]
+
+    def update_tickets(self, updates: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        specs = [update_kwargs(spec) for spec in updates]
+        with self._batch():
+            return [self.update_ticket(ticket_id, **fields) for ticket_id, fields in specs]
+
     def edit_ticket(self, ticket_id: str) -> Ticket:
         resolved_id = self._resolve_ticket_id(ticket_id)
         if not resolved_id:
@@ -229,15 +584,26 @@ class TicketStore:
         path = self._ticket_path(resolved_id)
         if not path.exists():
             raise FileNotFoundError(f"Ticket {ticket_id} not found.")
+        original = self.compact_ticket(resolved_id)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".tkt", delete=False, encoding="utf-8") as handle:
+            handle.write(path.read_text(encoding="utf-8"))
+            temp_path = Path(handle.name)
 
         editor = os.environ.get("EDITOR") or "vi"
-        command = shlex.split(editor) + [str(path)]
+        command = shlex.split(editor) + [str(temp_path)]
         subprocess.run(command, check=False)
 
-        raw = path.read_text(encoding="utf-8")
+        raw = temp_path.read_text(encoding="utf-8")
         ticket = Ticket.from_string(raw, fallback_id=resolved_id)
         ticket.updated_at = _utc_now_iso()
-        self.save_ticket(ticket)
+        try:
+            self.save_ticket(ticket, expected_updated_at=original.updated_at)
+        except TicketConflictError as exc:
+            kept = path.with_name(f"{resolved_id}.conflict.{os.getpid()}")
+            shutil.move(str(temp_path), str(kept))
+            raise TicketConflictError(f"{exc} Your edits were kept in {kept}.") from exc
+        temp_path.unlink(missing_ok=True)
         return ticket
 
     def update_ticket(
@@ -251,88 +617,146 @@ class TicketStore:
         append_body: Optional[str] = None,
         comment: Optional[str] = None,
         log_message: Optional[str] = None,
+        expected_updated_at: Optional[str] = None,
     ) -> Ticket:
-        ticket = self.get_ticket(ticket_id)
-        if not ticket:
+        resolved_id = self._resolve_ticket_id(ticket_id)
+        if not resolved_id or not self._ticket_path(resolved_id).exists():
             raise FileNotFoundError(f"Ticket {ticket_id} not found.")
 
-        changes: List[str] = []
+        with self._ticket_lock(resolved_id):
+            self._check_updated_at(resolved_id, expected_updated_at)
+            if self.journal and body is None:
+                return self._update_ticket_journaled(
+                    resolved_id,
+                    subject=subject,
+                    assignee=assignee,
+                    tags=tags,
+                    status=status,
+                    append_body=append_body,
+                    comment=comment,
+                    log_message=log_message,
+                )
+            return self._update_ticket_file(
+                resolved_id,
+                subject=subject,
+                body=body,
+                assignee=assignee,
+                tags=tags,
+                status=status,
+                append_body=append_body,
+                comment=comment,
+                log_message=log_message,
+            )
+
+    def _update_ticket_file(
+        self,
+        ticket_id: str,
+        *,
+        subject: Optional[str],
+        body: Optional[str],
+        assignee: Optional[str],
+        tags: Optional[Iterable[str]],
+        status: Optional[str],
+        append_body: Optional[str],
+        comment: Optional[str],
+        log_message: Optional[str],
+    ) -> Ticket:
+        ticket = self._load_ticket(self._ticket_path(ticket_id))
         now = _utc_now_iso()
-
-        if subject is not None:
-            normalized_subject = subject.strip()
-            if not normalized_subject:
-                raise ValueError("Subject cannot be empty.")
-            if normalized_subject != ticket.subject:
-                changes.append(f"- {now} subject updated")
-                ticket.subject = normalized_subject
-
-        if body is not None:
-            if body != ticket.body:
-                changes.append(f"- {now} body replaced")
-                ticket.body = body
-
-        if assignee is not None:
-            normalized_assignee = _normalize_optional_string(assignee)
-            if normalized_assignee != ticket.assignee:
-                changes.append(f"- {now} assignee updated")
-                ticket.assignee = normalized_assignee
-
-        if tags is not None:
-            normalized_tags = _normalize_tags(tags) or []
-            if normalized_tags != ticket.tags:
-                changes.append(f"- {now} tags updated")
-                ticket.tags = normalized_tags
-
-        if status is not None:
-            normalized_status = _normalize_optional_string(status)
-            normalized_status = _normalize_status(normalized_status)
-            if normalized_status != ticket.status:
-                from_status = ticket.status or "unknown"
-                to_status = normalized_status or "unknown"
-                changes.append(f"- {now} status {from_status} -> {to_status}")
-                ticket.status = normalized_status
-
-        append_body_text = _normalize_optional_string(append_body)
-        if append_body_text:
-            changes.append(f"- {now} body appended")
-            ticket.body = _append_body_block(ticket.body, "Update", append_body_text, now)
-
-        comment_text = _normalize_optional_string(comment)
-        if comment_text:
-            changes.append(f"- {now} comment added")
-            ticket.body = _append_body_block(ticket.body, "Comment", comment_text, now)
-
-        if log_message:
-            changes.append(f"- {now} note: {log_message.strip()}")
+        changes = _apply_ticket_updates(
+            ticket,
+            now,
+            subject=subject,
+            body=body,
+            assignee=assignee,
+            tags=tags,
+            status=status,
+            append_body=append_body,
+            comment=comment,
+            log_message=log_message,
+        )
 
         if changes:
-            documents = _coerce_documents(ticket)
-            if documents:
-                documents[0] = ticket.body
-            else:
-                documents = [ticket.body]
-
-            change_idx, entries = _extract_change_log(documents)
-            entries.extend(changes)
-            change_doc = _format_change_log(entries)
-            if change_idx is None:
-                documents.append(change_doc)
-            else:
-                documents[change_idx] = change_doc
-            _update_documents(ticket, documents)
-
+            _fold_change_log(ticket, changes)
             ticket.updated_at = now
-            self.save_ticket(ticket)
+            self._write_ticket_file(ticket)
 
         return ticket
 
+    def _update_ticket_journaled(
+        self,
+        ticket_id: str,
+        *,
+        subject: Optional[str],
+        assignee: Optional[str],
+        tags: Optional[Iterable[str]],
+        status: Optional[str],
+        append_body: Optional[str],
+        comment: Optional[str],
+        log_message: Optional[str],
+    ) -> Ticket:
+        resolved_id = ticket_id
+        path = self._ticket_path(resolved_id)
+        base = self._read_ticket_path(path)
+        headers = (base.subject, base.assignee, list(base.tags), base.status)
+        now = _utc_now_iso()
+        changes = _apply_ticket_updates(
+            base,
+            now,
+            subject=subject,
+            assignee=assignee,
+            tags=tags,
+            status=status,
+            log_message=log_message,
+        )
+
+        records: List[Dict[str, Any]] = []
+        block_changes: List[str] = []
+        for label, text, change in (("Update", append_body, "body appended"), ("Comment", comment, "comment added")):
+            message = _normalize_optional_string(text)
+            if message:
+                records.append({"kind": "block", "label": label, "message": message, "at": now})
+                block_changes.append(f"- {now} {change}")
+        # The note is always the last change; keep the same ordering as a full rewrite.
+        split = len(changes) - 1 if log_message else len(changes)
+        entries = changes[:split] + block_changes + changes[split:]
+        if not entries:
+            return self._load_ticket(path)
+        records.extend({"kind": "log", "entry": entry, "at": now} for entry in entries)
+
+        journal_stat = self._append_journal(resolved_id, records)
+        base.updated_at = now
+        if (base.subject, base.assignee, list(base.tags), base.status) != headers:
+            self._write_ticket_file(base, keep_journal=True)
+        else:
+            index = self.index()
+            index.record(resolved_id, base, path.stat(), journal_stat)
+            self._flush_index()
+
+        if journal_stat.st_size > _JOURNAL_COMPACT_BYTES:
+            return self.compact_ticket(resolved_id)
+        return LazyTicket(
+            loader=lambda: self._load_ticket(path),
+            ticket_id=base.ticket_id,
+            subject=base.subject,
+            assignee=base.assignee,
+            tags=list(base.tags),
+            status=base.status,
+            created_at=base.created_at,
+            updated_at=now,
+            extra_headers=dict(base.extra_headers),
+        )
+
     def tail_ticket_changelog(self, ticket_id: str, limit: int = 10) -> List[str]:
-        ticket = self.get_ticket(ticket_id)
-        if not ticket:
+        resolved_id = self._resolve_ticket_id(ticket_id)
+        path = self._ticket_path(resolved_id) if resolved_id else None
+        if not resolved_id or path is None or not path.exists():
             raise FileNotFoundError(f"Ticket {ticket_id} not found.")
-        documents = _coerce_documents(ticket)
-        _, entries = _extract_change_log(documents)
         if limit <= 0:
             return []
-        return entries[-limit:]
+        journaled = self._tail_journal(resolved_id, limit)
+        if len(journaled) >= limit:
+            return journaled
+        documents = _coerce_documents(self._read_ticket_path(path))
+        _, entries = _extract_change_log(documents)
+        return (entries + journaled)[-limit:]
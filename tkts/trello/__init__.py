@@ -1,14 +1,19 @@
-from tkts.trello.client import (
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from tkts.trello.errors import (
     TrelloAmbiguousIdError,
     TrelloApiError,
     TrelloAuthError,
-    TrelloClient,
     TrelloConfigError,
-    TrelloCredentials,
     TrelloError,
     TrelloNotFoundError,
 )
 
+if TYPE_CHECKING:
+    from tkts.trello.client import TrelloClient, TrelloCredentials
+
 __all__ = [
     "TrelloAmbiguousIdError",
     "TrelloApiError",
@@ -19,3 +24,12 @@ __all__ = [
     "TrelloError",
     "TrelloNotFoundError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The client pulls in http.client/ssl/urllib; load it only when something actually talks to Trello.
+    if name in {"TrelloClient", "TrelloCredentials"}:
+        from tkts.trello import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar
 
 from tkts.backends import register_backend
+from tkts.bulk import create_kwargs, update_kwargs
+from tkts.locking import atomic_write_text
 from tkts.models import Ticket
+from tkts.query import TicketQuery, apply_query
+from tkts.storage import TicketStore
 from tkts.trello.client import (
     TrelloAmbiguousIdError,
     TrelloClient,
@@ -16,9 +24,17 @@ from tkts.trello.client import (
     TrelloCredentials,
     TrelloNotFoundError,
 )
+from tkts.trello.mirror import CardMirror
 
 
 _ALLOWED_STATUSES = {"todo", "in-progress", "in-review", "blocked", "done"}
+_CARD_FIELDS = "shortLink,name,desc,idList,labels,idMembers,dateLastActivity,url"
+_ACTIONS_PAGE_SIZE = 1000
+_MIRROR_CARD_FIELDS = _CARD_FIELDS + ",closed"
+_BOARD_RESOURCES = ("lists", "labels", "members")
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def _normalize_status(status: Optional[str]) -> Optional[str]:
@@ -53,6 +69,26 @@ def _env_str(name: str, default: Optional[str] = None) -> Optional[str]:
     return value or default
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = _env_str(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise TrelloConfigError(f"{name} must be an integer.") from exc
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = _env_str(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise TrelloConfigError(f"{name} must be a number.") from exc
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -101,34 +137,13 @@ class _BoardCache:
     list_ids_by_name_lc: Dict[str, str]
     labels_by_name_lc: Dict[str, Dict[str, Any]]
     members: List[Dict[str, Any]]
+    from_disk: bool = False
 
-
-class TrelloBackend:
-    def __init__(self, root: Optional[str] = None) -> None:
-        _ = root
-        board_id = _env_str("TRELLO_BOARD_ID")
-        if not board_id:
-            raise TrelloConfigError("Missing Trello board id: `TRELLO_BOARD_ID`.")
-
-        self._board_id = board_id
-        self._include_done = _env_bool("TRELLO_INCLUDE_DONE", False)
-        self._create_missing_labels = _env_bool("TRELLO_CREATE_MISSING_LABELS", False)
-        self._default_status = _normalize_status(_env_str("TRELLO_DEFAULT_STATUS", "todo")) or "todo"
-        self._edit_opens_browser = _env_bool("TRELLO_EDIT_OPENS_BROWSER", False)
-        self._status_to_list = {status: status for status in _ALLOWED_STATUSES}
-        self._status_to_list.update(_parse_status_to_list(_env_str("TRELLO_STATUS_TO_LIST")))
-
-        self._client = TrelloClient(credentials=TrelloCredentials.from_env())
-        self._cache: Optional[_BoardCache] = None
-
-    def _load_cache(self) -> _BoardCache:
-        if self._cache is not None:
-            return self._cache
-
-        lists = self._client.get_board_lists(self._board_id)
+    @classmethod
+    def from_resources(cls, resources: Mapping[str, List[Dict[str, Any]]], *, from_disk: bool = False) -> "_BoardCache":
         lists_by_id: Dict[str, str] = {}
         list_ids_by_name_lc: Dict[str, str] = {}
-        for entry in lists or []:
+        for entry in resources.get("lists") or []:
             list_id = str(entry.get("id") or "")
             name = str(entry.get("name") or "").strip()
             if not list_id or not name:
@@ -136,24 +151,133 @@ class TrelloBackend:
             lists_by_id[list_id] = name
             list_ids_by_name_lc[name.lower()] = list_id
 
-        labels = self._client.get_board_labels(self._board_id)
         labels_by_name_lc: Dict[str, Dict[str, Any]] = {}
-        for label in labels or []:
+        for label in resources.get("labels") or []:
             label_id = str(label.get("id") or "")
             name = str(label.get("name") or "").strip()
             if not label_id or not name:
                 continue
             labels_by_name_lc[name.lower()] = label
 
-        members = self._client.get_board_members(self._board_id) or []
-
-        self._cache = _BoardCache(
+        return cls(
             lists_by_id=lists_by_id,
             list_ids_by_name_lc=list_ids_by_name_lc,
             labels_by_name_lc=labels_by_name_lc,
-            members=members,
+            members=list(resources.get("members") or []),
+            from_disk=from_disk,
         )
-        return self._cache
+
+    def resources(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            "lists": [{"id": list_id, "name": name} for list_id, name in self.lists_by_id.items()],
+            "labels": list(self.labels_by_name_lc.values()),
+            "members": self.members,
+        }
+
+
+class TrelloBackend:
+    def __init__(self, root: Optional[str] = None) -> None:
+        board_id = _env_str("TRELLO_BOARD_ID")
+        if not board_id:
+            raise TrelloConfigError("Missing Trello board id: `TRELLO_BOARD_ID`.")
+
+        self._board_id = board_id
+        self._include_done = _env_bool("TRELLO_INCLUDE_DONE", False)
+        self._create_missing_labels = _env_bool("TRELLO_CREATE_MISSING_LABELS", False)
+        self._default_status = _normalize_status(_env_str("TRELLO_DEFAULT_STATUS", "todo")) or "todo"
+        self._edit_opens_browser = _env_bool("TRELLO_EDIT_OPENS_BROWSER", False)
+        self._bulk_workers = max(1, _env_int("TRELLO_BULK_WORKERS", 4))
+        self._status_to_list = {status: status for status in _ALLOWED_STATUSES}
+        self._status_to_list.update(_parse_status_to_list(_env_str("TRELLO_STATUS_TO_LIST")))
+
+        self._client = TrelloClient(credentials=TrelloCredentials.from_env())
+        self._cache: Optional[_BoardCache] = None
+        self._cache_lock = threading.Lock()
+
+        self._mirror: Optional[CardMirror] = None
+        self._mirror_refresh = max(0.0, _env_float("TRELLO_MIRROR_REFRESH", 5.0))
+        self._mirror_lock = threading.Lock()
+        mirror = _env_bool("TRELLO_MIRROR", False)
+        self._board_cache_ttl = max(0.0, _env_float("TRELLO_BOARD_CACHE_TTL", 300.0))
+        self._board_cache_path: Optional[Path] = None
+        if mirror or self._board_cache_ttl:
+            base = Path(root).expanduser() if root else TicketStore.from_env().root
+            if mirror:
+                self._mirror = CardMirror(base / "trello" / f"{board_id}.sqlite3")
+            if self._board_cache_ttl:
+                self._board_cache_path = base / "trello" / f"{board_id}.board.json"
+
+    def _load_cache(self, *, refresh: bool = False) -> _BoardCache:
+        """Board lists, labels and members: from memory, then from disk within TRELLO_BOARD_CACHE_TTL, then the API.
+
+        A stale or ``refresh``-ed disk copy is revalidated with the ETag / Last-Modified it was stored with,
+        so resources Trello reports as unchanged are not downloaded again.
+        """
+        with self._cache_lock:
+            if self._cache is not None and not refresh:
+                return self._cache
+            stored = self._read_board_cache()
+            if stored and not refresh and time.time() - float(stored.get("fetched_at") or 0) < self._board_cache_ttl:
+                resources = {kind: stored["resources"][kind]["items"] for kind in _BOARD_RESOURCES}
+                self._cache = _BoardCache.from_resources(resources, from_disk=True)
+                return self._cache
+
+            entries: Dict[str, Dict[str, Any]] = {}
+            for kind in _BOARD_RESOURCES:
+                previous = (stored or {}).get("resources", {}).get(kind) or {}
+                items, validators = self._client.get_board_resource(
+                    self._board_id, kind, validators=previous.get("validators")
+                )
+                if items is None:
+                    items = previous.get("items") or []
+                entries[kind] = {"items": items, "validators": validators}
+            self._cache = _BoardCache.from_resources({kind: entry["items"] for kind, entry in entries.items()})
+            self._write_board_cache(entries, fetched_at=time.time())
+            return self._cache
+
+    def _read_board_cache(self) -> Optional[Dict[str, Any]]:
+        if self._board_cache_path is None:
+            return None
+        try:
+            stored = json.loads(self._board_cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        resources = stored.get("resources") if isinstance(stored, dict) else None
+        if not isinstance(resources, dict) or any(not isinstance(resources.get(kind), dict) for kind in _BOARD_RESOURCES):
+            return None
+        return stored
+
+    def _write_board_cache(self, entries: Mapping[str, Dict[str, Any]], *, fetched_at: float) -> None:
+        if self._board_cache_path is None:
+            return
+        payload = {"board_id": self._board_id, "fetched_at": fetched_at, "resources": entries}
+        try:
+            atomic_write_text(self._board_cache_path, json.dumps(payload), fsync=False)
+        except OSError:
+            pass  # the cache is an optimization; an unwritable root just means no reuse across processes
+
+    def _update_board_cache(self, cache: _BoardCache, kind: str) -> None:
+        # Keep the disk copy in step with a change made through this process (e.g. a created label).
+        stored = self._read_board_cache()
+        if not stored:
+            return
+        entries = dict(stored["resources"])
+        entries[kind] = {"items": cache.resources()[kind], "validators": {}}
+        self._write_board_cache(entries, fetched_at=float(stored.get("fetched_at") or 0))
+
+    def _expire_board_cache(self) -> None:
+        with self._cache_lock:
+            self._cache = None
+            stored = self._read_board_cache()
+            if stored:
+                self._write_board_cache(stored["resources"], fetched_at=0.0)
+
+    def _refresh_stale_cache(self, cache: _BoardCache) -> bool:
+        """After a lookup miss, refetch a board cache that came from disk, since it may predate the change."""
+        if not cache.from_disk:
+            return False
+        self._load_cache(refresh=True)
+        return True
 
     def _status_from_list_name(self, list_name: str) -> Optional[str]:
         name_lc = (list_name or "").strip().lower()
@@ -174,6 +298,8 @@ class TrelloBackend:
         desired_name = (self._status_to_list.get(normalized) or normalized).strip().lower()
         list_id = cache.list_ids_by_name_lc.get(desired_name)
         if not list_id:
+            if self._refresh_stale_cache(cache):
+                return self._list_id_for_status(status)
             raise TrelloConfigError(
                 f"Missing Trello list for status '{normalized}' (expected list named '{self._status_to_list.get(normalized) or normalized}')."
             )
@@ -186,6 +312,18 @@ class TrelloBackend:
     def _member_id_for_assignee(self, assignee: str) -> str:
         field = _assignee_field()
         cache = self._load_cache()
+        matches = self._find_members(cache, assignee, field)
+        if not matches and self._refresh_stale_cache(cache):
+            return self._member_id_for_assignee(assignee)
+        if len(matches) == 1:
+            member_id = str(matches[0].get("id") or "")
+            if member_id:
+                return member_id
+        if len(matches) > 1:
+            raise TrelloAmbiguousIdError(f"Assignee '{assignee}' matched multiple Trello members.")
+        raise TrelloConfigError(f"Assignee '{assignee}' not found on Trello board members.")
+
+    def _find_members(self, cache: _BoardCache, assignee: str, field: str) -> List[Dict[str, Any]]:
         needle = assignee.strip().lower()
         matches: list[Dict[str, Any]] = []
         for member in cache.members:
@@ -201,13 +339,7 @@ class TrelloBackend:
                 if candidate and candidate == needle:
                     matches.append(member)
                     break
-        if len(matches) == 1:
-            member_id = str(matches[0].get("id") or "")
-            if member_id:
-                return member_id
-        if len(matches) > 1:
-            raise TrelloAmbiguousIdError(f"Assignee '{assignee}' matched multiple Trello members.")
-        raise TrelloConfigError(f"Assignee '{assignee}' not found on Trello board members.")
+        return matches
 
     def _label_ids_for_tags(self, tags: Optional[Iterable[str]]) -> List[str]:
         if not tags:
@@ -226,12 +358,17 @@ class TrelloBackend:
             label_id = str(label.get("id") or "")
             if label_id:
                 label_ids.append(label_id)
+        if missing:
+            if self._refresh_stale_cache(cache):
+                return self._label_ids_for_tags(tags)
         if missing and self._create_missing_labels:
             for name in missing:
                 label = self._client.create_board_label(self._board_id, name)
                 label_id = str(label.get("id") or "")
                 if label_id:
                     label_ids.append(label_id)
+                    cache.labels_by_name_lc[name.lower()] = label
+            self._update_board_cache(cache, "labels")
             return label_ids
         if missing:
             missing_display = ", ".join(sorted(missing))
@@ -277,22 +414,59 @@ class TrelloBackend:
             extra_headers=extra_headers,
         )
 
-    def list_tickets(self, *, list_name: Optional[str] = None) -> List[Ticket]:
+    def list_tickets(
+        self, *, list_name: Optional[str] = None, query: Optional[TicketQuery] = None
+    ) -> List[Ticket]:
         list_name = list_name or _env_str("TKTS_TRELLO_LIST")
         cache = self._load_cache()
-        cards = self._client.list_board_cards(
-            self._board_id,
-            fields="shortLink,name,desc,idList,labels,idMembers,dateLastActivity,url",
-            filter="open",
-            include_members=True,
-            list_name=list_name,
-        )
-        tickets = [self._ticket_from_card(card, lists_by_id=cache.lists_by_id) for card in cards or []]
-        if list_name:
-            return tickets
-        if self._include_done:
-            return tickets
-        return [ticket for ticket in tickets if ticket.status != "done"]
+        fields = _CARD_FIELDS
+        list_ids = self._list_ids_for_query(query) if not list_name else None
+        if self._mirror is not None:
+            if list_name:
+                list_id = cache.list_ids_by_name_lc.get(list_name.strip().lower())
+                if not list_id:
+                    raise TrelloNotFoundError(f"Trello list '{list_name}' not found on board.")
+                list_ids = [list_id]
+            cards = self._mirrored_cards(list_ids)
+        elif list_ids is not None:
+            cards: List[Dict[str, Any]] = []
+            for list_id in list_ids:
+                cards.extend(
+                    self._client.list_board_cards(
+                        self._board_id,
+                        fields=fields,
+                        filter="open",
+                        include_members=True,
+                        list_id=list_id,
+                    )
+                    or []
+                )
+        else:
+            cards = self._client.list_board_cards(
+                self._board_id,
+                fields=fields,
+                filter="open",
+                include_members=True,
+                list_name=list_name,
+            ) or []
+        tickets = [self._ticket_from_card(card, lists_by_id=cache.lists_by_id) for card in cards]
+        if not list_name and not self._include_done and not (query and query.statuses):
+            tickets = [ticket for ticket in tickets if ticket.status != "done"]
+        return apply_query(tickets, query)
+
+    def _list_ids_for_query(self, query: Optional[TicketQuery]) -> Optional[List[str]]:
+        if not query or not query.statuses or "unknown" in query.statuses:
+            return None
+        cache = self._load_cache()
+        list_ids: List[str] = []
+        for status in query.statuses:
+            if status not in _ALLOWED_STATUSES:
+                continue
+            desired_name = (self._status_to_list.get(status) or status).strip().lower()
+            list_id = cache.list_ids_by_name_lc.get(desired_name)
+            if list_id and list_id not in list_ids:
+                list_ids.append(list_id)
+        return list_ids
 
     def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
         cache = self._load_cache()
@@ -301,6 +475,15 @@ class TrelloBackend:
             return None
         return self._ticket_from_card(card, lists_by_id=cache.lists_by_id)
 
+    def get_tickets(self, ticket_ids: Sequence[str]) -> List[Optional[Ticket]]:
+        """Bulk ``get_ticket``: full card ids go out ten to a /batch request, prefixes share one board read."""
+        cache = self._load_cache()
+        cards = self._resolve_tickets(ticket_ids, missing_ok=True)
+        return [
+            self._ticket_from_card(cards[ticket_id], lists_by_id=cache.lists_by_id) if ticket_id in cards else None
+            for ticket_id in ticket_ids
+        ]
+
     def _resolve_ticket(self, ticket_id: str) -> Optional[Dict[str, Any]]:
         if not ticket_id:
             return None
@@ -308,16 +491,19 @@ class TrelloBackend:
         if not ticket_id:
             return None
 
+        if self._mirror is not None:
+            return self._resolve_mirrored(ticket_id)
+
         if len(ticket_id) >= 8:
             card = self._client.get_card(
                 ticket_id,
-                fields="shortLink,name,desc,idList,labels,idMembers,dateLastActivity,url",
+                fields=_CARD_FIELDS,
             )
             return card
 
         cards = self._client.list_board_cards(
             self._board_id,
-            fields="shortLink,name,desc,idList,labels,idMembers,dateLastActivity,url",
+            fields=_CARD_FIELDS,
             filter="open",
             include_members=True,
         )
@@ -400,7 +586,31 @@ class TrelloBackend:
         card = self._resolve_ticket(ticket_id)
         if not card:
             raise TrelloNotFoundError(f"Ticket {ticket_id} not found.")
+        return self._update_card(
+            card,
+            subject=subject,
+            body=body,
+            assignee=assignee,
+            tags=tags,
+            status=status,
+            append_body=append_body,
+            comment=comment,
+            log_message=log_message,
+        )
 
+    def _update_card(
+        self,
+        card: Dict[str, Any],
+        *,
+        subject: Optional[str] = None,
+        body: Optional[str] = None,
+        assignee: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        append_body: Optional[str] = None,
+        comment: Optional[str] = None,
+        log_message: Optional[str] = None,
+    ) -> Ticket:
         updates: Dict[str, Any] = {}
         if subject is not None:
             updates["name"] = subject
@@ -419,26 +629,204 @@ class TrelloBackend:
             label_ids = self._label_ids_for_tags(tags)
             updates["idLabels"] = ",".join(label_ids)
 
-        if updates:
-            self._client.update_card(str(card.get("id") or ""), fields=updates)
+        card_id = str(card.get("id") or "")
+        comments = [
+            text
+            for text in (
+                f"Append: {append_body}" if append_body else None,
+                comment or None,
+                f"Log: {log_message}" if log_message else None,
+            )
+            if text
+        ]
 
-        if append_body:
-            self._client.add_card_comment(str(card.get("id") or ""), f"Append: {append_body}")
-        if comment:
-            self._client.add_card_comment(str(card.get("id") or ""), comment)
-        if log_message:
-            self._client.add_card_comment(str(card.get("id") or ""), f"Log: {log_message}")
+        def post_comments() -> List[Any]:
+            # Sequential, so Append/comment/Log land on the card in that order.
+            return [self._client.add_card_comment(card_id, text) for text in comments]
 
-        updated = self.get_ticket(ticket_id)
-        if not updated:
-            raise TrelloNotFoundError(f"Ticket {ticket_id} not found.")
-        return updated
+        # Once the card id is known the field update and the comments are independent requests.
+        writes: List[Callable[[], Any]] = [post_comments]
+        if updates:
+            writes.append(lambda: self._client.update_card(card_id, fields=updates))
+        results = self._run_parallel(lambda write: write(), writes)
+
+        updated = dict(card)
+        if updates and isinstance(results[1], dict):
+            updated.update(results[1])
+            if "idMembers" in results[1]:
+                # PUT /cards answers with idMembers, not member objects; take those from the board cache.
+                member_ids = set(updated.get("idMembers") or [])
+                updated["members"] = [member for member in self._load_cache().members if member.get("id") in member_ids]
+        # A comment is card activity too, and it may land after the PUT answered.
+        activity = [str(updated.get("dateLastActivity") or "")]
+        activity.extend(str(action.get("date") or "") for action in results[0] if isinstance(action, dict))
+        if max(activity):
+            updated["dateLastActivity"] = max(activity)
+        if self._mirror is not None:
+            self._mirror.apply([updated], [], cursor=None)
+        return self._ticket_from_card(updated, lists_by_id=self._load_cache().lists_by_id)
+
+    def create_tickets(self, tickets: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        specs = [create_kwargs(spec) for spec in tickets]
+        self._prepare_bulk([spec["tags"] for spec in specs])
+        return self._run_parallel(lambda spec: self.create_ticket(**spec), specs)
+
+    def update_tickets(self, updates: Iterable[Mapping[str, Any]]) -> List[Ticket]:
+        specs = [update_kwargs(spec) for spec in updates]
+        self._prepare_bulk([fields.get("tags") for _, fields in specs])
+        cards = self._resolve_tickets([ticket_id for ticket_id, _ in specs])
+        return self._run_parallel(lambda item: self._update_card(cards[item[0]], **item[1]), specs)
+
+    def _prepare_bulk(self, tag_lists: Sequence[Optional[List[str]]]) -> None:
+        # Load the board once and create any missing labels serially before fanning out.
+        self._load_cache()
+        names: Dict[str, str] = {}
+        for tags in tag_lists:
+            for tag in tags or []:
+                name = (tag or "").strip()
+                if name:
+                    names.setdefault(name.lower(), name)
+        if names:
+            self._label_ids_for_tags(list(names.values()))
+
+    def _resolve_tickets(self, ticket_ids: Sequence[str], *, missing_ok: bool = False) -> Dict[str, Dict[str, Any]]:
+        resolved: Dict[str, Dict[str, Any]] = {}
+        short_ids = sorted({ticket_id for ticket_id in ticket_ids if len(ticket_id.strip()) < 8})
+        if self._mirror is not None:
+            # Prefixes resolve locally, so there is no need to download the board.
+            short_ids = []
+        if short_ids:
+            cards = self._client.list_board_cards(
+                self._board_id,
+                fields=_CARD_FIELDS,
+                filter="open",
+                include_members=True,
+            ) or []
+            for ticket_id in short_ids:
+                prefix = ticket_id.strip()
+                matches = [card for card in cards if str(card.get("shortLink") or "").startswith(prefix)]
+                if len(matches) > 1:
+                    ids = ", ".join(sorted(str(card.get("shortLink") or "") for card in matches))
+                    raise TrelloAmbiguousIdError(f"Ticket id prefix '{prefix}' matched multiple Trello cards: {ids}")
+                if matches:
+                    resolved[ticket_id] = matches[0]
+        long_ids = [ticket_id for ticket_id in dict.fromkeys(ticket_ids) if ticket_id not in short_ids]
+        if self._mirror is not None:
+            found = self._run_parallel(self._resolve_ticket, long_ids)
+        else:
+            found = self._client.get_cards([ticket_id.strip() for ticket_id in long_ids], fields=_CARD_FIELDS)
+        for ticket_id, card in zip(long_ids, found):
+            if card:
+                resolved[ticket_id] = card
+        missing = [ticket_id for ticket_id in ticket_ids if ticket_id not in resolved]
+        if missing and not missing_ok:
+            raise TrelloNotFoundError(f"Ticket(s) not found: {', '.join(missing)}.")
+        return resolved
+
+    def _mirrored_cards(self, list_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        assert self._mirror is not None
+        self._sync_mirror()
+        return self._mirror.cards(list_ids)
+
+    def _resolve_mirrored(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        assert self._mirror is not None
+        self._sync_mirror()
+        card = self._mirror.find(ticket_id)
+        if card is not None:
+            return card
+        matches = self._mirror.match_prefix(ticket_id, limit=20)
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            ids = ", ".join(str(card.get("shortLink") or "") for card in matches)
+            raise TrelloAmbiguousIdError(f"Ticket id prefix '{ticket_id}' matched multiple Trello cards: {ids}")
+        if len(ticket_id) >= 8:
+            # Not mirrored yet (e.g. created since the last sync) or archived: ask the API.
+            card = self._client.get_card(ticket_id, fields=_MIRROR_CARD_FIELDS)
+            if card and not card.get("closed"):
+                self._mirror.apply([card], [], cursor=None)
+            return card
+        return None
+
+    def _sync_mirror(self, *, force: bool = False) -> None:
+        """Bring the mirror up to date from the board's action feed, at most every TRELLO_MIRROR_REFRESH seconds."""
+        mirror = self._mirror
+        assert mirror is not None
+        with self._mirror_lock:
+            if not force and time.time() - mirror.synced_at() < self._mirror_refresh:
+                return
+            cursor = mirror.cursor()
+            changed: Optional[Set[str]] = None
+            if cursor:
+                changed, next_cursor = self.changed_tickets(cursor)
+            if changed is None:
+                # Start the feed before taking the snapshot so nothing in between is missed.
+                _, next_cursor = self.changed_tickets(None)
+                cards = self._client.list_board_cards(
+                    self._board_id, fields=_CARD_FIELDS, filter="open", include_members=True
+                ) or []
+                mirror.replace(cards, next_cursor or _utc_now_iso())
+                return
+            cards, deleted = self._fetch_cards(sorted(changed))
+            mirror.apply(cards, deleted, next_cursor or cursor or _utc_now_iso())
+
+    def _fetch_cards(self, refs: Sequence[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        cards: List[Dict[str, Any]] = []
+        deleted: List[str] = []
+        for ref, card in zip(refs, self._client.get_cards(list(refs), fields=_MIRROR_CARD_FIELDS)):
+            if not card or card.get("closed"):
+                deleted.append(ref)
+            else:
+                cards.append(card)
+        return cards, deleted
+
+    def _run_parallel(self, func: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        workers = min(self._bulk_workers, len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    def changed_tickets(self, cursor: Optional[str]) -> Tuple[Optional[Set[str]], Optional[str]]:
+        """Tickets touched by board actions newer than ``cursor`` (an action id or date), plus the next cursor.
+
+        Without a cursor this only starts the feed. Returns None instead of ids when the feed cannot
+        say exactly what changed: more actions than one page, or board-level changes such as renamed lists.
+        """
+        limit = _ACTIONS_PAGE_SIZE if cursor else 1
+        actions = self._client.list_board_actions(self._board_id, since=cursor, limit=limit) or []
+        if not actions:
+            return set(), cursor or _utc_now_iso()
+        next_cursor = str(actions[0].get("id") or "") or cursor
+        if not cursor:
+            return set(), next_cursor
+        if len(actions) >= limit:
+            return None, next_cursor
+        changed: Set[str] = set()
+        for action in actions:
+            data = action.get("data") or {}
+            card = data.get("card") or {}
+            ticket_id = str(card.get("shortLink") or card.get("id") or "")
+            if not ticket_id:
+                if data.get("list") or data.get("label"):
+                    self._expire_board_cache()
+                    return None, next_cursor
+                continue
+            changed.add(ticket_id)
+        return changed, next_cursor
 
     def tail_ticket_changelog(self, ticket_id: str, limit: int = 10) -> List[str]:
-        card = self._resolve_ticket(ticket_id)
-        if not card:
-            raise TrelloNotFoundError(f"Ticket {ticket_id} not found.")
-        actions = self._client.list_card_actions(str(card.get("id") or ""), limit=limit)
+        ref = (ticket_id or "").strip()
+        if self._mirror is None and len(ref) >= 8:
+            # A full id needs no resolution first: fetch the card and its actions in one /batch request.
+            card, actions = self._client.get_card_with_actions(ref, fields=_CARD_FIELDS, limit=limit)
+            if not card:
+                raise TrelloNotFoundError(f"Ticket {ticket_id} not found.")
+        else:
+            card = self._resolve_ticket(ticket_id)
+            if not card:
+                raise TrelloNotFoundError(f"Ticket {ticket_id} not found.")
+            actions = self._client.list_card_actions(str(card.get("id") or ""), limit=limit)
         lines: List[str] = []
         for action in actions or []:
             text = str(action.get("data", {}).get("text") or "")
@@ -1,39 +1,24 @@
 from __future__ import annotations
 
+import http.client
 import json
 import os
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping, MutableMapping, Optional
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode, urljoin
-from urllib.request import Request, urlopen
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit
 
-
-class TrelloError(RuntimeError):
-    pass
-
-
-class TrelloConfigError(TrelloError):
-    pass
-
-
-class TrelloAuthError(TrelloError):
-    pass
-
-
-class TrelloNotFoundError(TrelloError):
-    pass
-
-
-class TrelloAmbiguousIdError(TrelloError):
-    pass
-
-
-class TrelloApiError(TrelloError):
-    def __init__(self, message: str, *, status: Optional[int] = None) -> None:
-        super().__init__(message)
-        self.status = status
+from tkts.trello.errors import (
+    TrelloAmbiguousIdError,
+    TrelloApiError,
+    TrelloAuthError,
+    TrelloConfigError,
+    TrelloError,
+    TrelloNotFoundError,
+)
+from tkts.trello.pool import ConnectionPool, HttpResponse
+from tkts.trello.ratelimit import DEFAULT_REQUESTS, TokenBucket, backoff_delay, bucket_for, retry_after
 
 
 def _env_bool(name: str, default: bool = False) -> bool:
@@ -64,6 +49,35 @@ def _redact(value: Optional[str]) -> str:
     return f"{value[:2]}…{value[-2:]}"
 
 
+_BATCH_LIMIT = 10
+_BOARD_RESOURCE_FIELDS = {"lists": "id,name", "labels": "name,color", "members": "username,fullName"}
+_MEMBER_PARAMS = {"members": "true", "member_fields": "username,fullName"}
+
+
+def _card_actions_params(limit: int, filter: str) -> Dict[str, Any]:
+    return {"limit": limit, "filter": filter, "memberCreator_fields": "fullName,username"}
+
+
+def _batch_result(entry: Any) -> Any:
+    # /batch answers each route with {"<status>": body}, or an error object carrying statusCode.
+    status: Optional[int] = None
+    body: Any = entry
+    if isinstance(entry, dict) and len(entry) == 1:
+        key = next(iter(entry))
+        if str(key).isdigit():
+            status, body = int(key), entry[key]
+    if status is None and isinstance(entry, dict) and "statusCode" in entry:
+        status = int(entry["statusCode"])
+    if status is None or 200 <= status < 300:
+        return body
+    if status == 404:
+        return None
+    message = f"Trello request failed (status={status}). Check Trello board configuration."
+    if status in {401, 403}:
+        raise TrelloAuthError(message)
+    raise TrelloApiError(message, status=status)
+
+
 @dataclass(frozen=True)
 class TrelloCredentials:
     api_key: str
@@ -97,6 +111,30 @@ class TrelloClient:
         self._max_retries = max(0, int(max_retries))
         default_base = "https://api.trello.com/1"
         self._base_url = (base_url or _env_str("TRELLO_BASE_URL") or default_base).rstrip("/") + "/"
+        self._pools: Dict[Tuple[str, str], ConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+        self._bucket: Optional[TokenBucket] = None
+        rate = _env_str("TRELLO_RATE_LIMIT")
+        try:
+            requests = int(rate) if rate is not None else DEFAULT_REQUESTS
+        except ValueError as exc:
+            raise TrelloConfigError("TRELLO_RATE_LIMIT must be an integer (requests per 10 seconds).") from exc
+        if requests > 0:
+            self._bucket = bucket_for(credentials.api_token, requests)
+
+    def _pool(self, scheme: str, host: str) -> ConnectionPool:
+        with self._pools_lock:
+            pool = self._pools.get((scheme, host))
+            if pool is None:
+                pool = ConnectionPool(scheme, host, timeout_s=self._timeout_s)
+                self._pools[(scheme, host)] = pool
+            return pool
+
+    def close(self) -> None:
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
 
     def _auth_params(self) -> dict[str, str]:
         return {"key": self._credentials.api_key, "token": self._credentials.api_token}
@@ -109,6 +147,24 @@ class TrelloClient:
         params: Optional[Mapping[str, Any]] = None,
         json_body: Optional[Mapping[str, Any]] = None,
     ) -> Any:
+        resp = self._send(method, path, params=params, json_body=json_body)
+        payload = resp.body
+        if not payload:
+            return None
+        content_type = resp.headers.get("Content-Type", "")
+        if "application/json" in content_type:
+            return json.loads(payload.decode("utf-8"))
+        return payload.decode("utf-8", errors="replace")
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        json_body: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> HttpResponse:
         merged: dict[str, Any] = {}
         merged.update(self._auth_params())
         if params:
@@ -119,55 +175,53 @@ class TrelloClient:
             url = f"{url}?{urlencode(merged, doseq=True)}"
 
         body_bytes: Optional[bytes] = None
-        headers = {"Accept": "application/json"}
+        headers = {"Accept": "application/json", **(headers or {})}
         if json_body is not None:
             body_bytes = json.dumps(json_body).encode("utf-8")
             headers["Content-Type"] = "application/json; charset=utf-8"
 
-        request = Request(url, method=method.upper(), data=body_bytes, headers=headers)
+        parts = urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        pool = self._pool(parts.scheme, parts.netloc)
 
-        backoffs = [0.4, 0.9, 1.8]
         attempts = self._max_retries + 1
         last_error: Exception | None = None
         for attempt in range(attempts):
+            if self._bucket is not None:
+                self._bucket.acquire()
             try:
-                with urlopen(request, timeout=self._timeout_s) as resp:
-                    payload = resp.read()
-                    if not payload:
-                        return None
-                    content_type = resp.headers.get("Content-Type", "")
-                    if "application/json" in content_type:
-                        return json.loads(payload.decode("utf-8"))
-                    return payload.decode("utf-8", errors="replace")
-            except HTTPError as exc:
-                status = getattr(exc, "code", None)
-                retryable = status in {429, 500, 502, 503, 504}
-                if retryable and attempt < attempts - 1:
-                    time.sleep(backoffs[min(attempt, len(backoffs) - 1)])
+                resp = pool.request(method.upper(), target, body=body_bytes, headers=headers)
+            except (OSError, http.client.HTTPException) as exc:
+                if attempt < attempts - 1:
+                    time.sleep(backoff_delay(attempt))
                     last_error = exc
                     continue
+                raise TrelloApiError("Trello request failed due to a network error.") from exc
 
-                try:
-                    raw = exc.read().decode("utf-8", errors="replace")
-                except Exception:
-                    raw = ""
-
+            status = resp.status
+            if self._bucket is not None:
+                self._bucket.observe(resp.headers)
+            if status >= 400:
                 safe_context = (
                     f"Trello request failed (status={status}). "
                     "Check `TRELLO_API_KEY`, `TRELLO_API_TOKEN`, and Trello board configuration."
                 )
-                message = safe_context if not raw else safe_context
+                retryable = status in {429, 500, 502, 503, 504}
+                if retryable and attempt < attempts - 1:
+                    delay = retry_after(resp.headers)
+                    if delay is None:
+                        delay = backoff_delay(attempt)
+                    if status == 429 and self._bucket is not None:
+                        self._bucket.pause(delay)  # hold the other threads sharing this token too
+                    time.sleep(delay)
+                    last_error = TrelloApiError(safe_context, status=status)
+                    continue
                 if status in {401, 403}:
-                    raise TrelloAuthError(safe_context) from exc
+                    raise TrelloAuthError(safe_context)
                 if status == 404:
-                    raise TrelloNotFoundError("Trello resource not found.") from exc
-                raise TrelloApiError(message, status=status) from exc
-            except URLError as exc:
-                if attempt < attempts - 1:
-                    time.sleep(backoffs[min(attempt, len(backoffs) - 1)])
-                    last_error = exc
-                    continue
-                raise TrelloApiError("Trello request failed due to a network error.") from exc
+                    raise TrelloNotFoundError("Trello resource not found.")
+                raise TrelloApiError(safe_context, status=status)
+            return resp
 
         if last_error:
             raise TrelloApiError("Trello request failed after retries.") from last_error
@@ -185,16 +239,44 @@ class TrelloClient:
         return self._request("GET", "/members/me/boards", params={"fields": fields, "filter": filter})
 
     def get_board_lists(self, board_id: str) -> list[dict[str, Any]]:
-        return self._request("GET", f"/boards/{board_id}/lists", params={"fields": "id,name"})
+        return self._request("GET", f"/boards/{board_id}/lists", params={"fields": _BOARD_RESOURCE_FIELDS["lists"]})
 
     def get_board_labels(self, board_id: str) -> list[dict[str, Any]]:
-        return self._request("GET", f"/boards/{board_id}/labels", params={"fields": "name,color"})
+        return self._request("GET", f"/boards/{board_id}/labels", params={"fields": _BOARD_RESOURCE_FIELDS["labels"]})
 
     def create_board_label(self, board_id: str, name: str, *, color: str = "green") -> dict[str, Any]:
         return self._request("POST", "/labels", params={"idBoard": board_id, "name": name, "color": color})
 
     def get_board_members(self, board_id: str) -> list[dict[str, Any]]:
-        return self._request("GET", f"/boards/{board_id}/members", params={"fields": "username,fullName"})
+        return self._request("GET", f"/boards/{board_id}/members", params={"fields": _BOARD_RESOURCE_FIELDS["members"]})
+
+    def get_board_resource(
+        self,
+        board_id: str,
+        kind: str,
+        *,
+        validators: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[Optional[list[dict[str, Any]]], Dict[str, str]]:
+        """Conditionally GET a board's ``lists``, ``labels`` or ``members``.
+
+        ``validators`` are the ETag / Last-Modified headers of an earlier response. Returns
+        ``(None, validators)`` when Trello answers 304 Not Modified, else the items and their new validators.
+        """
+        headers: Dict[str, str] = {}
+        if validators and validators.get("ETag"):
+            headers["If-None-Match"] = validators["ETag"]
+        if validators and validators.get("Last-Modified"):
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+        resp = self._send(
+            "GET",
+            f"/boards/{board_id}/{kind}",
+            params={"fields": _BOARD_RESOURCE_FIELDS[kind]},
+            headers=headers,
+        )
+        if resp.status == 304:
+            return None, dict(validators or {})
+        fresh = {name: resp.headers[name] for name in ("ETag", "Last-Modified") if resp.headers.get(name)}
+        return json.loads(resp.body.decode("utf-8") or "[]"), fresh
 
     def list_board_cards(
         self,
@@ -241,11 +323,27 @@ class TrelloClient:
         return list_id
 
     def get_card(self, card_id: str, *, fields: str) -> dict[str, Any]:
-        return self._request(
-            "GET",
-            f"/cards/{card_id}",
-            params={"fields": fields, "members": "true", "member_fields": "username,fullName"},
-        )
+        return self._request("GET", f"/cards/{card_id}", params={"fields": fields, **_MEMBER_PARAMS})
+
+    def batch_get(self, routes: Sequence[str]) -> List[Any]:
+        """GET several routes (e.g. ``/cards/abc?fields=name``) through /batch, ten per request.
+
+        Results come back in order; a route that 404s yields None.
+        """
+        results: List[Any] = []
+        for start in range(0, len(routes), _BATCH_LIMIT):
+            chunk = routes[start : start + _BATCH_LIMIT]
+            # Routes arrive already encoded; commas separate them, so only a literal comma still needs escaping.
+            urls = ",".join(route.replace(",", "%2C") for route in chunk)
+            response = self._request("GET", "/batch", params={"urls": urls}) or []
+            if len(response) != len(chunk):
+                raise TrelloApiError("Trello batch response did not match the request.")
+            results.extend(_batch_result(entry) for entry in response)
+        return results
+
+    def get_cards(self, card_ids: Sequence[str], *, fields: str) -> List[Optional[dict[str, Any]]]:
+        query = urlencode({"fields": fields, **_MEMBER_PARAMS})
+        return self.batch_get([f"/cards/{card_id}?{query}" for card_id in card_ids])
 
     def create_card(
         self,
@@ -269,6 +367,20 @@ class TrelloClient:
     def add_card_comment(self, card_id: str, text: str) -> dict[str, Any]:
         return self._request("POST", f"/cards/{card_id}/actions/comments", params={"text": text})
 
+    def list_board_actions(
+        self,
+        board_id: str,
+        *,
+        since: Optional[str] = None,
+        limit: int = 1000,
+        filter: str = "all",
+    ) -> list[dict[str, Any]]:
+        return self._request(
+            "GET",
+            f"/boards/{board_id}/actions",
+            params={"since": since, "limit": limit, "filter": filter, "fields": "id,type,date,data"},
+        )
+
     def list_card_actions(
         self,
         card_id: str,
@@ -276,8 +388,17 @@ class TrelloClient:
         limit: int = 50,
         filter: str = "commentCard",
     ) -> list[dict[str, Any]]:
-        return self._request(
-            "GET",
-            f"/cards/{card_id}/actions",
-            params={"limit": limit, "filter": filter, "memberCreator_fields": "fullName,username"},
-        )
+        return self._request("GET", f"/cards/{card_id}/actions", params=_card_actions_params(limit, filter))
+
+    def get_card_with_actions(
+        self,
+        card_id: str,
+        *,
+        fields: str,
+        limit: int = 50,
+        filter: str = "commentCard",
+    ) -> Tuple[Optional[dict[str, Any]], list[dict[str, Any]]]:
+        card_query = urlencode({"fields": fields, **_MEMBER_PARAMS})
+        actions_query = urlencode(_card_actions_params(limit, filter))
+        card, actions = self.batch_get([f"/cards/{card_id}?{card_query}", f"/cards/{card_id}/actions?{actions_query}"])
+        return card, actions or []
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Optional
+
+
+class TrelloError(RuntimeError):
+    pass
+
+
+class TrelloConfigError(TrelloError):
+    pass
+
+
+class TrelloAuthError(TrelloError):
+    pass
+
+
+class TrelloNotFoundError(TrelloError):
+    pass
+
+
+class TrelloAmbiguousIdError(TrelloError):
+    pass
+
+
+class TrelloApiError(TrelloError):
+    def __init__(self, message: str, *, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    short_link TEXT PRIMARY KEY,
+    card_id TEXT NOT NULL UNIQUE,
+    id_list TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cards_list ON cards(id_list);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class CardMirror:
+    """Open cards of one board in a local SQLite file, plus the action-feed cursor they are current to."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def cursor(self) -> Optional[str]:
+        with self._lock:
+            return self._meta("cursor")
+
+    def synced_at(self) -> float:
+        with self._lock:
+            return float(self._meta("synced_at") or 0.0)
+
+    def _upsert(self, conn: sqlite3.Connection, cards: Iterable[Dict[str, Any]]) -> None:
+        for card in cards:
+            short_link = str(card.get("shortLink") or "")
+            card_id = str(card.get("id") or "")
+            if not short_link or not card_id:
+                continue
+            conn.execute("DELETE FROM cards WHERE card_id = ? AND short_link != ?", (card_id, short_link))
+            conn.execute(
+                "INSERT OR REPLACE INTO cards (short_link, card_id, id_list, data) VALUES (?, ?, ?, ?)",
+                (short_link, card_id, str(card.get("idList") or ""), json.dumps(card)),
+            )
+
+    def _commit(
+        self,
+        *,
+        cards: Sequence[Dict[str, Any]] = (),
+        deleted: Sequence[str] = (),
+        cursor: Optional[str] = None,
+        replace: bool = False,
+    ) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if replace:
+                    conn.execute("DELETE FROM cards")
+                for ref in deleted:
+                    conn.execute("DELETE FROM cards WHERE short_link = ? OR card_id = ?", (ref, ref))
+                self._upsert(conn, cards)
+                if cursor is not None:
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('cursor', ?)", (cursor,))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_at', ?)", (repr(time.time()),)
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def replace(self, cards: Sequence[Dict[str, Any]], cursor: str) -> None:
+        self._commit(cards=cards, cursor=cursor, replace=True)
+
+    def apply(self, cards: Sequence[Dict[str, Any]], deleted: Sequence[str], cursor: Optional[str]) -> None:
+        self._commit(cards=cards, deleted=deleted, cursor=cursor)
+
+    def cards(self, list_ids: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        where = ""
+        params: Sequence[str] = ()
+        if list_ids is not None:
+            if not list_ids:
+                return []
+            where = f"WHERE id_list IN ({','.join('?' for _ in list_ids)})"
+            params = list(list_ids)
+        with self._lock:
+            rows = self._connect().execute(f"SELECT data FROM cards {where} ORDER BY short_link", tuple(params)).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def find(self, ref: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT data FROM cards WHERE short_link = ? OR card_id = ?", (ref, ref)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def match_prefix(self, prefix: str, limit: int = 2) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT data FROM cards WHERE short_link >= ? AND short_link < ? ORDER BY short_link LIMIT ?",
+                (prefix, _prefix_upper_bound(prefix), limit),
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import http.client
+import threading
+from dataclasses import dataclass
+from email.message import Message
+from typing import List, Mapping, Optional, Tuple
+
+
+# Errors that mean a pooled keep-alive connection was closed by the server while idle.
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: Message
+    body: bytes
+
+
+class ConnectionPool:
+    """Keep-alive connections to one host, shared across threads."""
+
+    def __init__(self, scheme: str, host: str, *, timeout_s: float, max_idle: int = 8) -> None:
+        self._connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self._host = host
+        self._timeout_s = timeout_s
+        self._max_idle = max(1, max_idle)
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _acquire(self, fresh: bool) -> Tuple[http.client.HTTPConnection, bool]:
+        if not fresh:
+            with self._lock:
+                if self._idle:
+                    return self._idle.pop(), True
+        with self._lock:
+            self.connections_opened += 1
+        return self._connection_class(self._host, timeout=self._timeout_s), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        target: str,
+        *,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> HttpResponse:
+        fresh = False
+        while True:
+            conn, reused = self._acquire(fresh)
+            try:
+                conn.request(method, target, body=body, headers=dict(headers or {}))
+                resp = conn.getresponse()
+                payload = resp.read()
+            except _STALE_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                fresh = True  # the server dropped an idle connection; retry once on a new one
+                continue
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return HttpResponse(status=resp.status, headers=resp.headers, body=payload)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Mapping, Optional
+
+
+# Trello allows 100 requests per 10 seconds per token (and 300 per key); stay just under it.
+DEFAULT_REQUESTS = 95
+DEFAULT_INTERVAL_S = 10.0
+BACKOFF_BASE_S = 0.5
+BACKOFF_CAP_S = 30.0
+
+
+class TokenBucket:
+    """Blocking token bucket shared by every thread that talks to Trello with one token."""
+
+    def __init__(
+        self,
+        requests: float = DEFAULT_REQUESTS,
+        interval_s: float = DEFAULT_INTERVAL_S,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.capacity = float(requests)
+        self.rate = float(requests) / interval_s
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds`` (e.g. after a 429) and restart from an empty bucket."""
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = max(now, self._paused_until)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Trim the bucket to what Trello says is left in the current window."""
+        remaining = _header_number(headers, "x-rate-limit-api-token-remaining")
+        if remaining is None:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, remaining)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(key: str, requests: float = DEFAULT_REQUESTS, interval_s: float = DEFAULT_INTERVAL_S) -> TokenBucket:
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(requests, interval_s)
+            _buckets[key] = bucket
+        return bucket
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    raw = headers.get(name)
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    raw = (headers.get("Retry-After") or "").strip()
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * (2**attempt)))
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _ticket_id(name: str, suffix: str) -> Optional[str]:
+    if name.startswith(".") or not name.endswith(suffix):
+        return None
+    return name[: -len(suffix)]
+
+
+class MtimeWatcher:
+    """Portable fallback: diff (mtime, size) snapshots of the watched directories."""
+
+    def __init__(self, directories: Sequence[Tuple[Path, str]]) -> None:
+        self.directories = list(directories)
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        snapshot: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        for directory, suffix in self.directories:
+            try:
+                it = os.scandir(directory)
+            except FileNotFoundError:
+                continue
+            with it:
+                for dirent in it:
+                    ticket_id = _ticket_id(dirent.name, suffix)
+                    if ticket_id is None:
+                        continue
+                    try:
+                        stat = dirent.stat()
+                    except FileNotFoundError:
+                        continue
+                    snapshot[(suffix, ticket_id)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self) -> Optional[Set[str]]:
+        current = self._scan()
+        previous = self._snapshot
+        self._snapshot = current
+        changed = {key for key, value in current.items() if previous.get(key) != value}
+        changed.update(key for key in previous if key not in current)
+        return {ticket_id for _, ticket_id in changed}
+
+    def close(self) -> None:
+        return None
+
+
+class InotifyWatcher:
+    """Linux inotify watcher over the ticket (and journal) directories."""
+
+    def __init__(self, directories: Sequence[Tuple[Path, str]]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._suffixes: Dict[int, str] = {}
+        try:
+            for directory, suffix in directories:
+                wd = libc.inotify_add_watch(fd, os.fsencode(str(directory)), _WATCH_MASK)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+                self._suffixes[wd] = suffix
+        except OSError:
+            os.close(fd)
+            raise
+
+    def poll(self) -> Optional[Set[str]]:
+        changed: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & (_IN_Q_OVERFLOW | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+                    # Lost events or the directory itself went away: caller must rescan.
+                    return None
+                suffix = self._suffixes.get(wd)
+                ticket_id = _ticket_id(os.fsdecode(raw_name), suffix) if suffix else None
+                if ticket_id:
+                    changed.add(ticket_id)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+Watcher = Union[InotifyWatcher, MtimeWatcher]
+
+
+def watch_directories(directories: Sequence[Tuple[Path, str]]) -> Watcher:
+    """Watch ``(directory, suffix)`` pairs; ``poll()`` returns changed ticket ids, or None to rescan all."""
+    existing: List[Tuple[Path, str]] = [(directory, suffix) for directory, suffix in directories if directory.is_dir()]
+    if sys.platform.startswith("linux") and len(existing) == len(directories):
+        try:
+            return InotifyWatcher(existing)
+        except (OSError, AttributeError):
+            pass
+    return MtimeWatcher(directories)